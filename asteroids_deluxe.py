@@ -1,25 +1,70 @@
 import pygame
+import numpy as np
 import random
 import math
 import json
 import os
-
-# Initialize pygame
-pygame.init()
-pygame.mixer.init()
+import time
+import argparse
+import functools
+import hashlib
+import io
+import queue
+import threading
+from array import array
+from collections import OrderedDict, deque
 
 # Screen settings
 WIDTH, HEIGHT = 1200, 900  # Increased by 150%
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Asteroids Deluxe")
-clock = pygame.time.Clock()
+
+# Window and frame clock - created by init(), so importing the module has no side effects
+screen = None
+clock = None
 
 # Fullscreen state
 fullscreen = False
 
+# ============================================================================
+# RANDOM NUMBER STREAMS
+# ============================================================================
+# Gameplay (spawns, splits, drops, AI inaccuracy) and cosmetics (particles,
+# asteroid shapes, craters, stars, sound variety) use separate generators,
+# so visual effects can never shift the gameplay sequence.
+sim_random = random.Random()
+sim_np_random = np.random.default_rng()  # Vectorized gameplay (asteroid field batches)
+fx_random = random.Random()
+fx_np_random = np.random.default_rng()  # Vectorized cosmetics (particle batches)
+
+
+def seed_random(seed):
+    """Seed both streams from a single --seed value (None = fresh entropy)"""
+    sim_random.seed(seed)
+    sim_np_random.bit_generator.state = np.random.PCG64(sim_random.getrandbits(128)).state
+    fx_random.seed(None if seed is None else f'{seed}:fx')
+    fx_np_random.bit_generator.state = np.random.PCG64(fx_random.getrandbits(128)).state
+
+
 # Color Schemes - Matrix terminal vibes
+SCHEME_ROLES = ('bg', 'primary', 'secondary', 'accent', 'dim', 'bright')
+# Every factor draw code scales a scheme color by (see ColorScheme.shades)
+SHADE_FACTORS = (0.2, 0.25, 0.3, 0.4, 0.5, 0.6, 0.7, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 2.0)
+STAR_TINTS = (
+    (1.0, 1.0, 1.0),      # White
+    (1.0, 0.9, 0.8),      # Warm white
+    (0.8, 0.9, 1.0),      # Cool white/blue
+    (1.0, 1.0, 0.9),      # Slightly yellow
+)
+STAR_SHADE_LEVELS = 64  # Twinkle brightness steps in the star color tables
+
+
+@functools.lru_cache(maxsize=4096)
+def shade(color, factor):
+    """color scaled by factor and clamped to 255, memoized so draw code never rebuilds it"""
+    return tuple(min(255, int(c * factor)) for c in color)
+
+
 class ColorScheme:
-    """Different terminal color schemes"""
+    """Different terminal color schemes, with their shade tables compiled up front"""
     def __init__(self, name, bg, primary, secondary, accent, dim, bright):
         self.name = name
         self.bg = bg              # Background
@@ -28,6 +73,54 @@ class ColorScheme:
         self.accent = accent      # Highlights (bullets, explosions)
         self.dim = dim           # Dimmed text/UI
         self.bright = bright     # Bright highlights
+        self.compile()
+
+    def compile(self):
+        """Build the tables draw code reads instead of doing color math per call.
+
+        shades[role, factor] is a role color scaled by a SHADE_FACTORS entry.
+        star_colors[far][tint][level] is a star's color at a brightness of
+        level / STAR_SHADE_LEVELS (far stars are tinted from dim, the others
+        from primary) and star_glints[tint][level] the 1.5x core of near
+        stars; star_color_array is star_colors as a uint8 array for
+        vectorized lookups. palette backs the indexed sprites' PALETTE_* slots.
+        """
+        self.shades = {(role, factor): shade(getattr(self, role), factor)
+                       for role in SCHEME_ROLES for factor in SHADE_FACTORS}
+        levels = [level / STAR_SHADE_LEVELS for level in range(STAR_SHADE_LEVELS + 1)]
+        self.star_colors = [[[tuple(int(c * brightness * tint) for c, tint in zip(base, tints))
+                              for brightness in levels] for tints in STAR_TINTS]
+                            for base in (self.primary, self.dim)]
+        self.star_color_array = np.array(self.star_colors, np.uint8)
+        self.star_glints = [[tuple(min(255, int(c * brightness * 1.5 * tint))
+                                   for c, tint in zip(self.primary, tints))
+                             for brightness in levels] for tints in STAR_TINTS]
+
+        colors = [self.bg]  # PALETTE_TRANSPARENT (the colorkey, never shown)
+        colors += [shade(self.secondary, factor) for factor in SECONDARY_RAMP]
+        colors.append(self.bright)
+        colors += BOSS_PHASE_COLORS
+        self.palette = colors + [(0, 0, 0)] * (256 - len(colors))
+
+
+# Indexed sprites are baked once as palette slots; a scheme only supplies the
+# colors behind them, so they survive cycle_color_scheme.
+SECONDARY_RAMP = (0.3, 0.5, 1.0, 1.2, 1.4)  # Asteroid shading, darkest to brightest
+PALETTE_TRANSPARENT = 0
+PALETTE_SECONDARY = 1  # First of len(SECONDARY_RAMP) slots
+PALETTE_BRIGHT = PALETTE_SECONDARY + len(SECONDARY_RAMP)
+PALETTE_BOSS = PALETTE_BRIGHT + 1  # One slot per boss phase (same colors in every scheme)
+BOSS_PHASE_COLORS = [
+    (255, 100, 100),  # Phase 1: Red
+    (255, 150, 0),    # Phase 2: Orange
+    (255, 50, 255)    # Phase 3: Purple
+]
+
+
+def secondary_shade(shade):
+    """Palette slot of secondary scaled by one of the SECONDARY_RAMP factors"""
+    return PALETTE_SECONDARY + SECONDARY_RAMP.index(shade)
+
         
 # Available color schemes
 SCHEMES = [
@@ -43,6 +136,224 @@ SCHEMES = [
 current_scheme_index = 0  # Starts with CLASSIC (index 0)
 current_scheme = SCHEMES[current_scheme_index]
 
+# ============================================================================
+# SPRITE CACHE - Pre-rendered sprites reused across frames
+# ============================================================================
+sprite_caches = []  # Every SpriteCache, flushed together when the color scheme changes
+
+
+def surface_bytes(surf):
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+class SpriteCache:
+    """Bounded LRU cache of pre-rendered surfaces, with hit/miss counters.
+
+    Bound it by entry count, by pixel memory, or both.
+    """
+    scheme_independent = False  # Kept by flush_sprite_caches
+
+    def __init__(self, name, max_entries=None, max_bytes=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        sprite_caches.append(self)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, build, *args):
+        """Cached sprite for key, rendering it with build(*args) on a miss"""
+        entries = self.entries
+        sprite = entries.get(key)
+        if sprite is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = entries[key] = build(*args)
+        self.bytes += surface_bytes(sprite)
+        while len(entries) > 1 and self._over_budget():
+            evicted_key, evicted = entries.popitem(last=False)  # Least recently used
+            self.bytes -= surface_bytes(evicted)
+            self._evicted(evicted_key)
+        return sprite
+
+    def get_many(self, keys, build):
+        """Cached sprites for a list of key tuples, rendering misses with build(*key).
+
+        Hits are fetched in one pass without refreshing their LRU position,
+        so only use it on a cache sized for its whole working set.
+        """
+        sprites = list(map(self.entries.get, keys))
+        missing = [i for i, sprite in enumerate(sprites) if sprite is None] if None in sprites else ()
+        self.hits += len(keys) - len(missing)
+        for i in missing:
+            sprites[i] = self.get(keys[i], build, *keys[i])
+        return sprites
+
+    def _evicted(self, key):
+        """Hook for subclasses that track per-entry state alongside the sprite"""
+
+    def _over_budget(self):
+        return ((self.max_entries is not None and len(self.entries) > self.max_entries) or
+                (self.max_bytes is not None and self.bytes > self.max_bytes))
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'entries': len(self.entries), 'bytes': self.bytes, 'hits': self.hits,
+                'misses': self.misses, 'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
+def sprite_bakes():
+    """Sprites rendered so far: the misses of every SpriteCache"""
+    return sum(cache.misses for cache in sprite_caches)
+
+
+def flush_sprite_caches():
+    """Drop every cached sprite rendered in the old scheme's colors"""
+    for cache in sprite_caches:
+        if not cache.scheme_independent:
+            cache.clear()
+
+
+indexed_sprites = True  # False (--no-palette) bakes indexed art to 32-bit and rebakes it per scheme
+
+
+class IndexedSpriteCache(SpriteCache):
+    """SpriteCache of 8-bit palette sprites (see ColorScheme.palette).
+
+    A scheme change does not flush it: each sprite gets the new palette the
+    first time it is looked up afterwards, so pressing C costs one
+    set_palette per sprite actually drawn instead of a rebake of them all.
+    """
+    def __init__(self, name, max_entries=None, max_bytes=None):
+        super().__init__(name, max_entries, max_bytes)
+        self.schemes = {}  # Key -> scheme whose palette that sprite carries
+
+    @property
+    def scheme_independent(self):
+        return indexed_sprites
+
+    def get(self, key, build, *args):
+        sprite = super().get(key, build, *args)
+        if indexed_sprites and self.schemes.get(key) is not current_scheme:
+            sprite.set_palette(current_scheme.palette)
+            self.schemes[key] = current_scheme
+        return sprite
+
+    def _evicted(self, key):
+        self.schemes.pop(key, None)
+
+    def clear(self):
+        super().clear()
+        self.schemes.clear()
+
+
+def prepare_sprite(surf):
+    """Convert to the display's pixel format for fast blits (skipped when headless)"""
+    if pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
+
+
+def indexed_surface(width, height):
+    """Blank 8-bit sprite in the current palette; PALETTE_TRANSPARENT is the colorkey"""
+    surf = pygame.Surface((width, height), 0, 8)
+    surf.set_palette(current_scheme.palette)
+    surf.set_colorkey(PALETTE_TRANSPARENT)
+    surf.fill(PALETTE_TRANSPARENT)
+    return surf
+
+
+def prepare_indexed_sprite(surf):
+    """Keep an indexed sprite 8-bit (colorkey blits are cheap), or convert it with --no-palette"""
+    return surf if indexed_sprites else prepare_sprite(surf)
+
+
+GLOW_ALPHA_STEP = 8  # Fading sprites share entries per alpha bucket
+GLOW_COLOR_STEP = 8  # Twinkling star halos share entries per color bucket
+
+
+def bucket(value, step):
+    """Round a 0-255 channel to the nearest multiple of step (255 stays 255)"""
+    return min(255, (value + step // 2) // step * step)
+
+
+def render_circle_sprite(radius, color, alpha, width=0):
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius, width)
+    return prepare_sprite(surf)
+
+
+glow_sprites = SpriteCache('glow', 1024)
+
+
+def glow_sprite(radius, color, alpha, width=0):
+    """Cached translucent circle (ring when width > 0), keyed by (radius, color, alpha bucket, width)"""
+    alpha = bucket(alpha, GLOW_ALPHA_STEP)
+    return glow_sprites.get((radius, color, alpha, width), render_circle_sprite, radius, color, alpha, width)
+
+
+# ============================================================================
+# RENDER QUEUE - Sprite blits batched into one Surface.blits call per layer
+# ============================================================================
+# Layers in paint order; within a layer commands keep the order they were
+# queued in. Grouping them by sprite was measured and dropped: the software
+# blitter gains more from walking the screen in the order particles were
+# emitted than from reusing a source, and the sort itself cost a few ms at
+# 10k particles.
+LAYER_PARTICLES = 0
+LAYER_ASTEROIDS = 1
+LAYER_ENEMIES = 2
+LAYER_BULLET_GLOW = 3
+LAYER_BULLETS = 4
+LAYER_PICKUPS = 5
+LAYER_SHIP = 6
+RENDER_LAYERS = 7
+
+
+class RenderQueue:
+    """Blit commands collected while the world draws, submitted once per frame.
+
+    Commands are the tuples Surface.blits takes: (sprite, position), or
+    (sprite, position, None, blend flags) for blended ones. commands is the
+    number submitted by the last frame.
+    """
+    def __init__(self):
+        self.layers = [[] for _ in range(RENDER_LAYERS)]
+        self.commands = 0
+
+    def blit(self, layer, sprite, pos, flags=0):
+        self.layers[layer].append((sprite, pos, None, flags) if flags else (sprite, pos))
+
+    def blit_centered(self, layer, sprite, x, y):
+        """Queue a sprite whose center is its anchor point"""
+        self.layers[layer].append((sprite, (int(x) - sprite.get_width() // 2,
+                                            int(y) - sprite.get_height() // 2)))
+
+    def submit(self, screen):
+        """Paint every layer in order, one blits call each, and empty the queue"""
+        count = 0
+        for commands in self.layers:
+            if not commands:
+                continue
+            screen.blits(commands, doreturn=False)
+            count += len(commands)
+            commands.clear()
+        self.commands = count
+
+
+render_queue = RenderQueue()
+
 # ============================================================================
 # 16-BIT GRAPHICS HELPER FUNCTIONS
 # ============================================================================
@@ -50,10 +361,10 @@ current_scheme = SCHEMES[current_scheme_index]
 def draw_gradient_polygon(screen, points, base_color, light_direction=(-0.5, -0.7)):
     """Draw polygon with 3D shading based on edge normals"""
     # Create color variations
-    dark_color = tuple(int(c * 0.3) for c in base_color)
-    mid_color = tuple(int(c * 0.6) for c in base_color)
-    light_color = tuple(min(255, int(c * 1.2)) for c in base_color)
-    bright_color = tuple(min(255, int(c * 1.6)) for c in base_color)
+    dark_color = shade(base_color, 0.3)
+    mid_color = shade(base_color, 0.6)
+    light_color = shade(base_color, 1.2)
+    bright_color = shade(base_color, 1.6)
     
     # Fill with dark base
     pygame.draw.polygon(screen, dark_color, points, 0)
@@ -91,39 +402,81 @@ def draw_gradient_polygon(screen, points, base_color, light_direction=(-0.5, -0.
     pygame.draw.polygon(screen, base_color, points, 2)
 
 
-def draw_glow_circle(screen, pos, radius, color, intensity=1.0):
-    """Draw a circle with outer glow for 16-bit style effect - OPTIMIZED"""
-    x, y = int(pos[0]), int(pos[1])
-    
-    # Reduced to 2 layers for performance (was 4)
+@functools.lru_cache(maxsize=1024)
+def glow_bucket_color(color):
+    """color with each channel bucketed, so nearby halo colors share glow sprites"""
+    return tuple(bucket(c, GLOW_COLOR_STEP) for c in color)
+
+
+def glow_halo_commands(x, y, radius, color, intensity):
+    """Blit commands for the halo layers around a glow circle at integer x, y"""
+    # Reduced to 2 layers for performance (was 4) - halos come from the sprite cache
+    glow_color = glow_bucket_color(color)
+    commands = []
     for i in range(2, 0, -1):
         glow_radius = radius + i * 4
         alpha = int(60 * intensity * (i / 2))
-        glow_color = (*color, alpha)
-        
-        surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, glow_color, (glow_radius, glow_radius), glow_radius)
-        screen.blit(surf, (x - glow_radius, y - glow_radius))
+        commands.append((glow_sprite(glow_radius, glow_color, alpha), (x - glow_radius, y - glow_radius)))
+    return commands
+
+
+def draw_glow_circle(screen, pos, radius, color, intensity=1.0):
+    """Draw a circle with outer glow for 16-bit style effect - OPTIMIZED"""
+    x, y = int(pos[0]), int(pos[1])
+    screen.blits(glow_halo_commands(x, y, radius, color, intensity), doreturn=False)
     
     # Draw solid core
     pygame.draw.circle(screen, color, (x, y), radius)
     
     # Add bright highlight for 3D sphere effect (only if radius > 2)
     if radius > 2:
-        highlight_color = tuple(min(255, int(c * 1.8)) for c in color)
+        highlight_color = shade(color, 1.8)
         highlight_radius = max(1, radius // 3)
         pygame.draw.circle(screen, highlight_color, 
                           (x - radius//3, y - radius//3), 
                           highlight_radius)
 
 
+def render_disc_sprite(radius, color, core_radius, core_color, core_offset):
+    half = radius + 1
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (half, half), radius)
+    if core_radius:
+        pygame.draw.circle(surf, core_color, (half - core_offset, half - core_offset), core_radius)
+    return prepare_sprite(surf)
+
+
+disc_sprites = SpriteCache('disc', max_entries=256)
+
+
+def disc_sprite(radius, color, core_radius=0, core_color=None, core_offset=0):
+    """Cached solid circle, optionally with a smaller circle core_offset up-left of center.
+
+    The sprite is 2 * (radius + 1) wide: blit it at (x - radius - 1, y - radius - 1).
+    """
+    return disc_sprites.get((radius, color, core_radius, core_color, core_offset), render_disc_sprite,
+                            radius, color, core_radius, core_color, core_offset)
+
+
+def queue_glow_circle(commands, glow_layer, layer, pos, radius, color, intensity=1.0):
+    """draw_glow_circle through the RenderQueue commands: halos on glow_layer, the core on layer"""
+    x, y = int(pos[0]), int(pos[1])
+    commands.layers[glow_layer].extend(glow_halo_commands(x, y, radius, color, intensity))
+    if radius > 2:
+        highlight_color = shade(color, 1.8)
+        sprite = disc_sprite(radius, color, max(1, radius // 3), highlight_color, radius // 3)
+    else:
+        sprite = disc_sprite(radius, color)
+    commands.blit(layer, sprite, (x - radius - 1, y - radius - 1))
+
+
 def draw_gradient_rect(screen, rect, base_color, gradient_direction='vertical'):
     """Draw rectangle with gradient fill"""
     x, y, w, h = rect
     
     # Create gradient colors
-    top_color = tuple(min(255, int(c * 1.3)) for c in base_color)
-    bottom_color = tuple(int(c * 0.5) for c in base_color)
+    top_color = shade(base_color, 1.3)
+    bottom_color = shade(base_color, 0.5)
     
     if gradient_direction == 'vertical':
         for i in range(h):
@@ -146,9 +499,9 @@ def draw_metallic_surface(screen, points, base_color, light_pos):
     center_y = sum(p[1] for p in points) / len(points)
     
     # Base colors
-    dark_color = tuple(int(c * 0.2) for c in base_color)
-    mid_color = tuple(int(c * 0.6) for c in base_color)
-    bright_color = tuple(min(255, int(c * 1.5)) for c in base_color)
+    dark_color = shade(base_color, 0.2)
+    mid_color = shade(base_color, 0.6)
+    bright_color = shade(base_color, 1.5)
     
     # Fill base
     pygame.draw.polygon(screen, mid_color, points, 0)
@@ -179,11 +532,11 @@ def draw_energy_beam(screen, start_pos, end_pos, color, width=3, glow_intensity=
         screen.blit(surf, (0, 0))
     
     # Core beam
-    bright_color = tuple(min(255, int(c * 1.5)) for c in color)
+    bright_color = shade(color, 1.5)
     pygame.draw.line(screen, bright_color, start_pos, end_pos, width)
     
     # Center highlight
-    highlight_color = tuple(min(255, int(c * 2)) for c in color)
+    highlight_color = shade(color, 2.0)
     pygame.draw.line(screen, highlight_color, start_pos, end_pos, max(1, width // 2))
 
 
@@ -198,7 +551,7 @@ def draw_glass_panel(screen, rect, base_color, alpha=100, border_width=2):
     for i in range(h // 3):
         ratio = i / (h // 3)
         color_alpha = int(alpha * 1.5 * (1 - ratio))
-        color = (*tuple(min(255, int(c * 1.3)) for c in base_color), color_alpha)
+        color = (*shade(base_color, 1.3), color_alpha)
         pygame.draw.line(surf, color, (0, i), (w, i))
     
     # Middle fill
@@ -209,13 +562,13 @@ def draw_glass_panel(screen, rect, base_color, alpha=100, border_width=2):
     for i in range(h // 3):
         ratio = i / (h // 3)
         color_alpha = int(alpha * (1 - ratio * 0.5))
-        color = (*tuple(int(c * (1 - ratio * 0.5)) for c in base_color), color_alpha)
+        color = (*shade(base_color, 1 - ratio * 0.5), color_alpha)
         pygame.draw.line(surf, color, (0, 2 * h // 3 + i), (w, 2 * h // 3 + i))
     
     screen.blit(surf, (x, y))
     
     # Border with highlights
-    border_color = tuple(min(255, int(c * 1.5)) for c in base_color)
+    border_color = shade(base_color, 1.5)
     pygame.draw.rect(screen, border_color, rect, border_width)
     
     # Corner accents
@@ -289,174 +642,1031 @@ def update_hiscores(new_score):
 # END HI-SCORE MANAGEMENT
 # ============================================================================
 
-# Sound effects - load from /sounds directory
-try:
-    # Laser sounds - we'll cycle through these
-    laser_sounds = [
-        pygame.mixer.Sound('sounds/retro-laser-shot-04.wav'),
-        pygame.mixer.Sound('sounds/retro-laser-shot-05.wav'),
-        pygame.mixer.Sound('sounds/retro-laser-shot-06.wav'),
-        pygame.mixer.Sound('sounds/puny_laser.wav'),
-    ]
-    current_laser_index = 0
+# ============================================================================
+# SOUND LOADING - Per-file, on a background thread, with a decoded PCM cache
+# ============================================================================
+SOUND_CACHE_DIR = os.path.join('.cache', 'sounds')
+
+
+class SoundHandle:
+    """Placeholder for one sound file; sound is set by the loader once decoded.
+
+    Until then (or forever, if the file is missing or broken) the handle
+    is simply not ready and the sound manager skips it.
+    """
+    __slots__ = ('path', 'sound', 'failed')
+
+    def __init__(self, path):
+        self.path = path
+        self.sound = None
+        self.failed = False
+
+    @property
+    def ready(self):
+        return self.sound is not None
+
+
+class SoundLoader:
+    """Decodes sound files one at a time on a daemon thread.
+
+    Decoded PCM is cached in SOUND_CACHE_DIR under the file's SHA-1 and the
+    mixer format, so MP3s are decoded once and later starts just wrap the
+    raw samples. A file that fails only silences its own handle.
+    """
+    def __init__(self, cache_dir=SOUND_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.handles = []
+        self.pending = queue.Queue()
+        self.thread = None
+        self.cache_hits = 0
+        self.decoded = 0
+
+    def load(self, path):
+        """Queue path and return its handle straight away"""
+        handle = SoundHandle(path)
+        self.handles.append(handle)
+        self.pending.put(handle)
+        return handle
+
+    def start(self):
+        """Start decoding everything queued so far"""
+        self.thread = threading.Thread(target=self._run, name='sound-loader', daemon=True)
+        self.thread.start()
+
+    def wait(self, timeout=None):
+        """Block until every queued file has loaded or failed (headless tools, tests)"""
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def _run(self):
+        while True:
+            if not pygame.mixer.get_init():  # Game quit before loading finished
+                return
+            try:
+                handle = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handle.sound = self._decode(handle.path)
+            except Exception as e:  # One bad asset must not take the others down
+                handle.failed = True
+                print(f"⚠ Could not load sound {handle.path}: {e}")
+        failed = sum(handle.failed for handle in self.handles)
+        if failed:
+            print(f"⚠ {failed} of {len(self.handles)} sound effects unavailable")
+        else:
+            print(f"✓ All {len(self.handles)} sound effects loaded")
+
+    def _cache_path(self, data):
+        frequency, size, channels = pygame.mixer.get_init()
+        digest = hashlib.sha1(data).hexdigest()
+        return os.path.join(self.cache_dir, f'{digest}-{frequency}-{size}-{channels}.pcm')
+
+    def _decode(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        cache_path = self._cache_path(data)
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                self.cache_hits += 1
+                return pygame.mixer.Sound(buffer=f.read())
+
+        sound = pygame.mixer.Sound(file=io.BytesIO(data))
+        self.decoded += 1
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            partial = f'{cache_path}.{os.getpid()}.tmp'
+            with open(partial, 'wb') as f:
+                f.write(sound.get_raw())
+            os.replace(partial, cache_path)
+        except OSError as e:  # Read-only install: play on, just uncached
+            print(f"⚠ Could not cache sound {path}: {e}")
+        return sound
+
+
+# Sound effects - load from /sounds directory, in the background
+sound_loader = SoundLoader()
+load_sound = sound_loader.load
+
+# Laser sounds - we'll cycle through these
+laser_sounds = [
+    load_sound('sounds/retro-laser-shot-04.wav'),
+    load_sound('sounds/retro-laser-shot-05.wav'),
+    load_sound('sounds/retro-laser-shot-06.wav'),
+    load_sound('sounds/puny_laser.wav'),
+]
 
-    # Big laser for UFO - laser-element sound
-    ufo_laser_sound = pygame.mixer.Sound('sounds/laser-element-only-2.wav')
-    
-    # Big laser beam for bomb/screen-clear effect
-    big_laser_sound = pygame.mixer.Sound('sounds/big-laser-beam.mp3')
+# Big laser for UFO - laser-element sound
+ufo_laser_sound = load_sound('sounds/laser-element-only-2.wav')
 
-    # Explosion sounds - randomize for variety
-    explosion_sounds = [
-        pygame.mixer.Sound('sounds/explosion_asteroid.wav'),
-        pygame.mixer.Sound('sounds/explosion_asteroid2.wav'),
-        pygame.mixer.Sound('sounds/space-explosion.wav'),
-        pygame.mixer.Sound('sounds/pelicula-sfx.wav'),
-    ]
+# Big laser beam for bomb/screen-clear effect
+big_laser_sound = load_sound('sounds/big-laser-beam.mp3')
 
-    # Achievement/Level up sounds
-    achievement_sounds = [
-        pygame.mixer.Sound('sounds/achievement.wav'),
-        pygame.mixer.Sound('sounds/jingle_achievement_00.wav'),
-        pygame.mixer.Sound('sounds/jingle_achievement_01.wav'),
-    ]
+# Explosion sounds - randomize for variety
+explosion_sounds = [
+    load_sound('sounds/explosion_asteroid.wav'),
+    load_sound('sounds/explosion_asteroid2.wav'),
+    load_sound('sounds/space-explosion.wav'),
+    load_sound('sounds/pelicula-sfx.wav'),
+]
 
-    # Level up sounds - NOTE: These are MP3 files!
-    # pygame.mixer.Sound works with mp3 on most systems
-    level_up_sounds = [
-        pygame.mixer.Sound('sounds/level-up-01.mp3'),
-        pygame.mixer.Sound('sounds/level-up-02.mp3'),
-        pygame.mixer.Sound('sounds/level-up-03.mp3'),
-    ]
+# Achievement/Level up sounds
+achievement_sounds = [
+    load_sound('sounds/achievement.wav'),
+    load_sound('sounds/jingle_achievement_00.wav'),
+    load_sound('sounds/jingle_achievement_01.wav'),
+]
 
-    # Power-up/special sounds
-    powerup_sound = pygame.mixer.Sound('sounds/magic-reveal.wav')
-    
-    # Adjust volumes for balance
-    for sound in laser_sounds:
-        sound.set_volume(0.3)
-    ufo_laser_sound.set_volume(0.4)
-    big_laser_sound.set_volume(0.7)  # Powerful bomb sound
-    for sound in explosion_sounds:
-        sound.set_volume(0.5)
-    for sound in achievement_sounds:
-        sound.set_volume(0.6)
-    for sound in level_up_sounds:
-        sound.set_volume(0.6)
-    powerup_sound.set_volume(0.5)
-    
-    sounds_loaded = True
-    print("✓ All sound effects loaded successfully!")
-    
-except Exception as e:
-    print(f"⚠ Could not load sounds: {e}")
-    print("⚠ Game will run without sound effects")
-    
-    # Create dummy sounds that do nothing
-    class DummySound:
-        def play(self): pass
-        def stop(self): pass
-        def set_volume(self, vol): pass
-    
-    laser_sounds = [DummySound() for _ in range(4)]
-    current_laser_index = 0
-    ufo_laser_sound = DummySound()
-    big_laser_sound = DummySound()
-    explosion_sounds = [DummySound() for _ in range(4)]
-    achievement_sounds = [DummySound() for _ in range(3)]
-    level_up_sounds = [DummySound() for _ in range(3)]
-    powerup_sound = DummySound()
-    sounds_loaded = False
+# Level up sounds - MP3s, decoded once and then served from the PCM cache
+level_up_sounds = [
+    load_sound('sounds/level-up-01.mp3'),
+    load_sound('sounds/level-up-02.mp3'),
+    load_sound('sounds/level-up-03.mp3'),
+]
 
+# Power-up/special sounds
+powerup_sound = load_sound('sounds/magic-reveal.wav')
 
-def play_laser_sound():
-    """Cycle through laser sounds for variety"""
-    global current_laser_index
-    laser_sounds[current_laser_index].play()
-    current_laser_index = (current_laser_index + 1) % len(laser_sounds)
+# Volumes are per category, applied on the channel (see SOUND_CATEGORIES)
 
 
-def play_explosion_sound():
-    """Play random explosion sound"""
-    random.choice(explosion_sounds).play()
+# ============================================================================
+# SOUND MANAGER - Reserved channel groups, voice caps, same-frame coalescing
+# ============================================================================
+MAX_SOUND_STARTS_PER_FRAME = 4  # Across all categories, highest priority first
+COALESCE_BOOST = 0.25           # Extra volume per doubling of same-frame requests
 
 
-def play_achievement_sound():
-    """Play random achievement sound"""
-    random.choice(achievement_sounds).play()
+class SoundCategory:
+    """One group of interchangeable sounds with its own reserved mixer channels.
 
+    The group size caps simultaneous voices. When every channel is busy a
+    new play either replaces the oldest voice (steal) or is dropped.
+    """
+    def __init__(self, name, sounds, voices, priority, volume, steal=False, cycle=False):
+        self.name = name
+        self.sounds = sounds
+        self.voices = voices
+        self.priority = priority
+        self.volume = volume
+        self.steal = steal
+        self.cycle = cycle  # Rotate through sounds in order instead of picking at random
+        self.channels = []
+        self.started = []   # Tick each channel last started, to find the oldest voice
+        self.next_index = 0
+        self.pending = 0
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def pick(self):
+        """Next loaded Sound, skipping handles still loading or failed (None if none is ready)"""
+        sounds = self.sounds
+        if self.cycle:
+            for step in range(len(sounds)):
+                index = (self.next_index + step) % len(sounds)
+                if sounds[index].ready:
+                    self.next_index = (index + 1) % len(sounds)
+                    return sounds[index].sound
+            return None
+        ready = [handle for handle in sounds if handle.ready]
+        return fx_random.choice(ready).sound if ready else None
+
+    def free_channel(self):
+        """Index of an idle channel, the oldest voice when stealing, else None"""
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+        if self.steal:
+            return self.started.index(min(self.started))
+        return None
 
-def play_level_up_sound():
-    """Play random level up sound"""
-    random.choice(level_up_sounds).play()
 
+SOUND_CATEGORIES = (
+    # name, sounds, voices, priority, volume
+    SoundCategory('bomb', [big_laser_sound], 1, 6, 0.7),
+    SoundCategory('level_up', level_up_sounds, 1, 5, 0.6),
+    SoundCategory('achievement', achievement_sounds, 1, 4, 0.6),
+    SoundCategory('powerup', [powerup_sound], 1, 3, 0.5),
+    SoundCategory('ufo', [ufo_laser_sound], 1, 2, 0.4, steal=True),
+    SoundCategory('explosion', explosion_sounds, 3, 1, 0.5, steal=True),
+    SoundCategory('laser', laser_sounds, 2, 0, 0.3, steal=True, cycle=True),
+)
+
+# GameWorld.step event -> sound category
+SOUND_EVENTS = {
+    'laser': 'laser',
+    'ufo_laser': 'ufo',
+    'big_laser': 'bomb',
+    'explosion': 'explosion',
+    'achievement': 'achievement',
+    'level_up': 'level_up',
+    'powerup': 'powerup',
+}
+
+
+class SoundManager:
+    """Collects play requests during a frame and starts them in one flush().
+
+    Every category owns reserved channels, so a burst of explosions can
+    never starve a level-up jingle. Duplicate requests within a frame
+    collapse into one play, louder the more there were, and at most
+    MAX_SOUND_STARTS_PER_FRAME voices start per frame, higher priority
+    categories first.
+    """
+    def __init__(self, categories, enabled=True):
+        self.enabled = enabled
+        self.categories = {category.name: category for category in categories}
+        self.by_priority = sorted(categories, key=lambda category: -category.priority)
+        self.frame = 0
+        if not enabled:  # No mixer: requests are only counted
+            return
+
+        total = sum(category.voices for category in categories)
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)  # Plain Sound.play() can never take these
+        index = 0
+        for category in self.by_priority:
+            category.channels = [pygame.mixer.Channel(index + i) for i in range(category.voices)]
+            category.started = [0] * category.voices
+            index += category.voices
+
+    def request(self, name):
+        self.categories[name].pending += 1
+
+    def flush(self):
+        """Start this frame's coalesced plays; call once per rendered frame"""
+        self.frame += 1
+        starts = 0
+        for category in self.by_priority:
+            pending = category.pending
+            if not pending:
+                continue
+            category.pending = 0
+            category.coalesced += pending - 1
+
+            if not self.enabled or starts >= MAX_SOUND_STARTS_PER_FRAME:
+                category.dropped += 1
+                continue
+            index = category.free_channel()
+            sound = category.pick() if index is not None else None
+            if sound is None:  # Every voice busy, or no sound loaded (yet)
+                category.dropped += 1
+                continue
+
+            starts += 1
+            category.played += 1
+            category.started[index] = self.frame
+            channel = category.channels[index]
+            channel.set_volume(min(1.0, category.volume * (1 + COALESCE_BOOST * math.log2(pending))))
+            channel.play(sound)
+
+    def stats(self):
+        """Per-category played, coalesced and dropped plays since startup"""
+        return {name: {'played': category.played, 'coalesced': category.coalesced,
+                       'dropped': category.dropped}
+                for name, category in self.categories.items()}
+
+    def totals(self):
+        """(played, coalesced, dropped) summed over every category"""
+        categories = self.categories.values()
+        return (sum(category.played for category in categories),
+                sum(category.coalesced for category in categories),
+                sum(category.dropped for category in categories))
+
+
+sound_manager = None  # Created by init_audio() once the mixer is open
+
+
+def init_audio():
+    """Open the mixer, reserve the sound channels and start decoding in the background"""
+    global sound_manager
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+    except pygame.error as e:
+        print(f"⚠ No audio device ({e}) - game will run without sound effects")
+        sound_manager = SoundManager(SOUND_CATEGORIES, enabled=False)
+        return
+    sound_manager = SoundManager(SOUND_CATEGORIES)
+    sound_loader.start()
+
+
+# ============================================================================
+# FIXED TIMESTEP - simulation runs at SIM_HZ, rendering interpolates between ticks
+# ============================================================================
+
+SIM_HZ = 60
+SIM_DT = 1.0 / SIM_HZ
+MAX_FRAME_TIME = 0.25   # Clamp long stalls (window drag, breakpoints) so we never spiral
+MAX_RENDER_FPS = 240    # Render cap - high-refresh displays get smooth motion, 0 = uncapped
+
+
+def lerp_wrapped(prev, current, alpha, span):
+    """Interpolate a screen-wrapped coordinate, snapping when it crossed the seam"""
+    delta = current - prev
+    if abs(delta) > span / 2:
+        return current
+    return prev + delta * alpha
+
+
+def interpolate_position(entity, alpha):
+    """Render position between an entity's previous and current tick (alpha 0..1)"""
+    return (lerp_wrapped(entity.prev_x, entity.x, alpha, WIDTH),
+            lerp_wrapped(entity.prev_y, entity.y, alpha, HEIGHT))
+
+
+# ============================================================================
+# COLLISION BROADPHASE - Toroidal spatial hash
+# ============================================================================
+
+def circles_overlap(x1, y1, r1, x2, y2, r2):
+    """Narrow-phase circle test on squared distances (no sqrt)"""
+    dx = x1 - x2
+    dy = y1 - y2
+    reach = r1 + r2
+    return dx * dx + dy * dy < reach * reach
+
+
+class SpatialHash:
+    """Uniform grid over the wrapping playfield for "what is near (x, y, r)" queries.
+
+    Cell indices wrap like every update() does, so objects that have drifted
+    past an edge (spawning UFOs, boss minions) still land in valid cells.
+    Rebuild it once per tick with clear() + insert(); query() returns each
+    candidate once, in insertion order, so the first-hit-wins collision rules
+    behave exactly like the old linear scans.
+    """
+    def __init__(self, cell_size=80, width=WIDTH, height=HEIGHT):
+        self.cell_size = cell_size
+        self.cols = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.used = []  # Non-empty cells, so clear() only touches what was filled
+        self.order = 0
+
+    def clear(self):
+        cells = self.cells
+        for index in self.used:
+            cells[index].clear()
+        self.used.clear()
+        self.order = 0
+
+    def _span(self, low, high, count):
+        """Wrapped cell indices covering [low, high] along one axis"""
+        first = int(low // self.cell_size)
+        last = int(high // self.cell_size)
+        if first == last:
+            return (first % count,)
+        if last - first + 1 >= count:
+            return range(count)
+        if first >= 0 and last < count:
+            return range(first, last + 1)
+        return [i % count for i in range(first, last + 1)]
+
+    def insert(self, item, x, y, radius):
+        """Add item to every cell its bounding box touches"""
+        self.order += 1
+        entry = (self.order, item)
+        cells = self.cells
+        cols = self.cols
+        for row in self._span(y - radius, y + radius, self.rows):
+            base = row * cols
+            for col in self._span(x - radius, x + radius, cols):
+                cell = cells[base + col]
+                if not cell:
+                    self.used.append(base + col)
+                cell.append(entry)
+
+    def insert_many(self, items, xs, ys, radii):
+        """Bulk insert() from NumPy coordinate arrays - the cell spans are computed vectorized"""
+        cols, rows = self.cols, self.rows
+        col_lo = np.floor_divide(xs - radii, self.cell_size).astype(np.intp)
+        row_lo = np.floor_divide(ys - radii, self.cell_size).astype(np.intp)
+        col_hi = np.minimum(np.floor_divide(xs + radii, self.cell_size).astype(np.intp), col_lo + cols - 1)
+        row_hi = np.minimum(np.floor_divide(ys + radii, self.cell_size).astype(np.intp), row_lo + rows - 1)
+        cells = self.cells
+        used = self.used
+        order = self.order
+        for item, c0, c1, r0, r1 in zip(items, col_lo.tolist(), col_hi.tolist(),
+                                        row_lo.tolist(), row_hi.tolist()):
+            order += 1
+            entry = (order, item)
+            for row in range(r0, r1 + 1):
+                base = (row % rows) * cols
+                for col in range(c0, c1 + 1):
+                    index = base + col % cols
+                    cell = cells[index]
+                    if not cell:
+                        used.append(index)
+                    cell.append(entry)
+        self.order = order
+
+    def query(self, x, y, radius):
+        """Candidates whose cells overlap the circle's bounding box, in insertion order"""
+        found = {}
+        cells = self.cells
+        cols = self.cols
+        for row in self._span(y - radius, y + radius, self.rows):
+            base = row * cols
+            for col in self._span(x - radius, x + radius, cols):
+                for order, item in cells[base + col]:
+                    found[order] = item
+        if len(found) > 1:
+            return [found[order] for order in sorted(found)]
+        return list(found.values())
+
+
+# ============================================================================
+# PARTICLE SYSTEM - Structure-of-arrays NumPy engine
+# ============================================================================
+
+PARTICLE_COLOR_TYPES = ('accent', 'primary', 'secondary', 'bright')
+PARTICLE_CAPACITY = 32768
+
+
+class ParticleSystem:
+    """Small particles for visual effects, stored as preallocated NumPy arrays.
+
+    Every live particle occupies slots [0, count). update() integrates, damps
+    and ages all of them in one vectorized pass, then compacts expired slots
+    with a single mask instead of per-particle list removes.
+    """
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0  # Emits refused because the pool was full
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.lifetime = np.zeros(capacity, np.int16)
+        self.max_lifetime = np.ones(capacity, np.int16)
+        self.size = np.zeros(capacity, np.int8)
+        self.color = np.zeros(capacity, np.int8)  # Index into PARTICLE_COLOR_TYPES
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, vx, vy, color_type='accent', lifetime=30):
+        """Emit a batch of particles - x, y, vx, vy may be scalars or equal-length arrays"""
+        vx = np.atleast_1d(vx)
+        vy = np.atleast_1d(vy)
+        requested = len(vx)
+        n = min(requested, self.capacity - self.count)
+        self.dropped += requested - n
+        if n <= 0:
+            return
+
+        start = self.count
+        end = start + n
+        self.x[start:end] = np.broadcast_to(x, (requested,))[:n]
+        self.y[start:end] = np.broadcast_to(y, (requested,))[:n]
+        self.vx[start:end] = vx[:n]
+        self.vy[start:end] = vy[:n]
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = lifetime
+        self.size[start:end] = fx_np_random.integers(2, 5, n)
+        self.color[start:end] = PARTICLE_COLOR_TYPES.index(color_type)
+        self.count = end
+
+    def emit_burst(self, x, y, count, min_speed, max_speed, color_type='accent', lifetime=30):
+        """Emit count particles from (x, y) in random directions"""
+        angle = fx_np_random.uniform(0, 2 * math.pi, count)
+        speed = fx_np_random.uniform(min_speed, max_speed, count)
+        self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed, color_type, lifetime)
 
-class Particle:
-    """Small particles for visual effects"""
-    def __init__(self, x, y, vx, vy, color_type='accent', lifetime=30):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color_type = color_type  # 'accent', 'primary', 'secondary', 'bright'
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 4)
-    
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.lifetime -= 1
-        
+        n = self.count
+        if n == 0:
+            return
+
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.lifetime[:n] -= 1
+
         # Fade out as lifetime decreases
-        self.vx *= 0.98
-        self.vy *= 0.98
-    
-    def is_expired(self):
-        return self.lifetime <= 0
-    
-    def draw(self, screen):
-        # Get color from current scheme
-        if self.color_type == 'accent':
-            color = current_scheme.accent
-        elif self.color_type == 'primary':
-            color = current_scheme.primary
-        elif self.color_type == 'bright':
-            color = current_scheme.bright
+        self.vx[:n] *= 0.98
+        self.vy[:n] *= 0.98
+
+        # Compact: keep live particles packed at the front (order preserved)
+        alive = self.lifetime[:n] > 0
+        live_count = int(np.count_nonzero(alive))
+        if live_count < n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.lifetime,
+                        self.max_lifetime, self.size, self.color):
+                arr[:live_count] = arr[:n][alive]
+            self.count = live_count
+
+    def draw(self, render_queue):
+        n = self.count
+        if n == 0:
+            return
+
+        # Get colors from current scheme
+        colors = [getattr(current_scheme, name) for name in PARTICLE_COLOR_TYPES]
+
+        # Fade alpha based on lifetime (computed and bucketed for the whole batch at once)
+        lifetime = self.lifetime[:n]
+        alphas = (255 * lifetime.astype(np.float32) / self.max_lifetime[:n]).astype(np.int32)
+        alphas = np.minimum(255, (alphas + GLOW_ALPHA_STEP // 2) // GLOW_ALPHA_STEP * GLOW_ALPHA_STEP)
+        glow_alphas = np.minimum(255, (alphas // 2 + GLOW_ALPHA_STEP // 2) // GLOW_ALPHA_STEP * GLOW_ALPHA_STEP)
+        fresh = lifetime > self.max_lifetime[:n] * 0.6
+        sprites = glow_sprites
+        append = render_queue.layers[LAYER_PARTICLES].append
+
+        for x, y, size, color_index, alpha, glow_alpha, is_fresh in zip(
+                self.x[:n].tolist(), self.y[:n].tolist(), self.size[:n].tolist(),
+                self.color[:n].tolist(), alphas.tolist(), glow_alphas.tolist(), fresh.tolist()):
+            color = colors[color_index]
+
+            # Sprites come pre-rendered from the glow cache (alphas already bucketed)
+            if size > 2 and is_fresh:
+                # Larger particles: add single glow layer when fresh
+                glow_size = size + 2
+                append((sprites.get((glow_size, color, glow_alpha, 0), render_circle_sprite,
+                                    glow_size, color, glow_alpha),
+                        (int(x - glow_size), int(y - glow_size))))
+
+            # Main particle
+            append((sprites.get((size, color, alpha, 0), render_circle_sprite, size, color, alpha),
+                    (int(x - size), int(y - size))))
+
+
+# ============================================================================
+# ENTITY SPRITES - Ship, UFO, boss, power-up and ally art baked into frame sets
+# ============================================================================
+# Each draw quantizes its animation state (angle, pulse, flicker) to a frame
+# index and blits the matching sprite. Frames bake on first use and stay
+# until cycle_color_scheme flushes them, like the asteroid atlas.
+
+SHIP_ROTATION_STEPS = 120  # 3 degrees per hull frame
+SHIP_FLAME_FRAMES = 4      # Flame lengths between 0.6x and 1.0x radius
+SHIELD_BAND_STEPS = 16     # Band positions over one third of a turn (the bands repeat)
+UFO_RING_STEPS = 30        # Light ring positions over 90 degrees (it has 4-fold symmetry)
+UFO_PULSE_STEPS = 24       # Light pulse phases per cycle
+UFO_BEAM_STEPS = 32        # Search beam directions
+BOSS_PULSE_STEPS = 16      # Glow sizes between 0 and full pulse
+BOSS_ROTATION_STEPS = 16   # Hull positions over 45 degrees (an octagon repeats)
+POWERUP_PULSE_STEPS = 32   # Pulse phases per cycle
+ALLY_ROTATION_STEPS = 72   # 5 degrees per ally frame
+
+ship_sprites = SpriteCache('ship', max_bytes=16 * 1024 * 1024)
+ufo_sprites = SpriteCache('ufo', max_bytes=16 * 1024 * 1024)
+boss_sprites = SpriteCache('boss', max_bytes=16 * 1024 * 1024)
+boss_hull_sprites = IndexedSpriteCache('boss_hull', max_entries=3 * BOSS_ROTATION_STEPS)
+powerup_sprites = SpriteCache('powerup', max_bytes=8 * 1024 * 1024)
+ally_sprites = SpriteCache('ally', max_bytes=4 * 1024 * 1024)
+
+
+def ship_sprite_half(radius):
+    return int(radius * 1.5) + 14  # Nose reach plus the wing-tip glow and flame glow
+
+
+def render_ship_body(radius, step):
+    """Bake the hull with 3D shading, cockpit and wing lights at one rotation step"""
+    half = ship_sprite_half(radius)
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    x = y = half
+    rad = step * (2 * math.pi / SHIP_ROTATION_STEPS)
+
+    # Use primary color for ship
+    shades = current_scheme.shades
+    ship_color = current_scheme.primary
+    dark_color = shades['primary', 0.25]
+    shadow_color = shades['primary', 0.4]
+    mid_color = shades['primary', 0.7]
+    light_color = shades['primary', 1.3]
+    bright_color = shades['primary', 1.7]
+
+    # Create classic triangle shape
+    # Front point (nose)
+    nose_x = x + math.sin(rad) * radius * 1.5
+    nose_y = y - math.cos(rad) * radius * 1.5
+
+    # Left wing
+    left_angle = rad + math.radians(140)
+    left_x = x + math.sin(left_angle) * radius
+    left_y = y - math.cos(left_angle) * radius
+
+    # Right wing
+    right_angle = rad - math.radians(140)
+    right_x = x + math.sin(right_angle) * radius
+    right_y = y - math.cos(right_angle) * radius
+
+    # Back center for detail
+    back_x = (left_x + right_x) / 2
+    back_y = (left_y + right_y) / 2
+
+    # Draw shadow/depth offset
+    shadow_offset = 2
+    shadow_points = [
+        (nose_x + shadow_offset, nose_y + shadow_offset),
+        (left_x + shadow_offset, left_y + shadow_offset),
+        (right_x + shadow_offset, right_y + shadow_offset)
+    ]
+    pygame.draw.polygon(surf, dark_color, shadow_points, 0)
+
+    # Main body fill with gradient
+    main_triangle = [(nose_x, nose_y), (left_x, left_y), (right_x, right_y)]
+
+    # Dark base fill
+    pygame.draw.polygon(surf, shadow_color, main_triangle, 0)
+
+    # Left side (lit side) - lighter
+    left_side = [(nose_x, nose_y), (left_x, left_y), (back_x, back_y)]
+    pygame.draw.polygon(surf, mid_color, left_side, 0)
+
+    # Right side (shadow side) - darker
+    right_side = [(nose_x, nose_y), (right_x, right_y), (back_x, back_y)]
+    pygame.draw.polygon(surf, ship_color, right_side, 0)
+
+    # Top edge highlight
+    pygame.draw.line(surf, bright_color, (nose_x, nose_y), (left_x, left_y), 3)
+
+    # Metallic edge highlights
+    pygame.draw.line(surf, light_color, (nose_x, nose_y), (right_x, right_y), 2)
+
+    # Draw cockpit with enhanced glow and depth
+    cockpit_x = x + math.sin(rad) * radius * 0.4
+    cockpit_y = y - math.cos(rad) * radius * 0.4
+
+    # Cockpit shadow
+    pygame.draw.circle(surf, dark_color, (int(cockpit_x + 1), int(cockpit_y + 1)), 4)
+
+    # Cockpit with strong glow
+    draw_glow_circle(surf, (cockpit_x, cockpit_y), 3, current_scheme.accent, intensity=1.5)
+
+    # Wing tip lights
+    draw_glow_circle(surf, (left_x, left_y), 2, current_scheme.bright, intensity=0.6)
+    draw_glow_circle(surf, (right_x, right_y), 2, current_scheme.bright, intensity=0.6)
+
+    # Main outline with depth
+    pygame.draw.polygon(surf, light_color, main_triangle, 2)
+
+    # Panel lines for detail
+    panel_start_x = x + math.sin(rad) * radius * 0.1
+    panel_start_y = y - math.cos(rad) * radius * 0.1
+    pygame.draw.line(surf, mid_color, (panel_start_x, panel_start_y), (left_x, left_y), 1)
+    pygame.draw.line(surf, mid_color, (panel_start_x, panel_start_y), (right_x, right_y), 1)
+
+    return prepare_sprite(surf)
+
+
+def render_ship_flame(radius, step, flicker):
+    """Bake the thruster flame at one rotation step and one flicker length"""
+    half = ship_sprite_half(radius)
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    x = y = half
+    rad = step * (2 * math.pi / SHIP_ROTATION_STEPS)
+
+    # Animated flame length
+    flame_length = radius * (0.6 + 0.4 * flicker / (SHIP_FLAME_FRAMES - 1))
+    back_x = x - math.sin(rad) * flame_length
+    back_y = y + math.cos(rad) * flame_length
+
+    # Left flame edge
+    left_flame_angle = rad + math.radians(160)
+    left_flame_x = x + math.sin(left_flame_angle) * radius * 0.6
+    left_flame_y = y - math.cos(left_flame_angle) * radius * 0.6
+
+    # Right flame edge
+    right_flame_angle = rad - math.radians(160)
+    right_flame_x = x + math.sin(right_flame_angle) * radius * 0.6
+    right_flame_y = y - math.cos(right_flame_angle) * radius * 0.6
+
+    # Flame center for glow
+    flame_center_x = (back_x + left_flame_x + right_flame_x) / 3
+    flame_center_y = (back_y + left_flame_y + right_flame_y) / 3
+
+    # Optimized flame: reduced from 5 to 2 glow layers
+    flame_white = (255, 255, 200)
+    flame_yellow = (255, 220, 50)
+    flame_accent = current_scheme.accent
+
+    # Reduced outer glow layers (was 5, now 2)
+    for i in range(2, 0, -1):
+        alpha = int(90 * (i / 2))
+        glow_radius = 10 + i * 4
+        glow_color = (*flame_accent, alpha)
+        layer = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(layer, glow_color, (glow_radius, glow_radius), glow_radius)
+        surf.blit(layer, (int(flame_center_x - glow_radius), int(flame_center_y - glow_radius)))
+
+    # Flame body with gradient (outer - accent color)
+    pygame.draw.polygon(surf, flame_accent,
+                        [(back_x, back_y), (left_flame_x, left_flame_y), (right_flame_x, right_flame_y)], 0)
+
+    # Middle layer (yellow/white hot)
+    mid_back_x = (back_x + flame_center_x) / 2
+    mid_back_y = (back_y + flame_center_y) / 2
+    mid_left_x = (left_flame_x + flame_center_x) / 2
+    mid_left_y = (left_flame_y + flame_center_y) / 2
+    mid_right_x = (right_flame_x + flame_center_x) / 2
+    mid_right_y = (right_flame_y + flame_center_y) / 2
+
+    pygame.draw.polygon(surf, flame_yellow,
+                        [(mid_back_x, mid_back_y), (mid_left_x, mid_left_y), (mid_right_x, mid_right_y)], 0)
+
+    # Hot core (white)
+    core_size = max(2, int(flame_length * 0.2))
+    pygame.draw.circle(surf, flame_white, (int(flame_center_x), int(flame_center_y)), core_size)
+
+    # Outer flame outline
+    flame_bright = current_scheme.shades['accent', 1.5]
+    pygame.draw.polygon(surf, flame_bright,
+                        [(back_x, back_y), (left_flame_x, left_flame_y), (right_flame_x, right_flame_y)], 1)
+
+    return prepare_sprite(surf)
+
+
+def render_ship_shield(shield_radius, band_step):
+    """Bake the three shield layers at one pulse radius and band position"""
+    size = shield_radius * 2 + 30
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    rotation_offset = band_step * (2 * math.pi / 3 / SHIELD_BAND_STEPS)
+
+    # Optimized shield with fewer layers (was 5, now 3)
+    for layer in range(3, 0, -1):
+        alpha = int(120 / layer)
+        shield_color = (*current_scheme.bright, alpha)
+        layer_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        # Simplified rotating energy bands (only draw on outer layer)
+        if layer == 3:
+            for i in range(3):
+                angle_offset = (i * 2 * math.pi / 3) + rotation_offset
+                start_angle = angle_offset
+                end_angle = angle_offset + math.pi / 3
+
+                pygame.draw.arc(layer_surf, shield_color,
+                                (15, 15, shield_radius * 2, shield_radius * 2),
+                                start_angle, end_angle, 3)
+
+        # Main shield circle
+        pygame.draw.circle(layer_surf, shield_color, (shield_radius + 15, shield_radius + 15),
+                           shield_radius + layer * 2, 2)
+        surf.blit(layer_surf, (0, 0))
+
+    return prepare_sprite(surf)
+
+
+def render_ufo_frame(radius, ring_step, pulse_step):
+    """Bake the saucer, dome and light ring at one ring position and pulse phase"""
+    half = radius + 12  # Ambient glow reaches radius + 8, the ring lights' halos a little less
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    x = y = half
+    ring_angle = ring_step * (90 / UFO_RING_STEPS)
+    pulse_phase = pulse_step * (2 * math.pi / UFO_PULSE_STEPS)
+
+    shades = current_scheme.shades
+    ufo_color = current_scheme.bright
+    dark_color = shades['bright', 0.2]
+    shadow_color = shades['bright', 0.4]
+    light_color = shades['bright', 1.2]
+    bright_color = shades['bright', 1.6]
+
+    # Reduced ambient glow layers from 6 to 2
+    for i in range(2, 0, -1):
+        glow_alpha = int(50 * (i / 2))
+        glow_color = (*ufo_color, glow_alpha)
+        glow_size = radius * 2 + i * 8
+        glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+        pygame.draw.ellipse(glow_surf, glow_color, (0, 0, glow_size, glow_size))
+        surf.blit(glow_surf, (int(x - glow_size // 2), int(y - glow_size // 2)))
+
+    # Draw shadow beneath UFO
+    shadow_surf = pygame.Surface((int(radius * 1.6), 6), pygame.SRCALPHA)
+    pygame.draw.ellipse(shadow_surf, (*dark_color, 60), (0, 0, int(radius * 1.6), 6))
+    surf.blit(shadow_surf, (int(x - radius * 0.8), int(y + 8)))
+
+    # Simplified saucer layers from 8 to 4
+    for layer in range(4):
+        layer_height = 12 - layer * 3
+        layer_y = int(y - 6 + layer * 2)
+        layer_width = int(radius * 2 * (1 - layer * 0.15))
+        layer_x = int(x - layer_width // 2)
+
+        # Metallic gradient: darker in middle, lighter on edges
+        if layer < 2:
+            color_factor = 0.4 + layer * 0.25
         else:
-            color = current_scheme.secondary
+            color_factor = 0.7 + (4 - layer) * 0.1
+
+        layer_color = shade(ufo_color, color_factor)
+
+        if layer_height > 0 and layer_width > 0:
+            pygame.draw.ellipse(surf, layer_color,
+                                (layer_x, layer_y, layer_width, int(layer_height)), 0)
+
+    # Bright metallic rim edge
+    rim_rect = (int(x - radius), int(y - 6), radius * 2, 12)
+    pygame.draw.ellipse(surf, bright_color, rim_rect, 3)
+
+    # Secondary rim line for depth
+    pygame.draw.ellipse(surf, light_color,
+                        (int(x - radius * 0.9), int(y - 4),
+                         int(radius * 1.8), 8), 1)
 
-        # Fade alpha based on lifetime
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
+    # Draw top dome with enhanced 3D metallic sphere effect
+    dome_rect = (int(x - radius // 2), int(y - radius // 2), radius, radius)
 
-        # Optimized: Draw simple particle with optional glow (no surface creation for small particles)
-        if self.size <= 2:
-            # Tiny particles: just draw direct circle (fastest)
-            color_with_alpha = (*color, alpha)
-            surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color_with_alpha, (self.size, self.size), self.size)
-            screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
+    # Dome dark base
+    pygame.draw.ellipse(surf, shadow_color, dome_rect, 0)
+
+    # Simplified dome gradient from 4 to 2 layers
+    for i in range(2, 0, -1):
+        size_factor = 0.4 + (i / 2) * 0.4
+        color_factor = 0.5 + (i / 2) * 0.4
+
+        gradient_rect = (int(x - radius * size_factor / 2),
+                         int(y - radius * size_factor / 2),
+                         int(radius * size_factor),
+                         int(radius * size_factor))
+        gradient_color = shade(ufo_color, color_factor)
+        pygame.draw.ellipse(surf, gradient_color, gradient_rect, 0)
+
+    # Bright specular highlight (metallic shine)
+    shine_rect = (int(x - radius * 0.2), int(y - radius * 0.35),
+                  int(radius * 0.4), int(radius * 0.4))
+    pygame.draw.ellipse(surf, bright_color, shine_rect, 0)
+
+    # Super bright hot spot
+    hotspot_rect = (int(x - radius * 0.1), int(y - radius * 0.3),
+                    int(radius * 0.2), int(radius * 0.2))
+    pygame.draw.ellipse(surf, (255, 255, 255), hotspot_rect, 0)
+
+    # Dome outline with lighting
+    pygame.draw.arc(surf, bright_color, dome_rect, 0, math.pi, 3)
+    pygame.draw.arc(surf, shadow_color, dome_rect, math.pi, 2 * math.pi, 2)
+
+    # Pulsing lights around the saucer
+    num_lights = 8
+    for i in range(num_lights):
+        light_rad = math.radians((360 / num_lights) * i + ring_angle)
+        light_x = x + math.cos(light_rad) * radius * 0.85
+        light_y = y + math.sin(light_rad) * 3
+
+        # Pulsing effect with phase offset per light
+        pulse_offset = i * (math.pi * 2 / num_lights)
+        pulse = (math.sin(pulse_phase + pulse_offset) + 1) / 2
+
+        # Alternate between accent and primary colors
+        if i % 2 == 0:
+            light_color_choice = current_scheme.accent
         else:
-            # Larger particles: add single glow layer when fresh
-            if self.lifetime > self.max_lifetime * 0.6:
-                glow_size = self.size + 2
-                glow_alpha = int(alpha * 0.5)
-                glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*color, glow_alpha), (glow_size, glow_size), glow_size)
-                screen.blit(glow_surf, (int(self.x - glow_size), int(self.y - glow_size)))
+            light_color_choice = current_scheme.primary
+
+        light_intensity = 0.7 + pulse * 1.0
+        draw_glow_circle(surf, (light_x, light_y), 3, light_color_choice, intensity=light_intensity)
+
+    return prepare_sprite(surf)
+
+
+def render_ufo_beam(radius, step):
+    """Bake the translucent search beam pointing in one direction"""
+    beam_length = radius * 1.5
+    half = int(beam_length) + 4
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    beam_angle = step * (2 * math.pi / UFO_BEAM_STEPS)
+    beam_end_x = half + math.cos(beam_angle) * beam_length
+    beam_end_y = half + math.sin(beam_angle) * beam_length
+    pygame.draw.line(surf, (*current_scheme.accent, 40), (half, half),
+                     (int(beam_end_x), int(beam_end_y)), 4)
+    return prepare_sprite(surf)
+
+
+def render_boss_glow(phase, radius, pulse_step):
+    """Bake the phase-colored glow at one pulse size"""
+    half = radius + 41  # Four layers reach radius + 40 at full pulse
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    color = BOSS_PHASE_COLORS[phase - 1]
+    pulse = pulse_step / BOSS_PULSE_STEPS
+    for i in range(4, 0, -1):
+        glow_radius = radius + i * 10 * pulse
+        alpha = int(80 * (i / 4))
+        glow_color = (*color, alpha)
+        layer = pygame.Surface((int(glow_radius * 2), int(glow_radius * 2)), pygame.SRCALPHA)
+        pygame.draw.circle(layer, glow_color, (int(glow_radius), int(glow_radius)), int(glow_radius))
+        surf.blit(layer, (int(half - glow_radius), int(half - glow_radius)))
+    return prepare_sprite(surf)
 
-            # Main particle
-            color_with_alpha = (*color, alpha)
-            surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color_with_alpha, (self.size, self.size), self.size)
-            screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
+
+def render_boss_hull(phase, radius, rotation_step):
+    """Bake the octagonal hull and core at one rotation step, as palette slots"""
+    half = radius + 3  # Outline width
+    surf = indexed_surface(half * 2, half * 2)
+    rotation = rotation_step * (45 / BOSS_ROTATION_STEPS)
+
+    # Main body - menacing octagon
+    points = []
+    for i in range(8):
+        angle = math.radians(i * 45 + rotation)
+        points.append((half + math.cos(angle) * radius, half + math.sin(angle) * radius))
+
+    pygame.draw.polygon(surf, PALETTE_BOSS + phase - 1, points, 0)
+    pygame.draw.polygon(surf, PALETTE_BRIGHT, points, 3)
+
+    # Inner core
+    pygame.draw.circle(surf, PALETTE_BRIGHT, (half, half), int(radius * 0.4))
+    return prepare_indexed_sprite(surf)
+
+
+def render_powerup_frame(symbol, radius, pulse_step):
+    """Bake a power-up orb, aura and letter at one pulse phase"""
+    half = radius + 17  # Pulse adds 3, the outer aura layer 12 more
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    x = y = half
+    phase = pulse_step * (2 * math.pi / POWERUP_PULSE_STEPS)
+
+    # Pulsing effect
+    pulse_size = radius + math.sin(phase) * 3
+    pulse_intensity = (math.sin(phase * 2) + 1) / 2
+
+    # Use accent color for power-ups
+    color = current_scheme.accent
+    dark_color = current_scheme.shades['accent', 0.5]
+    bright_color = current_scheme.shades['accent', 1.5]
+
+    # Draw glowing aura
+    for i in range(3, 0, -1):
+        aura_size = int(pulse_size + i * 4)
+        aura_alpha = int(40 * pulse_intensity * (4 - i) / 3)
+        aura_color = (*color, aura_alpha)
+
+        aura_surf = pygame.Surface((aura_size * 2, aura_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(aura_surf, aura_color, (aura_size, aura_size), aura_size)
+        surf.blit(aura_surf, (x - aura_size, y - aura_size))
+
+    # Draw 3D circle with gradient
+    # Dark base
+    pygame.draw.circle(surf, dark_color, (x, y), int(pulse_size), 0)
+
+    # Mid layer
+    mid_size = int(pulse_size * 0.7)
+    pygame.draw.circle(surf, color, (x, y), mid_size, 0)
+
+    # Bright center highlight
+    highlight_size = int(pulse_size * 0.4)
+    highlight_offset = int(pulse_size * 0.2)
+    pygame.draw.circle(surf, bright_color, (x - highlight_offset, y - highlight_offset), highlight_size, 0)
+
+    # Outer ring
+    pygame.draw.circle(surf, bright_color, (x, y), int(pulse_size), 2)
+
+    # Draw letter in center with shadow
+    blit_text_centered(surf, small_font, symbol, bright_color, (x, y), 1)
+    return prepare_sprite(surf)
+
+
+def render_ally_frame(radius, step):
+    """Bake the green glow and hull of an ally at one rotation step"""
+    half = radius + 17  # Outer glow layer reaches radius + 16
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    x = y = half
+
+    # Green glow for ally
+    for i in range(2, 0, -1):
+        glow_radius = radius + i * 8
+        alpha = int(100 * (i / 2))
+        glow_color = (50, 255, 50, alpha)
+        layer = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(layer, glow_color, (glow_radius, glow_radius), glow_radius)
+        surf.blit(layer, (x - glow_radius, y - glow_radius))
+
+    # Ship body - triangle pointing toward target
+    rad = step * (2 * math.pi / ALLY_ROTATION_STEPS)
+    points = [
+        (x + math.cos(rad) * radius,
+         y + math.sin(rad) * radius),
+        (x + math.cos(rad + 2.5) * radius * 0.7,
+         y + math.sin(rad + 2.5) * radius * 0.7),
+        (x + math.cos(rad - 2.5) * radius * 0.7,
+         y + math.sin(rad - 2.5) * radius * 0.7)
+    ]
+
+    pygame.draw.polygon(surf, (100, 255, 100), points, 0)
+    pygame.draw.polygon(surf, (150, 255, 150), points, 2)
+    return prepare_sprite(surf)
 
 
 class Ship:
+    __slots__ = ('x', 'y', 'angle', 'prev_x', 'prev_y', 'prev_angle', 'vx', 'vy',
+                 'rotation_speed', 'thrust_power', 'reverse_thrust_power', 'max_speed',
+                 'friction', 'radius', 'angular_velocity', 'rotation_damping', 'rapid_fire',
+                 'rapid_fire_timer', 'shield', 'shield_timer', 'invulnerable',
+                 'invulnerable_timer', 'hyperspace_cooldown', 'is_thrusting')
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.angle = 0
+        # State at the previous tick, for interpolated drawing
+        self.prev_x = x
+        self.prev_y = y
+        self.prev_angle = 0
         self.vx = 0
         self.vy = 0
         self.rotation_speed = 3.5  # Reduced from 5 for more realistic inertia
@@ -483,12 +1693,18 @@ class Ship:
         
         self.is_thrusting = False
     
-    def handle_input(self, keys, particles):
-        """Handle rotation, thrust, and special abilities with realistic physics"""
+    def handle_input(self, inputs, particles):
+        """Handle rotation, thrust, and special abilities with realistic physics
+
+        particles is None when cosmetic effects are disabled.
+        """
+        # Input is the first thing applied each tick - remember where we were
+        self.prev_x, self.prev_y, self.prev_angle = self.x, self.y, self.angle
+
         # Arrow key controls with rotational inertia
-        if keys[pygame.K_LEFT]:
+        if inputs.left:
             self.angular_velocity -= self.rotation_speed * 0.15  # Apply rotational force
-        if keys[pygame.K_RIGHT]:
+        if inputs.right:
             self.angular_velocity += self.rotation_speed * 0.15  # Apply rotational force
         
         # Apply angular velocity to rotation
@@ -503,7 +1719,7 @@ class Ship:
             self.angular_velocity = max_angular_velocity if self.angular_velocity > 0 else -max_angular_velocity
 
         self.is_thrusting = False
-        if keys[pygame.K_UP]:
+        if inputs.thrust:
             self.is_thrusting = True
             # Thrust in the direction we're facing
             rad = math.radians(self.angle)
@@ -520,7 +1736,7 @@ class Ship:
             self.spawn_thrust_particles(particles)
         
         # Backwards thrust (DOWN arrow) - weaker for strategic braking/reversing
-        elif keys[pygame.K_DOWN]:
+        elif inputs.reverse:
             self.is_thrusting = True
             # Thrust opposite to the direction we're facing (backwards)
             rad = math.radians(self.angle)
@@ -537,69 +1753,64 @@ class Ship:
             self.spawn_reverse_thrust_particles(particles)
 
         # Hyperspace jump (LSHIFT)
-        if keys[pygame.K_LSHIFT] and self.hyperspace_cooldown <= 0:
+        if inputs.hyperspace and self.hyperspace_cooldown <= 0:
             self.hyperspace_jump(particles)
             self.hyperspace_cooldown = 180  # 3 seconds
     
     def spawn_thrust_particles(self, particles):
         """Create particles behind the ship when thrusting"""
-        if random.random() < 0.5:  # Don't spawn every frame
+        if particles is not None and fx_random.random() < 0.5:  # Don't spawn every frame
             rad = math.radians(self.angle)
             # Position particles at the back of the ship
             back_x = self.x - math.sin(rad) * self.radius
             back_y = self.y + math.cos(rad) * self.radius
             
             # Particles move opposite to thrust direction
-            particle_vx = self.vx - math.sin(rad) * 3 + random.uniform(-1, 1)
-            particle_vy = self.vy + math.cos(rad) * 3 + random.uniform(-1, 1)
+            particle_vx = self.vx - math.sin(rad) * 3 + fx_random.uniform(-1, 1)
+            particle_vy = self.vy + math.cos(rad) * 3 + fx_random.uniform(-1, 1)
             
             # Use accent color for thrust
-            particles.append(Particle(back_x, back_y, particle_vx, particle_vy, 
-                                    'accent', lifetime=20))
+            particles.emit(back_x, back_y, particle_vx, particle_vy, 'accent', lifetime=20)
     
     def spawn_reverse_thrust_particles(self, particles):
         """Create particles at the front of the ship when reverse thrusting"""
-        if random.random() < 0.5:  # Don't spawn every frame
+        if particles is not None and fx_random.random() < 0.5:  # Don't spawn every frame
             rad = math.radians(self.angle)
             # Position particles at the front of the ship
             front_x = self.x + math.sin(rad) * self.radius
             front_y = self.y - math.cos(rad) * self.radius
             
             # Particles move opposite to reverse thrust direction (forward)
-            particle_vx = self.vx + math.sin(rad) * 2 + random.uniform(-1, 1)
-            particle_vy = self.vy - math.cos(rad) * 2 + random.uniform(-1, 1)
+            particle_vx = self.vx + math.sin(rad) * 2 + fx_random.uniform(-1, 1)
+            particle_vy = self.vy - math.cos(rad) * 2 + fx_random.uniform(-1, 1)
             
             # Use secondary color for reverse thrust (to differentiate from forward)
-            particles.append(Particle(front_x, front_y, particle_vx, particle_vy, 
-                                    'secondary', lifetime=15))
+            particles.emit(front_x, front_y, particle_vx, particle_vy, 'secondary', lifetime=15)
     
     def hyperspace_jump(self, particles):
         """Teleport to random location with particle effect - OPTIMIZED"""
         # Reduced particles from 30 to 12 at old location
-        for _ in range(12):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 5)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            particles.append(Particle(self.x, self.y, vx, vy, 'bright', lifetime=30))
+        self.spawn_warp_particles(particles)
         
         # Teleport to random position
-        self.x = random.randint(100, WIDTH - 100)
-        self.y = random.randint(100, HEIGHT - 100)
+        self.x = sim_random.randint(100, WIDTH - 100)
+        self.y = sim_random.randint(100, HEIGHT - 100)
         self.vx = 0
         self.vy = 0
+        self.prev_x, self.prev_y = self.x, self.y  # Don't interpolate the jump
         
         # Reduced particles from 30 to 12 at new location
-        for _ in range(12):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 5)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            particles.append(Particle(self.x, self.y, vx, vy, 'bright', lifetime=30))
+        self.spawn_warp_particles(particles)
         
         # Small chance of telefragging yourself into an asteroid (risk!)
         # Handled by collision detection
     
+    def spawn_warp_particles(self, particles):
+        """Burst of bright particles at the ship's current position"""
+        if particles is None:
+            return
+        particles.emit_burst(self.x, self.y, 12, 1, 5, 'bright', lifetime=30)
+    
     def update(self):
         """Apply velocity with true zero-gravity physics (no friction)"""
         # In true zero gravity, friction = 1.0 means no slowdown
@@ -640,183 +1851,37 @@ class Ship:
         if self.hyperspace_cooldown > 0:
             self.hyperspace_cooldown -= 1
     
-    def draw(self, screen):
-        """Draw the ship with enhanced 3D shading and 16-bit style"""
-        rad = math.radians(self.angle)
+    def draw(self, render_queue, alpha=1.0):
+        """Queue the baked shield, hull and flame frames nearest the current state"""
+        x, y = interpolate_position(self, alpha)
+        angle = self.prev_angle + (self.angle - self.prev_angle) * alpha
+        ticks = pygame.time.get_ticks()
 
         # Flicker when invulnerable
-        if self.invulnerable and pygame.time.get_ticks() % 200 < 100:
+        if self.invulnerable and ticks % 200 < 100:
             return
 
-        # Draw shield with animated pulse - OPTIMIZED (reduced from 5 to 3 layers)
+        # Shield with animated pulse and rotating energy bands
         if self.shield:
-            pulse = math.sin(pygame.time.get_ticks() * 0.005) * 3
-            shield_radius = int(self.radius * 1.5 + pulse)
-
-            # Optimized shield with fewer layers (was 5, now 3)
-            for layer in range(3, 0, -1):
-                alpha = int(120 / layer)
-                shield_color = (*current_scheme.bright, alpha)
-                surf = pygame.Surface((shield_radius * 2 + 30, shield_radius * 2 + 30), pygame.SRCALPHA)
-                
-                # Simplified rotating energy bands (only draw on outer layer)
-                if layer == 3:
-                    rotation_offset = (pygame.time.get_ticks() * 0.01) % (2 * math.pi)
-                    for i in range(3):
-                        angle_offset = (i * 2 * math.pi / 3) + rotation_offset
-                        start_angle = angle_offset
-                        end_angle = angle_offset + math.pi / 3
-                        
-                        pygame.draw.arc(surf, shield_color, 
-                                       (15, 15, shield_radius * 2, shield_radius * 2),
-                                       start_angle, end_angle, 3)
-                
-                # Main shield circle
-                pygame.draw.circle(surf, shield_color, (shield_radius + 15, shield_radius + 15),
-                                 shield_radius + layer * 2, 2)
-                screen.blit(surf, (int(self.x - shield_radius - 15),
-                                  int(self.y - shield_radius - 15)))
-
-        # Use primary color for ship
-        ship_color = current_scheme.primary
-        dark_color = tuple(int(c * 0.25) for c in ship_color)
-        shadow_color = tuple(int(c * 0.4) for c in ship_color)
-        mid_color = tuple(int(c * 0.7) for c in ship_color)
-        light_color = tuple(min(255, int(c * 1.3)) for c in ship_color)
-        bright_color = tuple(min(255, int(c * 1.7)) for c in ship_color)
-
-        # Create classic triangle shape
-        # Front point (nose)
-        nose_x = self.x + math.sin(rad) * self.radius * 1.5
-        nose_y = self.y - math.cos(rad) * self.radius * 1.5
-
-        # Left wing
-        left_angle = rad + math.radians(140)
-        left_x = self.x + math.sin(left_angle) * self.radius
-        left_y = self.y - math.cos(left_angle) * self.radius
-
-        # Right wing
-        right_angle = rad - math.radians(140)
-        right_x = self.x + math.sin(right_angle) * self.radius
-        right_y = self.y - math.cos(right_angle) * self.radius
-
-        # Back center for detail
-        back_x = (left_x + right_x) / 2
-        back_y = (left_y + right_y) / 2
-
-        # Draw shadow/depth offset
-        shadow_offset = 2
-        shadow_points = [
-            (nose_x + shadow_offset, nose_y + shadow_offset),
-            (left_x + shadow_offset, left_y + shadow_offset),
-            (right_x + shadow_offset, right_y + shadow_offset)
-        ]
-        pygame.draw.polygon(screen, dark_color, shadow_points, 0)
-
-        # Main body fill with gradient
-        main_triangle = [(nose_x, nose_y), (left_x, left_y), (right_x, right_y)]
-        
-        # Dark base fill
-        pygame.draw.polygon(screen, shadow_color, main_triangle, 0)
-
-        # Left side (lit side) - lighter
-        left_side = [(nose_x, nose_y), (left_x, left_y), (back_x, back_y)]
-        pygame.draw.polygon(screen, mid_color, left_side, 0)
-
-        # Right side (shadow side) - darker
-        right_side = [(nose_x, nose_y), (right_x, right_y), (back_x, back_y)]
-        pygame.draw.polygon(screen, ship_color, right_side, 0)
-
-        # Top edge highlight
-        pygame.draw.line(screen, bright_color, (nose_x, nose_y), (left_x, left_y), 3)
-        
-        # Metallic edge highlights
-        pygame.draw.line(screen, light_color, (nose_x, nose_y), (right_x, right_y), 2)
-
-        # Draw cockpit with enhanced glow and depth
-        cockpit_x = self.x + math.sin(rad) * self.radius * 0.4
-        cockpit_y = self.y - math.cos(rad) * self.radius * 0.4
-        
-        # Cockpit shadow
-        pygame.draw.circle(screen, dark_color, (int(cockpit_x + 1), int(cockpit_y + 1)), 4)
-        
-        # Cockpit with strong glow
-        draw_glow_circle(screen, (cockpit_x, cockpit_y), 3, current_scheme.accent, intensity=1.5)
-
-        # Wing tip lights
-        draw_glow_circle(screen, (left_x, left_y), 2, current_scheme.bright, intensity=0.6)
-        draw_glow_circle(screen, (right_x, right_y), 2, current_scheme.bright, intensity=0.6)
-
-        # Main outline with depth
-        pygame.draw.polygon(screen, light_color, main_triangle, 2)
-        
-        # Panel lines for detail
-        panel_start_x = self.x + math.sin(rad) * self.radius * 0.1
-        panel_start_y = self.y - math.cos(rad) * self.radius * 0.1
-        pygame.draw.line(screen, mid_color, (panel_start_x, panel_start_y), (left_x, left_y), 1)
-        pygame.draw.line(screen, mid_color, (panel_start_x, panel_start_y), (right_x, right_y), 1)
-
-        # Add thruster flame when thrusting with enhanced glow
+            shield_radius = int(self.radius * 1.5 + math.sin(ticks * 0.005) * 3)
+            band_step = int((ticks * 0.01) % (2 * math.pi / 3) * SHIELD_BAND_STEPS / (2 * math.pi / 3))
+            sprite = ship_sprites.get(('shield', shield_radius, band_step), render_ship_shield,
+                                      shield_radius, band_step)
+            render_queue.blit(LAYER_SHIP, sprite, (int(x - shield_radius - 15), int(y - shield_radius - 15)))
+
+        step = round(angle * SHIP_ROTATION_STEPS / 360) % SHIP_ROTATION_STEPS
+        sprite = ship_sprites.get(('body', self.radius, step), render_ship_body, self.radius, step)
+        render_queue.blit_centered(LAYER_SHIP, sprite, x, y)
+
+        # Thruster flame, one of a few baked lengths picked at random
         if self.is_thrusting:
-            # Animated flame length
-            flame_length = self.radius * random.uniform(0.6, 1.0)
-            back_x = self.x - math.sin(rad) * flame_length
-            back_y = self.y + math.cos(rad) * flame_length
-
-            # Left flame edge
-            left_flame_angle = rad + math.radians(160)
-            left_flame_x = self.x + math.sin(left_flame_angle) * self.radius * 0.6
-            left_flame_y = self.y - math.cos(left_flame_angle) * self.radius * 0.6
-
-            # Right flame edge
-            right_flame_angle = rad - math.radians(160)
-            right_flame_x = self.x + math.sin(right_flame_angle) * self.radius * 0.6
-            right_flame_y = self.y - math.cos(right_flame_angle) * self.radius * 0.6
-
-            # Flame center for glow
-            flame_center_x = (back_x + left_flame_x + right_flame_x) / 3
-            flame_center_y = (back_y + left_flame_y + right_flame_y) / 3
-
-            # Optimized flame: reduced from 5 to 2 glow layers
-            flame_white = (255, 255, 200)
-            flame_yellow = (255, 220, 50)
-            flame_accent = current_scheme.accent
-            
-            # Reduced outer glow layers (was 5, now 2)
-            for i in range(2, 0, -1):
-                alpha = int(90 * (i / 2))
-                glow_radius = 10 + i * 4
-                glow_color = (*flame_accent, alpha)
-                surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, glow_color, (glow_radius, glow_radius), glow_radius)
-                screen.blit(surf, (int(flame_center_x - glow_radius), int(flame_center_y - glow_radius)))
-
-            # Flame body with gradient (outer - accent color)
-            pygame.draw.polygon(screen, flame_accent,
-                              [(back_x, back_y), (left_flame_x, left_flame_y), (right_flame_x, right_flame_y)], 0)
-            
-            # Middle layer (yellow/white hot)
-            mid_back_x = (back_x + flame_center_x) / 2
-            mid_back_y = (back_y + flame_center_y) / 2
-            mid_left_x = (left_flame_x + flame_center_x) / 2
-            mid_left_y = (left_flame_y + flame_center_y) / 2
-            mid_right_x = (right_flame_x + flame_center_x) / 2
-            mid_right_y = (right_flame_y + flame_center_y) / 2
-            
-            pygame.draw.polygon(screen, flame_yellow,
-                              [(mid_back_x, mid_back_y), (mid_left_x, mid_left_y), (mid_right_x, mid_right_y)], 0)
-            
-            # Hot core (white)
-            core_size = max(2, int(flame_length * 0.2))
-            pygame.draw.circle(screen, flame_white, (int(flame_center_x), int(flame_center_y)), core_size)
-            
-            # Outer flame outline
-            flame_bright = tuple(min(255, int(c * 1.5)) for c in flame_accent)
-            pygame.draw.polygon(screen, flame_bright,
-                              [(back_x, back_y), (left_flame_x, left_flame_y), (right_flame_x, right_flame_y)], 1)
+            flicker = fx_random.randrange(SHIP_FLAME_FRAMES)
+            sprite = ship_sprites.get(('flame', self.radius, step, flicker), render_ship_flame,
+                                      self.radius, step, flicker)
+            render_queue.blit_centered(LAYER_SHIP, sprite, x, y)
     
-    def shoot(self):
-        """Create a bullet"""
+    def shoot(self, bullets, bullet_type='normal'):
+        """Fire a bullet from the nose (caller reports the 'laser' sound event)"""
         rad = math.radians(self.angle)
         
         bullet_x = self.x + math.sin(rad) * self.radius
@@ -826,20 +1891,29 @@ class Ship:
         bullet_vx = self.vx + math.sin(rad) * bullet_speed
         bullet_vy = self.vy - math.cos(rad) * bullet_speed
         
-        play_laser_sound()  # Cycle through different laser sounds
-        return Bullet(bullet_x, bullet_y, bullet_vx, bullet_vy)
+        return bullets.spawn(bullet_x, bullet_y, bullet_vx, bullet_vy, bullet_type)
 
 
 class Bullet:
+    __slots__ = ('pool_id', 'live', 'x', 'y', 'vx', 'vy', 'radius', 'lifetime', 'prev_x', 'prev_y')
     def __init__(self, x, y, vx, vy):
+        self.pool_id = -1     # Slot in the owning BulletPool's object list
+        self.live = False
+        self.reset(x, y, vx, vy)
+
+    def reset(self, x, y, vx, vy):
+        """(Re)initialise in place so pooled bullets are reused, not reallocated"""
         self.x = x
         self.y = y
         self.vx = vx
         self.vy = vy
         self.radius = 3
         self.lifetime = 60
+        self.prev_x = x
+        self.prev_y = y
     
     def update(self):
+        self.prev_x, self.prev_y = self.x, self.y
         self.x += self.vx
         self.y += self.vy
         self.lifetime -= 1
@@ -858,243 +1932,491 @@ class Bullet:
     def is_expired(self):
         return self.lifetime <= 0
     
-    def draw(self, screen):
+    def draw(self, render_queue, alpha=1.0):
         """Draw bullet with optimized energy beam effect"""
+        x, y = interpolate_position(self, alpha)
+        glows = render_queue.layers[LAYER_BULLET_GLOW]
+
         # Reduced glow layers from 5 to 2 for performance
         for i in range(2, 0, -1):
             glow_radius = self.radius + i * 3
-            alpha = int(90 * (i / 2))
-            glow_color = (*current_scheme.accent, alpha)
-            
-            surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, glow_color, (glow_radius, glow_radius), glow_radius)
-            screen.blit(surf, (int(self.x - glow_radius), int(self.y - glow_radius)))
+            glow_alpha = int(90 * (i / 2))
+            glows.append((glow_sprite(glow_radius, current_scheme.accent, glow_alpha),
+                          (int(x - glow_radius), int(y - glow_radius))))
 
         # Simplified trail - reduced from 5 to 3 segments
         trail_length = 3
         for i in range(1, trail_length):
-            trail_x = self.x - self.vx * i * 0.5
-            trail_y = self.y - self.vy * i * 0.5
+            trail_x = x - self.vx * i * 0.5
+            trail_y = y - self.vy * i * 0.5
             trail_alpha = int(150 * (1 - i / trail_length))
             trail_size = self.radius * (1 - i / trail_length * 0.5)
             
             # Single trail circle (removed nested glow loop)
-            trail_color = (*current_scheme.accent, trail_alpha)
-            surf = pygame.Surface((int(trail_size * 2 + 4), int(trail_size * 2 + 4)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, trail_color, (int(trail_size + 2), int(trail_size + 2)), int(trail_size + 1))
-            screen.blit(surf, (int(trail_x - trail_size - 2), int(trail_y - trail_size - 2)))
+            trail_radius = int(trail_size + 1)
+            glows.append((glow_sprite(trail_radius, current_scheme.accent, trail_alpha),
+                          (int(trail_x - trail_radius), int(trail_y - trail_radius))))
 
-        # Main bullet core with bright center
-        pygame.draw.circle(screen, current_scheme.accent, (int(self.x), int(self.y)), self.radius)
-        
-        # Hot white core
-        bright_color = tuple(min(255, int(c * 2)) for c in current_scheme.accent)
-        pygame.draw.circle(screen, bright_color, (int(self.x), int(self.y)), max(1, self.radius // 2))
+        # Main bullet core with a hot white center
+        core = disc_sprite(self.radius, current_scheme.accent, max(1, self.radius // 2),
+                           current_scheme.shades['accent', 2.0])
+        render_queue.blit(LAYER_BULLETS, core, (int(x) - self.radius - 1, int(y) - self.radius - 1))
+
+
+# ============================================================================
+# ASTEROID FIELD - Structure-of-arrays NumPy storage
+# ============================================================================
+ASTEROID_SIZES = ('large', 'medium', 'small')
+ASTEROID_RADII = np.array([40, 25, 15], dtype=np.float64)
+ASTEROID_POINTS = np.array([20, 50, 100], dtype=np.int64)
+ASTEROID_SHAPE_VARIANTS = 32  # Irregular outlines generated per size class
+
+
+def create_asteroid_polygon(radius, rng):
+    """Generate an irregular polygon around a radius as a flat array('f') of x, y pairs"""
+    num_points = rng.randint(8, 12)
+    polygon = array('f')
+
+    for i in range(num_points):
+        angle = (360 / num_points) * i + rng.uniform(-15, 15)
+        distance = radius + rng.uniform(-radius * 0.3, radius * 0.2)
+
+        rad = math.radians(angle)
+        polygon.append(math.cos(rad) * distance)
+        polygon.append(math.sin(rad) * distance)
+    return polygon
+
+
+class AsteroidModel:
+    """Unrotated geometry of one asteroid shape, built once and shared by every frame bake.
+
+    vertices and normals are (n, 2) arrays: the outline and each edge's unit
+    outward normal (edge i runs from vertex i to i + 1). Craters are
+    (angle, distance, size) rows in radians and pixels; cracks are angles.
+    """
+    __slots__ = ('size_class', 'vertices', 'normals', 'craters', 'cracks')
+
+    def __init__(self, size_class, polygon, detail):
+        radius = float(ASTEROID_RADII[size_class])
+        self.size_class = size_class
+        self.vertices = np.array(polygon, dtype=np.float64).reshape(-1, 2)
+        edges = np.roll(self.vertices, -1, axis=0) - self.vertices
+        self.normals = np.stack((-edges[:, 1], edges[:, 0]), axis=1) / np.hypot(edges[:, 0], edges[:, 1])[:, None]
+
+        # Surface details, drawn in a fixed order from detail (a per-shape stream)
+        num_craters = (3, 2, 0)[size_class]
+        craters = []
+        for i in range(num_craters):
+            angle = math.radians((360 / num_craters) * i + detail.randint(-20, 20))
+            distance = radius * detail.uniform(0.3, 0.7)
+            craters.append((angle, distance, int(radius * detail.uniform(0.12, 0.2))))
+        self.craters = craters
+        self.cracks = [detail.uniform(0, 2 * math.pi) for _ in range(2)] if size_class == 0 else []
+
+
+_asteroid_models = None
+
+
+def asteroid_models():
+    """Shared model bank, one row per size class - built once on first use"""
+    global _asteroid_models
+    if _asteroid_models is None:
+        # Private fixed seeds: the bank is identical every run and never
+        # advances the gameplay or cosmetic streams.
+        rng = random.Random(1979)
+        _asteroid_models = [[AsteroidModel(size_class, create_asteroid_polygon(radius, rng),
+                                           random.Random(f'{size_class}:{shape}'))
+                             for shape in range(ASTEROID_SHAPE_VARIANTS)]
+                            for size_class, radius in enumerate(ASTEROID_RADII.tolist())]
+    return _asteroid_models
+
+
+ASTEROID_ROTATION_STEPS = 64  # Pre-rendered rotation frames per shape
+ASTEROID_ATLAS_BUDGET = 48 * 1024 * 1024  # Bytes of baked frames kept before LRU eviction
+ASTEROID_LIGHT = np.array([-0.5, -0.7])  # Light from top-left, fixed while the rock spins
+_step_angles = np.arange(ASTEROID_ROTATION_STEPS) * (2 * math.pi / ASTEROID_ROTATION_STEPS)
+ASTEROID_STEP_COS = np.cos(_step_angles).tolist()
+ASTEROID_STEP_SIN = np.sin(_step_angles).tolist()
+
+
+def render_asteroid_frame(size_class, shape, step):
+    """Bake one rotation frame of an asteroid outline in the current scheme's colors"""
+    radius = int(ASTEROID_RADII[size_class])
+    half = int(radius * 1.2) + 4  # Outline reaches 1.2x radius, plus the widest edge line
+    surf = indexed_surface(half * 2, half * 2)
+    rad = step * (2 * math.pi / ASTEROID_ROTATION_STEPS)
+    cos_r, sin_r = ASTEROID_STEP_COS[step], ASTEROID_STEP_SIN[step]
+    model = asteroid_models()[size_class][shape]
+
+    # Rotate every vertex around the sprite center in one product
+    rotation = np.array([[cos_r, sin_r], [-sin_r, cos_r]])
+    points = (model.vertices @ rotation + half).tolist()
+
+    # Color variations for 3D effect, as palette slots
+    base_color = secondary_shade(1.0)
+    dark_color = secondary_shade(0.3)
+    shadow_color = secondary_shade(0.5)
+    light_color = secondary_shade(1.2)
+    bright_color = secondary_shade(1.4)
+
+    # Fill with dark base
+    pygame.draw.polygon(surf, shadow_color, points, 0)
+
+    # Simplified shading - only 3 brightness levels (was 6). Rotating the light
+    # back by the frame angle lights the unrotated normals like rotated ones.
+    light_amounts = (model.normals @ (rotation @ ASTEROID_LIGHT)).tolist()
+    count = len(points)
+    for i, light_amount in enumerate(light_amounts):
+        p1 = points[i]
+        p2 = points[(i + 1) % count]
+        if light_amount > 0.4:
+            pygame.draw.line(surf, bright_color, p1, p2, 3)
+        elif light_amount > 0:
+            pygame.draw.line(surf, light_color, p1, p2, 2)
+        else:
+            # Shadow edges
+            pygame.draw.line(surf, dark_color, p1, p2, 1)
+
+    # Draw main outline
+    pygame.draw.polygon(surf, base_color, points, 2)
+
+    # Crater details with enhanced depth - fixed per shape, turning with the rock
+    for angle, distance, crater_size in model.craters:
+        crater_x = half + math.cos(angle + rad) * distance
+        crater_y = half + math.sin(angle + rad) * distance
+
+        # Crater shadow (darker)
+        pygame.draw.circle(surf, dark_color, (int(crater_x + 1), int(crater_y + 1)), crater_size)
+
+        # Dark crater interior
+        pygame.draw.circle(surf, shadow_color, (int(crater_x), int(crater_y)), crater_size)
+
+        # Highlight on top-left edge (3D rim effect)
+        highlight_x = int(crater_x - crater_size * 0.4)
+        highlight_y = int(crater_y - crater_size * 0.4)
+        pygame.draw.arc(surf, light_color,
+                        (highlight_x, highlight_y, crater_size * 2, crater_size * 2),
+                        math.radians(200), math.radians(340), 2)
+
+    # Surface detail cracks (large asteroids only)
+    crack_start_dist = radius * 0.3
+    crack_end_dist = radius * 0.8
+    for crack_angle in model.cracks:
+        crack_angle += rad
+        pygame.draw.line(surf, dark_color,
+                         (int(half + math.cos(crack_angle) * crack_start_dist),
+                          int(half + math.sin(crack_angle) * crack_start_dist)),
+                         (int(half + math.cos(crack_angle) * crack_end_dist),
+                          int(half + math.sin(crack_angle) * crack_end_dist)), 1)
+
+    return prepare_indexed_sprite(surf)
+
+
+asteroid_atlas = IndexedSpriteCache('asteroid_atlas', max_bytes=ASTEROID_ATLAS_BUDGET)
+
+
+def asteroid_frame(size_class, shape, rotation):
+    """Nearest baked rotation frame for an asteroid, baking it on first use"""
+    step = round(rotation * ASTEROID_ROTATION_STEPS / 360) % ASTEROID_ROTATION_STEPS
+    return asteroid_atlas.get((size_class, shape, step), render_asteroid_frame, size_class, shape, step)
+
+
+def _slot_property(name, cast=float):
+    """Read-only view attribute backed by one AsteroidField array"""
+    return property(lambda self: cast(getattr(self.field, name)[self.index]))
 
 
 class Asteroid:
-    def __init__(self, x, y, size):
-        self.x = x
-        self.y = y
-        self.size = size
-        
-        if size == 'large':
-            self.radius = 40
-            self.points = 20
-        elif size == 'medium':
-            self.radius = 25
-            self.points = 50
-        else:  # small
-            self.radius = 15
-            self.points = 100
-        
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-2, 2)
-        
-        # Prevent barely-moving asteroids
-        if abs(self.vx) < 0.5:
-            self.vx = 1 if self.vx >= 0 else -1
-        if abs(self.vy) < 0.5:
-            self.vy = 1 if self.vy >= 0 else -1
-        
-        # Create irregular polygon shape
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
-        self.create_polygon()
-    
-    def create_polygon(self):
-        """Generate an irregular polygon for this asteroid"""
-        num_points = random.randint(8, 12)
-        self.polygon = []
-        
-        for i in range(num_points):
-            angle = (360 / num_points) * i + random.uniform(-15, 15)
-            distance = self.radius + random.uniform(-self.radius * 0.3, self.radius * 0.2)
-            
-            rad = math.radians(angle)
-            px = math.cos(rad) * distance
-            py = math.sin(rad) * distance
-            self.polygon.append((px, py))
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.rotation += self.rotation_speed
-        
-        # Wrap around screen
-        if self.x < 0:
-            self.x = WIDTH
-        elif self.x > WIDTH:
-            self.x = 0
-        
-        if self.y < 0:
-            self.y = HEIGHT
-        elif self.y > HEIGHT:
-            self.y = 0
-    
-    def draw(self, screen):
-        """Draw as irregular polygon with enhanced 3D shading"""
-        rad = math.radians(self.rotation)
-
-        # Rotate and translate polygon points
-        points = []
-        for px, py in self.polygon:
-            # Rotate
-            rotated_x = px * math.cos(rad) - py * math.sin(rad)
-            rotated_y = px * math.sin(rad) + py * math.cos(rad)
-
-            # Translate to asteroid position
-            points.append((self.x + rotated_x, self.y + rotated_y))
-
-        # Create color variations for 3D effect
-        base_color = current_scheme.secondary
-        dark_color = tuple(int(c * 0.3) for c in base_color)
-        shadow_color = tuple(int(c * 0.5) for c in base_color)
-        light_color = tuple(min(255, int(c * 1.2)) for c in base_color)
-        bright_color = tuple(min(255, int(c * 1.4)) for c in base_color)
-        
-        # REMOVED: ambient glow (was creating surfaces every frame)
-        # Fill with dark base
-        pygame.draw.polygon(screen, shadow_color, points, 0)
-
-        # Simplified shading - only 3 brightness levels (was 6)
-        light_direction = (-0.5, -0.7)  # Light from top-left
-
-        for i in range(len(points)):
-            p1 = points[i]
-            p2 = points[(i + 1) % len(points)]
-
-            # Calculate edge normal
-            edge_dx = p2[0] - p1[0]
-            edge_dy = p2[1] - p1[1]
-            edge_len = math.sqrt(edge_dx**2 + edge_dy**2)
-
-            if edge_len > 0:
-                normal_x = -edge_dy / edge_len
-                normal_y = edge_dx / edge_len
-
-                # Dot product with light direction
-                light_amount = normal_x * light_direction[0] + normal_y * light_direction[1]
-
-                # Simplified: only 3 lighting levels (was 6)
-                if light_amount > 0.4:
-                    # Bright edges (no glow surface)
-                    pygame.draw.line(screen, bright_color, p1, p2, 3)
-                elif light_amount > 0:
-                    pygame.draw.line(screen, light_color, p1, p2, 2)
-                else:
-                    # Shadow edges
-                    pygame.draw.line(screen, dark_color, p1, p2, 1)
-
-        # Draw main outline
-        pygame.draw.polygon(screen, base_color, points, 2)
-
-        # Add crater details with enhanced depth
-        if self.size in ['large', 'medium']:
-            num_craters = 3 if self.size == 'large' else 2
-            for i in range(num_craters):
-                crater_angle = (360 / num_craters) * i + self.rotation + random.randint(-20, 20)
-                crater_rad = math.radians(crater_angle)
-                crater_dist = self.radius * random.uniform(0.3, 0.7)
-                crater_x = self.x + math.cos(crater_rad) * crater_dist
-                crater_y = self.y + math.sin(crater_rad) * crater_dist
-                crater_size = int(self.radius * random.uniform(0.12, 0.2))
-
-                # Crater shadow (darker)
-                pygame.draw.circle(screen, dark_color, (int(crater_x + 1), int(crater_y + 1)), crater_size)
-                
-                # Dark crater interior
-                pygame.draw.circle(screen, shadow_color, (int(crater_x), int(crater_y)), crater_size)
-                
-                # Highlight on top-left edge (3D rim effect)
-                highlight_x = int(crater_x - crater_size * 0.4)
-                highlight_y = int(crater_y - crater_size * 0.4)
-                pygame.draw.arc(screen, light_color,
-                              (highlight_x, highlight_y, crater_size * 2, crater_size * 2),
-                              math.radians(200), math.radians(340), 2)
-        
-        # Add surface detail cracks for large asteroids
-        if self.size == 'large':
-            for i in range(2):
-                crack_angle = random.uniform(0, 2 * math.pi)
-                crack_start_dist = self.radius * 0.3
-                crack_end_dist = self.radius * 0.8
-                crack_start_x = self.x + math.cos(crack_angle) * crack_start_dist
-                crack_start_y = self.y + math.sin(crack_angle) * crack_start_dist
-                crack_end_x = self.x + math.cos(crack_angle) * crack_end_dist
-                crack_end_y = self.y + math.sin(crack_angle) * crack_end_dist
-                
-                pygame.draw.line(screen, dark_color, 
-                               (int(crack_start_x), int(crack_start_y)),
-                               (int(crack_end_x), int(crack_end_y)), 1)
-    
+    """Thin view of one AsteroidField slot, used by drawing and scoring code.
+
+    Views are created lazily and follow their asteroid when the field
+    compacts; index is -1 once the asteroid has been removed.
+    """
+    __slots__ = ('field', 'index')
+    x = _slot_property('x')
+    y = _slot_property('y')
+    vx = _slot_property('vx')
+    vy = _slot_property('vy')
+    rotation = _slot_property('rotation')
+    rotation_speed = _slot_property('rotation_speed')
+    radius = _slot_property('radius', int)
+    prev_x = _slot_property('prev_x')
+    prev_y = _slot_property('prev_y')
+    prev_rotation = _slot_property('prev_rotation')
+
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+
+    @property
+    def alive(self):
+        return self.index >= 0
+
+    @property
+    def size(self):
+        return ASTEROID_SIZES[self.field.size_class[self.index]]
+
+    @property
+    def points(self):
+        return int(ASTEROID_POINTS[self.field.size_class[self.index]])
+
+    @property
+    def model(self):
+        return asteroid_models()[self.field.size_class[self.index]][self.field.shape[self.index]]
+
+    @property
+    def polygon(self):
+        return self.model.vertices
+
+    def draw(self, render_queue, alpha=1.0):
+        """Queue the nearest pre-rendered rotation frame"""
+        x, y = interpolate_position(self, alpha)
+        rotation = self.prev_rotation + (self.rotation - self.prev_rotation) * alpha
+        sprite = asteroid_frame(int(self.field.size_class[self.index]), int(self.field.shape[self.index]),
+                                rotation)
+        render_queue.blit_centered(LAYER_ASTEROIDS, sprite, x, y)
+
     def split(self):
         """Create smaller asteroids"""
-        new_asteroids = []
-        
-        if self.size == 'large':
-            for _ in range(2):
-                new_asteroids.append(Asteroid(self.x, self.y, 'medium'))
-        elif self.size == 'medium':
-            for _ in range(2):
-                new_asteroids.append(Asteroid(self.x, self.y, 'small'))
-        
-        return new_asteroids
-    
+        return [self.field.view(index) for index in self.field.split([self.index])]
+
     def check_collision_bullet(self, bullet):
-        distance = math.sqrt((self.x - bullet.x)**2 + (self.y - bullet.y)**2)
-        return distance < self.radius + bullet.radius
+        return circles_overlap(self.x, self.y, self.radius, bullet.x, bullet.y, bullet.radius)
     
     def check_collision_ship(self, ship):
-        distance = math.sqrt((self.x - ship.x)**2 + (self.y - ship.y)**2)
-        return distance < self.radius + ship.radius
+        return circles_overlap(self.x, self.y, self.radius, ship.x, ship.y, ship.radius)
+
+
+class AsteroidField:
+    """Every asteroid in parallel NumPy arrays.
+
+    Movement and wrap run as one vectorized pass, splits append whole
+    batches of children, and removal compacts the arrays. Iterating the
+    field yields Asteroid views in slot order.
+    """
+    FLOAT_FIELDS = ('x', 'y', 'vx', 'vy', 'rotation', 'rotation_speed', 'radius',
+                    'prev_x', 'prev_y', 'prev_rotation')
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.size_class = np.zeros(capacity, dtype=np.int8)
+        self.shape = np.zeros(capacity, dtype=np.int16)
+        self.count = 0
+        self.views = []  # One entry per live slot, None until first requested
+
+    def _arrays(self):
+        return [getattr(self, name) for name in self.FLOAT_FIELDS] + [self.size_class, self.shape]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        # Snapshot so callers can remove or split while looping
+        return iter([self.view(i) for i in range(self.count)])
+
+    def view(self, index):
+        """Asteroid view for a slot, created on first use"""
+        asteroid = self.views[index]
+        if asteroid is None:
+            asteroid = self.views[index] = Asteroid(self, index)
+        return asteroid
+
+    def _reserve(self, extra):
+        """Grow every array (doubling) so extra more asteroids fit"""
+        needed = self.count + extra
+        if needed <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for name in self.FLOAT_FIELDS + ('size_class', 'shape'):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def spawn_many(self, xs, ys, size_class):
+        """Append asteroids at the given positions; returns their slot range.
+
+        size_class is an index into ASTEROID_SIZES, scalar or per-asteroid.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        n = len(xs)
+        if n == 0:
+            return range(self.count, self.count)
+        self._reserve(n)
+        start, end = self.count, self.count + n
+        size_class = np.broadcast_to(np.asarray(size_class, dtype=np.int8), (n,))
+
+        vx = sim_np_random.uniform(-2, 2, n)
+        vy = sim_np_random.uniform(-2, 2, n)
+        # Prevent barely-moving asteroids
+        for v in (vx, vy):
+            slow = np.abs(v) < 0.5
+            v[slow] = np.copysign(1, v[slow])
+
+        self.x[start:end] = xs
+        self.y[start:end] = ys
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.rotation[start:end] = sim_np_random.uniform(0, 360, n)
+        self.rotation_speed[start:end] = sim_np_random.uniform(-2, 2, n)
+        self.radius[start:end] = ASTEROID_RADII[size_class]
+        self.size_class[start:end] = size_class
+        self.shape[start:end] = fx_np_random.integers(0, ASTEROID_SHAPE_VARIANTS, n)
+        self.prev_x[start:end] = self.x[start:end]
+        self.prev_y[start:end] = self.y[start:end]
+        self.prev_rotation[start:end] = self.rotation[start:end]
+
+        self.count = end
+        self.views.extend([None] * n)
+        return range(start, end)
+
+    def spawn(self, x, y, size='large'):
+        """Append one asteroid and return its view"""
+        index = self.spawn_many([x], [y], ASTEROID_SIZES.index(size))[0]
+        return self.view(index)
+
+    def split(self, indices):
+        """Batch split: each large/medium slot spawns two of the next size down.
+
+        Parents stay in place for the caller to remove; small asteroids
+        produce nothing. Returns the slot range of the children.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        parents = indices[self.size_class[indices] < len(ASTEROID_SIZES) - 1]
+        parents = np.repeat(parents, 2)
+        return self.spawn_many(self.x[parents], self.y[parents], self.size_class[parents] + 1)
+
+    def update(self):
+        """Advance, spin and wrap every asteroid in one vectorized pass"""
+        n = self.count
+        x, y, rotation = self.x[:n], self.y[:n], self.rotation[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        self.prev_rotation[:n] = rotation
+        x += self.vx[:n]
+        y += self.vy[:n]
+        rotation += self.rotation_speed[:n]
+
+        # Wrap around screen
+        x[x < 0] = WIDTH
+        x[x > WIDTH] = 0
+        y[y < 0] = HEIGHT
+        y[y > HEIGHT] = 0
+
+    def render_positions(self, alpha=1.0):
+        """Interpolated x and y arrays for every live asteroid"""
+        n = self.count
+        xs, ys = self.x[:n], self.y[:n]
+        dx = xs - self.prev_x[:n]
+        dy = ys - self.prev_y[:n]
+        # Same seam rule as lerp_wrapped: snap instead of sweeping across the screen
+        xs = np.where(np.abs(dx) > WIDTH / 2, xs, self.prev_x[:n] + dx * alpha)
+        ys = np.where(np.abs(dy) > HEIGHT / 2, ys, self.prev_y[:n] + dy * alpha)
+        return xs, ys
+
+    def draw(self, render_queue, alpha=1.0):
+        """Queue every asteroid's baked frame; interpolation and frame picks are vectorized"""
+        n = self.count
+        if n == 0:
+            return
+        xs, ys = self.render_positions(alpha)
+        rotation = self.prev_rotation[:n] + (self.rotation[:n] - self.prev_rotation[:n]) * alpha
+        steps = np.rint(rotation * (ASTEROID_ROTATION_STEPS / 360)).astype(np.int64) % ASTEROID_ROTATION_STEPS
+
+        atlas = asteroid_atlas
+        append = render_queue.layers[LAYER_ASTEROIDS].append
+        for x, y, size_class, shape, step in zip(xs.astype(np.int64).tolist(), ys.astype(np.int64).tolist(),
+                                                 self.size_class[:n].tolist(), self.shape[:n].tolist(),
+                                                 steps.tolist()):
+            sprite = atlas.get((size_class, shape, step), render_asteroid_frame, size_class, shape, step)
+            half = sprite.get_width() // 2
+            append((sprite, (x - half, y - half)))
+
+    def nearest(self, x, y):
+        """View of the asteroid closest to (x, y), or None when empty"""
+        n = self.count
+        if n == 0:
+            return None
+        dist_sq = (self.x[:n] - x) ** 2 + (self.y[:n] - y) ** 2
+        return self.view(int(np.argmin(dist_sq)))
+
+    def total_points(self):
+        return int(ASTEROID_POINTS[self.size_class[:self.count]].sum())
+
+    def remove(self, asteroid):
+        """Remove one asteroid (swap with the last slot)"""
+        index, last = asteroid.index, self.count - 1
+        asteroid.index = -1
+        if index != last:
+            for array in self._arrays():
+                array[index] = array[last]
+            moved = self.views[index] = self.views[last]
+            if moved is not None:
+                moved.index = index
+        self.views.pop()
+        self.count = last
+
+    def remove_many(self, asteroids):
+        """Remove a batch of asteroids, compacting the survivors in order"""
+        if not asteroids:
+            return
+        n = self.count
+        keep = np.ones(n, dtype=bool)
+        for asteroid in asteroids:
+            keep[asteroid.index] = False
+            asteroid.index = -1
+        kept = int(keep.sum())
+        for array in self._arrays():
+            array[:kept] = array[:n][keep]
+        self.views = [view for view, alive in zip(self.views, keep.tolist()) if alive]
+        for index, view in enumerate(self.views):
+            if view is not None:
+                view.index = index
+        self.count = kept
+
+    def clear(self):
+        for view in self.views:
+            if view is not None:
+                view.index = -1
+        self.views = []
+        self.count = 0
 
 
 class UFO:
     """Enemy UFO that tracks and shoots at players"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'prev_x', 'prev_y', 'radius', 'shoot_cooldown',
+                 'shoot_delay')
     def __init__(self):
         # Spawn from edge of screen
-        side = random.choice(['left', 'right'])
+        side = sim_random.choice(['left', 'right'])
         if side == 'left':
             self.x = -20
-            self.vx = random.uniform(1, 2)
+            self.vx = sim_random.uniform(1, 2)
         else:
             self.x = WIDTH + 20
-            self.vx = random.uniform(-2, -1)
+            self.vx = sim_random.uniform(-2, -1)
         
-        self.y = random.randint(100, HEIGHT - 100)
-        self.vy = random.uniform(-1, 1)
+        self.y = sim_random.randint(100, HEIGHT - 100)
+        self.vy = sim_random.uniform(-1, 1)
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.radius = 20
         self.shoot_cooldown = 0
         self.shoot_delay = 90  # Shoots every 1.5 seconds
     
-    def update(self, ships):
+    def update(self, ships, bullets):
         """Move and shoot at nearest player"""
+        self.prev_x, self.prev_y = self.x, self.y
         self.x += self.vx
         self.y += self.vy
         
         # Gentle vertical wobble
-        self.vy += random.uniform(-0.1, 0.1)
+        self.vy += sim_random.uniform(-0.1, 0.1)
         self.vy = max(-2, min(2, self.vy))
         
         # Remove if off screen
@@ -1108,175 +2430,78 @@ class UFO:
             nearest_ship = min(ships, key=lambda s: 
                              math.sqrt((s.x - self.x)**2 + (s.y - self.y)**2))
             
-            bullet = self.shoot_at(nearest_ship)
+            bullet = self.shoot_at(nearest_ship, bullets)
             self.shoot_cooldown = self.shoot_delay
             return bullet
         
         return None
     
-    def shoot_at(self, target):
-        """Shoot in the general direction of target (not perfect aim)"""
+    def shoot_at(self, target, bullets):
+        """Shoot in the general direction of target (not perfect aim)
+
+        The caller reports the 'ufo_laser' sound event.
+        """
         dx = target.x - self.x
         dy = target.y - self.y
         angle = math.atan2(dy, dx)
         
         # Add some inaccuracy
-        angle += random.uniform(-0.3, 0.3)
+        angle += sim_random.uniform(-0.3, 0.3)
         
         speed = 5
         vx = math.cos(angle) * speed
         vy = math.sin(angle) * speed
         
-        ufo_laser_sound.play()  # Distinctive UFO laser sound
-        return UFOBullet(self.x, self.y, vx, vy)
+        return bullets.spawn(self.x, self.y, vx, vy)
     
-    def draw(self, screen):
-        """Draw UFO with enhanced 3D metallic shading and lighting"""
-        ufo_color = current_scheme.bright
-        dark_color = tuple(int(c * 0.2) for c in ufo_color)
-        shadow_color = tuple(int(c * 0.4) for c in ufo_color)
-        mid_color = tuple(int(c * 0.7) for c in ufo_color)
-        light_color = tuple(min(255, int(c * 1.2)) for c in ufo_color)
-        bright_color = tuple(min(255, int(c * 1.6)) for c in ufo_color)
-
-        # Reduced ambient glow layers from 6 to 2
-        for i in range(2, 0, -1):
-            glow_alpha = int(50 * (i / 2))
-            glow_color = (*ufo_color, glow_alpha)
-            glow_size = self.radius * 2 + i * 8
-            glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-            pygame.draw.ellipse(glow_surf, glow_color, (0, 0, glow_size, glow_size))
-            screen.blit(glow_surf, (int(self.x - glow_size // 2), int(self.y - glow_size // 2)))
-
-        # Draw shadow beneath UFO
-        shadow_rect = (int(self.x - self.radius * 0.8), int(self.y + 8), 
-                      int(self.radius * 1.6), 6)
-        shadow_surf = pygame.Surface((int(self.radius * 1.6), 6), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (*dark_color, 60), (0, 0, int(self.radius * 1.6), 6))
-        screen.blit(shadow_surf, (shadow_rect[0], shadow_rect[1]))
-
-        # Simplified saucer layers from 8 to 4
-        for layer in range(4):
-            layer_height = 12 - layer * 3
-            layer_y = int(self.y - 6 + layer * 2)
-            layer_width = int(self.radius * 2 * (1 - layer * 0.15))
-            layer_x = int(self.x - layer_width // 2)
-
-            # Metallic gradient: darker in middle, lighter on edges
-            if layer < 2:
-                color_factor = 0.4 + layer * 0.25
-            else:
-                color_factor = 0.7 + (4 - layer) * 0.1
-                
-            layer_color = tuple(int(c * color_factor) for c in ufo_color)
-
-            if layer_height > 0 and layer_width > 0:
-                pygame.draw.ellipse(screen, layer_color,
-                                  (layer_x, layer_y, layer_width, int(layer_height)), 0)
-
-        # Bright metallic rim edge
-        rim_rect = (int(self.x - self.radius), int(self.y - 6), self.radius * 2, 12)
-        pygame.draw.ellipse(screen, bright_color, rim_rect, 3)
-        
-        # Secondary rim line for depth
-        pygame.draw.ellipse(screen, light_color, 
-                          (int(self.x - self.radius * 0.9), int(self.y - 4), 
-                           int(self.radius * 1.8), 8), 1)
-
-        # Draw top dome with enhanced 3D metallic sphere effect
-        dome_rect = (int(self.x - self.radius // 2), int(self.y - self.radius // 2),
-                     self.radius, self.radius)
-
-        # Dome dark base
-        pygame.draw.ellipse(screen, shadow_color, dome_rect, 0)
-
-        # Simplified dome gradient from 4 to 2 layers
-        for i in range(2, 0, -1):
-            size_factor = 0.4 + (i / 2) * 0.4
-            color_factor = 0.5 + (i / 2) * 0.4
-            
-            gradient_rect = (int(self.x - self.radius * size_factor / 2), 
-                           int(self.y - self.radius * size_factor / 2),
-                           int(self.radius * size_factor), 
-                           int(self.radius * size_factor))
-            gradient_color = tuple(int(c * color_factor) for c in ufo_color)
-            pygame.draw.ellipse(screen, gradient_color, gradient_rect, 0)
-
-        # Bright specular highlight (metallic shine)
-        shine_rect = (int(self.x - self.radius * 0.2), int(self.y - self.radius * 0.35),
-                     int(self.radius * 0.4), int(self.radius * 0.4))
-        pygame.draw.ellipse(screen, bright_color, shine_rect, 0)
-        
-        # Super bright hot spot
-        hotspot_rect = (int(self.x - self.radius * 0.1), int(self.y - self.radius * 0.3),
-                       int(self.radius * 0.2), int(self.radius * 0.2))
-        pygame.draw.ellipse(screen, (255, 255, 255), hotspot_rect, 0)
-
-        # Dome outline with lighting
-        pygame.draw.arc(screen, bright_color, dome_rect, 0, math.pi, 3)
-        pygame.draw.arc(screen, shadow_color, dome_rect, math.pi, 2 * math.pi, 2)
-
-        # Add animated pulsing lights around the saucer
-        num_lights = 8
-        for i in range(num_lights):
-            angle = (360 / num_lights) * i + pygame.time.get_ticks() * 0.05
-            light_rad = math.radians(angle)
-            light_x = self.x + math.cos(light_rad) * self.radius * 0.85
-            light_y = self.y + math.sin(light_rad) * 3
-
-            # Pulsing effect with phase offset per light
-            pulse_offset = i * (math.pi * 2 / num_lights)
-            pulse = (math.sin(pygame.time.get_ticks() * 0.008 + pulse_offset) + 1) / 2
-
-            # Alternate between accent and primary colors
-            if i % 2 == 0:
-                light_color_choice = current_scheme.accent
-            else:
-                light_color_choice = current_scheme.primary
+    def draw(self, render_queue, alpha=1.0):
+        """Queue the baked saucer frame and search beam for the current time"""
+        x, y = interpolate_position(self, alpha)
+        ticks = pygame.time.get_ticks()
+
+        # The light ring turns ticks * 0.05 degrees and pulses at ticks * 0.008
+        # radians. A quarter turn maps light i onto light i + 2, the same image
+        # as the pulse running a quarter cycle behind, so frames span 90 degrees.
+        quarter_turns, ring_angle = divmod(ticks * 0.05, 90)
+        pulse_phase = (ticks * 0.008 - quarter_turns * math.pi / 2) % (2 * math.pi)
+        ring_step = int(ring_angle * UFO_RING_STEPS / 90)
+        pulse_step = int(pulse_phase * UFO_PULSE_STEPS / (2 * math.pi)) % UFO_PULSE_STEPS
+        sprite = ufo_sprites.get(('body', self.radius, ring_step, pulse_step), render_ufo_frame,
+                                 self.radius, ring_step, pulse_step)
+        render_queue.blit_centered(LAYER_ENEMIES, sprite, x, y)
 
-            light_intensity = 0.7 + pulse * 1.0
-            draw_glow_circle(screen, (light_x, light_y), 3, light_color_choice, intensity=light_intensity)
-        
         # Rotating search beam effect
-        beam_angle = pygame.time.get_ticks() * 0.003
-        beam_length = self.radius * 1.5
-        beam_end_x = self.x + math.cos(beam_angle) * beam_length
-        beam_end_y = self.y + math.sin(beam_angle) * beam_length
-        
-        # Draw search beam
-        beam_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        pygame.draw.line(beam_surf, (*current_scheme.accent, 40), 
-                        (int(self.x), int(self.y)), 
-                        (int(beam_end_x), int(beam_end_y)), 4)
-        screen.blit(beam_surf, (0, 0))
+        beam_step = int((ticks * 0.003) % (2 * math.pi) * UFO_BEAM_STEPS / (2 * math.pi)) % UFO_BEAM_STEPS
+        sprite = ufo_sprites.get(('beam', self.radius, beam_step), render_ufo_beam, self.radius, beam_step)
+        render_queue.blit_centered(LAYER_ENEMIES, sprite, x, y)
     
     def check_collision_bullet(self, bullet):
-        distance = math.sqrt((self.x - bullet.x)**2 + (self.y - bullet.y)**2)
-        return distance < self.radius + bullet.radius
+        return circles_overlap(self.x, self.y, self.radius, bullet.x, bullet.y, bullet.radius)
     
     def check_collision_ship(self, ship):
-        distance = math.sqrt((self.x - ship.x)**2 + (self.y - ship.y)**2)
-        return distance < self.radius + ship.radius
+        return circles_overlap(self.x, self.y, self.radius, ship.x, ship.y, ship.radius)
 
 
 class UFOBullet(Bullet):
     """UFO bullets look different with enhanced glow"""
-    def draw(self, screen):
+    __slots__ = ()
+    def draw(self, render_queue, alpha=1.0):
+        x, y = interpolate_position(self, alpha)
+
         # Draw with brighter glow for danger
-        draw_glow_circle(screen, (self.x, self.y), self.radius, current_scheme.bright, intensity=1.5)
+        queue_glow_circle(render_queue, LAYER_BULLET_GLOW, LAYER_BULLETS, (x, y), self.radius,
+                          current_scheme.bright, intensity=1.5)
 
         # Pulsing effect
         pulse = math.sin(pygame.time.get_ticks() * 0.01) * 0.5 + 0.5
-        pulse_color = (*current_scheme.bright, int(150 * pulse))
         pulse_radius = int(self.radius * (1.5 + pulse))
-
-        surf = pygame.Surface((pulse_radius * 2, pulse_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, pulse_color, (pulse_radius, pulse_radius), pulse_radius, 2)
-        screen.blit(surf, (int(self.x - pulse_radius), int(self.y - pulse_radius)))
+        render_queue.blit(LAYER_BULLETS, glow_sprite(pulse_radius, current_scheme.bright, int(150 * pulse), 2),
+                          (int(x - pulse_radius), int(y - pulse_radius)))
 
 
 class PowerUp:
     """Collectible power-ups"""
+    __slots__ = ('x', 'y', 'power_type', 'radius', 'lifetime', 'pulse', 'symbol')
     def __init__(self, x, y, power_type):
         self.x = x
         self.y = y
@@ -1308,58 +2533,15 @@ class PowerUp:
     def is_expired(self):
         return self.lifetime <= 0
     
-    def draw(self, screen):
-        # Pulsing effect
-        pulse_size = self.radius + math.sin(self.pulse) * 3
-        pulse_intensity = (math.sin(self.pulse * 2) + 1) / 2
-
-        # Use accent color for power-ups
-        color = current_scheme.accent
-        dark_color = tuple(int(c * 0.5) for c in color)
-        bright_color = tuple(min(255, int(c * 1.5)) for c in color)
-
-        # Draw glowing aura
-        for i in range(3, 0, -1):
-            aura_size = int(pulse_size + i * 4)
-            aura_alpha = int(40 * pulse_intensity * (4 - i) / 3)
-            aura_color = (*color, aura_alpha)
-
-            aura_surf = pygame.Surface((aura_size * 2, aura_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(aura_surf, aura_color, (aura_size, aura_size), aura_size)
-            screen.blit(aura_surf, (int(self.x - aura_size), int(self.y - aura_size)))
-
-        # Draw 3D circle with gradient
-        # Dark base
-        pygame.draw.circle(screen, dark_color, (int(self.x), int(self.y)), int(pulse_size), 0)
-
-        # Mid layer
-        mid_size = int(pulse_size * 0.7)
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), mid_size, 0)
-
-        # Bright center highlight
-        highlight_size = int(pulse_size * 0.4)
-        highlight_offset = int(pulse_size * 0.2)
-        pygame.draw.circle(screen, bright_color,
-                         (int(self.x - highlight_offset), int(self.y - highlight_offset)),
-                         highlight_size, 0)
-
-        # Outer ring
-        pygame.draw.circle(screen, bright_color, (int(self.x), int(self.y)), int(pulse_size), 2)
-
-        # Draw letter in center with shadow
-        font = pygame.font.Font(None, 28)
-        # Shadow
-        shadow_text = font.render(self.symbol, True, (0, 0, 0))
-        shadow_rect = shadow_text.get_rect(center=(int(self.x + 1), int(self.y + 1)))
-        screen.blit(shadow_text, shadow_rect)
-        # Main text
-        text = font.render(self.symbol, True, bright_color)
-        text_rect = text.get_rect(center=(int(self.x), int(self.y)))
-        screen.blit(text, text_rect)
-    
+    def draw(self, render_queue):
+        """Queue the baked frame for the current pulse phase"""
+        pulse_step = int(self.pulse % (2 * math.pi) * POWERUP_PULSE_STEPS / (2 * math.pi)) % POWERUP_PULSE_STEPS
+        sprite = powerup_sprites.get((self.symbol, self.radius, pulse_step), render_powerup_frame,
+                                     self.symbol, self.radius, pulse_step)
+        render_queue.blit_centered(LAYER_PICKUPS, sprite, self.x, self.y)
+    
     def check_collision_ship(self, ship):
-        distance = math.sqrt((self.x - ship.x)**2 + (self.y - ship.y)**2)
-        return distance < self.radius + ship.radius
+        return circles_overlap(self.x, self.y, self.radius, ship.x, ship.y, ship.radius)
 
 
 # ============================================================================
@@ -1368,8 +2550,13 @@ class PowerUp:
 
 class SpecialBullet(Bullet):
     """Enhanced bullet with special properties"""
+    __slots__ = ('bullet_type', 'damage', 'penetration')
     def __init__(self, x, y, vx, vy, bullet_type='normal'):
         super().__init__(x, y, vx, vy)
+        self.reset(x, y, vx, vy, bullet_type)
+
+    def reset(self, x, y, vx, vy, bullet_type='normal'):
+        super().reset(x, y, vx, vy)
         self.bullet_type = bullet_type
         self.damage = 1
         self.penetration = 1  # How many asteroids it can pierce
@@ -1390,35 +2577,111 @@ class SpecialBullet(Bullet):
             self.lifetime = 50
             self.radius = 2
     
-    def draw(self, screen):
+    def draw(self, render_queue, alpha=1.0):
         """Draw bullet with type-specific visual"""
+        x, y = interpolate_position(self, alpha)
+        glows = render_queue.layers[LAYER_BULLET_GLOW]
+        core_pos = (int(x) - self.radius - 1, int(y) - self.radius - 1)
+
         if self.bullet_type == 'piercing':
             # Blue piercing beam
             for i in range(2, 0, -1):
                 glow_radius = self.radius + i * 4
-                alpha = int(120 * (i / 2))
-                glow_color = (100, 150, 255, alpha)
-                surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, glow_color, (glow_radius, glow_radius), glow_radius)
-                screen.blit(surf, (int(self.x - glow_radius), int(self.y - glow_radius)))
-            pygame.draw.circle(screen, (150, 200, 255), (int(self.x), int(self.y)), self.radius)
+                glows.append((glow_sprite(glow_radius, (100, 150, 255), int(120 * (i / 2))),
+                              (int(x - glow_radius), int(y - glow_radius))))
+            render_queue.blit(LAYER_BULLETS, disc_sprite(self.radius, (150, 200, 255)), core_pos)
             
         elif self.bullet_type == 'explosive':
             # Red explosive shot
             for i in range(3, 0, -1):
                 glow_radius = self.radius + i * 3
-                alpha = int(100 * (i / 3))
-                glow_color = (255, 100, 50, alpha)
-                surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, glow_color, (glow_radius, glow_radius), glow_radius)
-                screen.blit(surf, (int(self.x - glow_radius), int(self.y - glow_radius)))
-            pygame.draw.circle(screen, (255, 150, 50), (int(self.x), int(self.y)), self.radius)
+                glows.append((glow_sprite(glow_radius, (255, 100, 50), int(100 * (i / 3))),
+                              (int(x - glow_radius), int(y - glow_radius))))
+            render_queue.blit(LAYER_BULLETS, disc_sprite(self.radius, (255, 150, 50)), core_pos)
             
         elif self.bullet_type == 'spread':
             # Green spread shot
-            pygame.draw.circle(screen, (100, 255, 100), (int(self.x), int(self.y)), self.radius)
+            render_queue.blit(LAYER_BULLETS, disc_sprite(self.radius, (100, 255, 100)), core_pos)
         else:
-            super().draw(screen)
+            super().draw(render_queue, alpha)
+
+
+# ============================================================================
+# BULLET POOLS - Fixed-capacity, allocation-free bullet lifecycle
+# ============================================================================
+PLAYER_BULLET_CAPACITY = 128  # Rapid-fire spread peaks around 60 live shots
+ALLY_BULLET_CAPACITY = 64
+ENEMY_BULLET_CAPACITY = 256   # Boss phase 3 spirals plus a 36-shot laser sweep
+
+
+class BulletPool:
+    """Preallocated bullets for one owner (player, ally or enemy).
+
+    Live bullets are packed at the front of `active`, so acquire and
+    release are O(1) (release swaps the last live bullet into the hole).
+    Loops that may release must walk the live range backwards.
+    """
+    def __init__(self, bullet_class, capacity, owner):
+        self.owner = owner
+        self.capacity = capacity
+        self.objects = [bullet_class(0, 0, 0, 0) for _ in range(capacity)]
+        for pool_id, bullet in enumerate(self.objects):
+            bullet.pool_id = pool_id
+        self.active = list(self.objects)
+        self.slots = list(range(capacity))  # pool_id -> position in active
+        self.count = 0
+        self.dropped = 0  # Shots refused because the pool was full
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Live bullets - for drawing; do not release while iterating"""
+        active = self.active
+        for i in range(self.count):
+            yield active[i]
+
+    @property
+    def pooled(self):
+        return self.capacity - self.count
+
+    def spawn(self, x, y, vx, vy, *args):
+        """Acquire and reset a bullet; None when the pool is exhausted"""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return None
+        bullet = self.active[self.count]
+        self.count += 1
+        bullet.live = True
+        bullet.reset(x, y, vx, vy, *args)
+        return bullet
+
+    def release(self, bullet):
+        """Return a live bullet to the pool (swap-remove)"""
+        if not bullet.live:
+            return
+        active, slots = self.active, self.slots
+        index = slots[bullet.pool_id]
+        self.count -= 1
+        last = active[self.count]
+        active[index], active[self.count] = last, bullet
+        slots[last.pool_id], slots[bullet.pool_id] = index, self.count
+        bullet.live = False
+
+    def update(self):
+        """Move every live bullet and release the expired ones"""
+        active = self.active
+        for i in range(self.count - 1, -1, -1):
+            bullet = active[i]
+            bullet.update()
+            if bullet.is_expired():
+                self.release(bullet)
+
+    def clear(self):
+        active = self.active
+        for i in range(self.count - 1, -1, -1):
+            self.release(active[i])
+        self.dropped = 0
 
 
 # ============================================================================
@@ -1427,6 +2690,10 @@ class SpecialBullet(Bullet):
 
 class Boss:
     """Epic boss encounter every 5 waves"""
+    __slots__ = ('x', 'y', 'wave', 'health', 'max_health', 'radius', 'phase', 'vx', 'rotation',
+                 'prev_x', 'prev_y', 'prev_rotation', 'shoot_timer', 'shoot_cooldown',
+                 'special_attack_timer', 'special_cooldown', 'spawn_minion_timer',
+                 'minion_cooldown')
     def __init__(self, wave):
         self.x = WIDTH // 2
         self.y = 50
@@ -1437,6 +2704,9 @@ class Boss:
         self.phase = 1  # Boss has 3 phases
         self.vx = 2
         self.rotation = 0
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.prev_rotation = 0
         self.shoot_timer = 0
         self.shoot_cooldown = 40
         self.special_attack_timer = 0
@@ -1445,6 +2715,8 @@ class Boss:
         self.minion_cooldown = 300  # 5 seconds
         
     def update(self):
+        self.prev_x, self.prev_rotation = self.x, self.rotation
+
         # Move horizontally
         self.x += self.vx
         if self.x < 100 or self.x > WIDTH - 100:
@@ -1467,11 +2739,10 @@ class Boss:
             self.phase = 2
             self.shoot_cooldown = 30
     
-    def shoot(self):
-        """Boss shooting patterns"""
+    def shoot(self, bullets):
+        """Boss shooting patterns - fires into the enemy bullet pool"""
         if self.shoot_timer >= self.shoot_cooldown:
             self.shoot_timer = 0
-            bullets = []
             
             if self.phase == 1:
                 # Phase 1: Triple shot
@@ -1479,7 +2750,7 @@ class Boss:
                     rad = math.radians(angle + 90)
                     vx = math.cos(rad) * 4
                     vy = math.sin(rad) * 4
-                    bullets.append(UFOBullet(self.x, self.y, vx, vy))
+                    bullets.spawn(self.x, self.y, vx, vy)
             
             elif self.phase == 2:
                 # Phase 2: Circular burst
@@ -1487,7 +2758,7 @@ class Boss:
                     rad = math.radians(angle)
                     vx = math.cos(rad) * 3
                     vy = math.sin(rad) * 3
-                    bullets.append(UFOBullet(self.x, self.y, vx, vy))
+                    bullets.spawn(self.x, self.y, vx, vy)
             
             else:  # Phase 3
                 # Phase 3: Spiral pattern
@@ -1496,10 +2767,7 @@ class Boss:
                     rad = math.radians(angle)
                     vx = math.cos(rad) * 4
                     vy = math.sin(rad) * 4
-                    bullets.append(UFOBullet(self.x, self.y, vx, vy))
-            
-            return bullets
-        return []
+                    bullets.spawn(self.x, self.y, vx, vy)
     
     def special_attack(self):
         """Boss special abilities"""
@@ -1520,46 +2788,33 @@ class Boss:
         self.health -= damage
         return self.health <= 0
     
-    def draw(self, screen):
-        """Draw intimidating boss ship"""
-        # Outer glow based on phase
-        phase_colors = [
-            (255, 100, 100),  # Phase 1: Red
-            (255, 150, 0),    # Phase 2: Orange
-            (255, 50, 255)    # Phase 3: Purple
-        ]
-        color = phase_colors[self.phase - 1]
-        
-        # Pulsing glow
-        pulse = abs(math.sin(self.rotation * 0.05))
-        for i in range(4, 0, -1):
-            glow_radius = self.radius + i * 10 * pulse
-            alpha = int(80 * (i / 4))
-            glow_color = (*color, alpha)
-            surf = pygame.Surface((int(glow_radius * 2), int(glow_radius * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, glow_color, (int(glow_radius), int(glow_radius)), int(glow_radius))
-            screen.blit(surf, (int(self.x - glow_radius), int(self.y - glow_radius)))
-        
+    def draw(self, render_queue, alpha=1.0):
+        """Queue the intimidating boss ship: baked glow, then hull"""
+        x, y = interpolate_position(self, alpha)
+        rotation = self.prev_rotation + (self.rotation - self.prev_rotation) * alpha
+
+        # Pulsing glow based on phase
+        pulse_step = round(abs(math.sin(rotation * 0.05)) * BOSS_PULSE_STEPS)
+        sprite = boss_sprites.get(('glow', self.phase, self.radius, pulse_step), render_boss_glow,
+                                  self.phase, self.radius, pulse_step)
+        render_queue.blit_centered(LAYER_ENEMIES, sprite, x, y)
+
         # Main body - menacing octagon
-        points = []
-        for i in range(8):
-            angle = math.radians(i * 45 + self.rotation)
-            px = self.x + math.cos(angle) * self.radius
-            py = self.y + math.sin(angle) * self.radius
-            points.append((px, py))
-        
-        pygame.draw.polygon(screen, color, points, 0)
-        pygame.draw.polygon(screen, current_scheme.bright, points, 3)
-        
-        # Inner core
-        inner_radius = self.radius * 0.4
-        pygame.draw.circle(screen, current_scheme.bright, (int(self.x), int(self.y)), int(inner_radius))
-        
+        rotation_step = round(rotation % 45 * BOSS_ROTATION_STEPS / 45) % BOSS_ROTATION_STEPS
+        sprite = boss_hull_sprites.get((self.phase, self.radius, rotation_step), render_boss_hull,
+                                       self.phase, self.radius, rotation_step)
+        render_queue.blit_centered(LAYER_ENEMIES, sprite, x, y)
+
+    def draw_health_bar(self, screen, alpha=1.0):
+        """Health bar and phase label, drawn straight to the screen over the queued sprites"""
+        x, y = interpolate_position(self, alpha)
+        color = BOSS_PHASE_COLORS[self.phase - 1]
+
         # Health bar above boss
         bar_width = 200
         bar_height = 10
-        bar_x = self.x - bar_width // 2
-        bar_y = self.y - self.radius - 30
+        bar_x = x - bar_width // 2
+        bar_y = y - self.radius - 30
         
         # Background
         pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
@@ -1571,14 +2826,11 @@ class Boss:
         pygame.draw.rect(screen, current_scheme.primary, (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Phase indicator
-        phase_text = tiny_font.render(f'PHASE {self.phase}', True, color)
-        phase_rect = phase_text.get_rect(center=(int(self.x), int(bar_y - 15)))
-        screen.blit(phase_text, phase_rect)
+        blit_text_centered(screen, tiny_font, f'PHASE {self.phase}', color, (int(x), int(bar_y - 15)))
     
     def check_collision_bullet(self, bullet):
         """Check if bullet hits boss"""
-        distance = math.sqrt((self.x - bullet.x)**2 + (self.y - bullet.y)**2)
-        return distance < self.radius
+        return circles_overlap(self.x, self.y, self.radius, bullet.x, bullet.y, 0)
 
 
 # ============================================================================
@@ -1636,17 +2888,17 @@ class EnvironmentalEvent:
         
         elif self.type == 'asteroid_storm' and self.timer % 20 == 0:
             # Spawn extra asteroids from edges
-            side = random.choice(['top', 'bottom', 'left', 'right'])
+            side = sim_random.choice(['top', 'bottom', 'left', 'right'])
             if side == 'top':
-                x, y = random.randint(0, WIDTH), 0
+                x, y = sim_random.randint(0, WIDTH), 0
             elif side == 'bottom':
-                x, y = random.randint(0, WIDTH), HEIGHT
+                x, y = sim_random.randint(0, WIDTH), HEIGHT
             elif side == 'left':
-                x, y = 0, random.randint(0, HEIGHT)
+                x, y = 0, sim_random.randint(0, HEIGHT)
             else:
-                x, y = WIDTH, random.randint(0, HEIGHT)
+                x, y = WIDTH, sim_random.randint(0, HEIGHT)
             
-            asteroids.append(Asteroid(x, y, 'small'))
+            asteroids.spawn(x, y, 'small')
     
     def can_shoot(self):
         """Check if weapons are available during event"""
@@ -1665,47 +2917,67 @@ class EnvironmentalEvent:
         if self.timer < self.warning_time:
             # Warning phase
             warning_alpha = int(200 * abs(math.sin(self.timer * 0.1)))
-            warning_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(warning_surf, (255, 0, 0, warning_alpha), (0, 0, WIDTH, HEIGHT), 10)
-            screen.blit(warning_surf, (0, 0))
+            border = event_sprites.get('warning', render_warning_border)
+            border.set_alpha(warning_alpha)
+            screen.blit(border, (0, 0))
             
             # Warning text
-            warning_text = large_font.render("WARNING!", True, (255, 50, 50))
-            warning_rect = warning_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
-            screen.blit(warning_text, warning_rect)
-            
-            event_text = font.render(self.name, True, (255, 200, 0))
-            event_rect = event_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
-            screen.blit(event_text, event_rect)
-            
-            desc_text = small_font.render(self.description, True, current_scheme.dim)
-            desc_rect = desc_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 70))
-            screen.blit(desc_text, desc_rect)
+            blit_text_centered(screen, large_font, "WARNING!", (255, 50, 50), (WIDTH // 2, HEIGHT // 2 - 50))
+            blit_text_centered(screen, font, self.name, (255, 200, 0), (WIDTH // 2, HEIGHT // 2 + 30))
+            blit_text_centered(screen, small_font, self.description, current_scheme.dim,
+                               (WIDTH // 2, HEIGHT // 2 + 70))
         else:
             # Active event indicator
             remaining = (self.duration - self.timer) / 60
-            event_text = small_font.render(f'{self.name}: {remaining:.1f}s', True, (255, 150, 0))
-            screen.blit(event_text, (WIDTH - 250, 10))
+            screen.blit(text_sprite(small_font, f'{self.name}: {remaining:.1f}s', (255, 150, 0)), (WIDTH - 250, 10))
             
             # Visual effects
             if self.type == 'gravity_well':
-                # Draw gravity well visualization
+                # Draw gravity well visualization - every ring reuses one scratch surface
                 center_x, center_y = WIDTH // 2, HEIGHT // 2
+                scratch = event_sprites.get('gravity_well', render_gravity_well_scratch)
                 for i in range(3, 0, -1):
                     pulse = abs(math.sin(self.timer * 0.1))
                     radius = 100 * i * (1 + pulse * 0.2)
                     alpha = int(50 / i)
-                    surf = pygame.Surface((int(radius * 2), int(radius * 2)), pygame.SRCALPHA)
-                    pygame.draw.circle(surf, (150, 50, 255, alpha), (int(radius), int(radius)), int(radius), 3)
-                    screen.blit(surf, (center_x - radius, center_y - radius))
+                    area = (0, 0, int(radius * 2), int(radius * 2))
+                    scratch.fill((0, 0, 0, 0), area)
+                    pygame.draw.circle(scratch, (150, 50, 255, alpha), (int(radius), int(radius)), int(radius), 3)
+                    screen.blit(scratch, (center_x - radius, center_y - radius), area)
             
             elif self.type == 'solar_flare':
                 # Overlay darkening
                 alpha = self.get_visibility_alpha()
                 if alpha > 0:
-                    dark_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                    pygame.draw.rect(dark_surf, (255, 200, 100, alpha), (0, 0, WIDTH, HEIGHT))
-                    screen.blit(dark_surf, (0, 0))
+                    glare = event_sprites.get('solar_flare', render_solar_flare_glare)
+                    glare.set_alpha(alpha)
+                    screen.blit(glare, (0, 0))
+
+
+# Full-screen event overlays are baked once at full strength; each frame
+# only sets their surface alpha
+GRAVITY_WELL_MAX_RADIUS = 360  # Outer ring (i = 3) at full pulse
+
+
+def render_warning_border():
+    surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    pygame.draw.rect(surf, (255, 0, 0), (0, 0, WIDTH, HEIGHT), 10)
+    return prepare_sprite(surf)
+
+
+def render_solar_flare_glare():
+    surf = pygame.Surface((WIDTH, HEIGHT))
+    surf.fill((255, 200, 100))
+    return surf.convert() if pygame.display.get_surface() is not None else surf
+
+
+def render_gravity_well_scratch():
+    """Canvas the rings are redrawn into each frame (cleared per ring, never reallocated)"""
+    size = GRAVITY_WELL_MAX_RADIUS * 2 + 2
+    return prepare_sprite(pygame.Surface((size, size), pygame.SRCALPHA))
+
+
+event_sprites = SpriteCache('event', max_entries=3)
 
 
 # ============================================================================
@@ -1714,14 +2986,16 @@ class EnvironmentalEvent:
 
 class AllyShip:
     """Friendly NPC that assists the player"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'type', 'radius', 'rotation', 'shoot_timer', 'lifetime',
+                 'target', 'shoot_cooldown', 'speed')
     def __init__(self, x, y, ally_type='fighter'):
         self.x = x
         self.y = y
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-2, 2)
+        self.vx = sim_random.uniform(-2, 2)
+        self.vy = sim_random.uniform(-2, 2)
         self.type = ally_type
         self.radius = 15
-        self.rotation = random.randint(0, 360)
+        self.rotation = sim_random.randint(0, 360)
         self.shoot_timer = 0
         self.lifetime = 900  # 15 seconds
         self.target = None
@@ -1742,13 +3016,7 @@ class AllyShip:
         self.shoot_timer += 1
         
         # Find nearest threat
-        min_dist = float('inf')
-        self.target = None
-        for asteroid in asteroids:
-            dist = math.sqrt((self.x - asteroid.x)**2 + (self.y - asteroid.y)**2)
-            if dist < min_dist:
-                min_dist = dist
-                self.target = asteroid
+        self.target = asteroids.nearest(self.x, self.y)
         
         # Move toward threat or player
         if self.target:
@@ -1789,7 +3057,7 @@ class AllyShip:
             target_angle = math.degrees(math.atan2(dy, dx))
             self.rotation = target_angle
     
-    def shoot(self):
+    def shoot(self, bullets):
         """Ally shoots at threats"""
         if self.shoot_timer >= self.shoot_cooldown and self.target:
             self.shoot_timer = 0
@@ -1802,38 +3070,20 @@ class AllyShip:
             if distance > 0:
                 vx = (dx / distance) * 8
                 vy = (dy / distance) * 8
-                return Bullet(self.x, self.y, vx, vy)
+                return bullets.spawn(self.x, self.y, vx, vy)
         return None
     
     def is_expired(self):
         return self.lifetime <= 0
     
-    def draw(self, screen):
-        """Draw ally ship with friendly colors"""
-        # Green glow for ally
-        for i in range(2, 0, -1):
-            glow_radius = self.radius + i * 8
-            alpha = int(100 * (i / 2))
-            glow_color = (50, 255, 50, alpha)
-            surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, glow_color, (glow_radius, glow_radius), glow_radius)
-            screen.blit(surf, (int(self.x - glow_radius), int(self.y - glow_radius)))
-        
-        # Ship body - triangle pointing toward target
-        rad = math.radians(self.rotation)
-        points = [
-            (self.x + math.cos(rad) * self.radius,
-             self.y + math.sin(rad) * self.radius),
-            (self.x + math.cos(rad + 2.5) * self.radius * 0.7,
-             self.y + math.sin(rad + 2.5) * self.radius * 0.7),
-            (self.x + math.cos(rad - 2.5) * self.radius * 0.7,
-             self.y + math.sin(rad - 2.5) * self.radius * 0.7)
-        ]
-        
-        pygame.draw.polygon(screen, (100, 255, 100), points, 0)
-        pygame.draw.polygon(screen, (150, 255, 150), points, 2)
-        
-        # Lifetime indicator (small green bar)
+    def draw(self, render_queue):
+        """Queue the baked ally frame nearest its heading"""
+        step = round(self.rotation * ALLY_ROTATION_STEPS / 360) % ALLY_ROTATION_STEPS
+        sprite = ally_sprites.get((self.radius, step), render_ally_frame, self.radius, step)
+        render_queue.blit_centered(LAYER_PICKUPS, sprite, self.x, self.y)
+
+    def draw_lifetime_bar(self, screen):
+        """Lifetime indicator (small green bar), drawn over the queued sprites"""
         bar_width = 20
         bar_height = 3
         bar_x = self.x - bar_width // 2
@@ -1842,9 +3092,9 @@ class AllyShip:
         pygame.draw.rect(screen, (50, 255, 50), (bar_x, bar_y, int(bar_width * life_percent), bar_height))
 
 
-def spawn_asteroids(count, size='large', wave=1):
-    """Create asteroids, more on higher waves with progressive difficulty"""
-    asteroids = []
+def spawn_asteroids(field, count, size='large', wave=1):
+    """Add asteroids to the field, more on higher waves with progressive difficulty"""
+    xs, ys = [], []
     # Enhanced difficulty scaling
     base_count = count
     wave_multiplier = min(1 + (wave - 1) * 0.5, 3)  # Cap at 3x
@@ -1852,131 +3102,173 @@ def spawn_asteroids(count, size='large', wave=1):
     
     for _ in range(actual_count):
         while True:
-            x = random.randint(0, WIDTH)
-            y = random.randint(0, HEIGHT)
+            x = sim_random.randint(0, WIDTH)
+            y = sim_random.randint(0, HEIGHT)
             
             # Don't spawn near center
             if abs(x - WIDTH//2) > 150 or abs(y - HEIGHT//2) > 150:
-                asteroids.append(Asteroid(x, y, size))
+                xs.append(x)
+                ys.append(y)
                 break
     
-    return asteroids
+    return field.spawn_many(xs, ys, ASTEROID_SIZES.index(size))
 
 
-def draw_grid_background(screen):
-    """Draw enhanced grid with depth layers"""
-    # Draw multiple layers of grids with different sizes for depth
-    layers = [
-        {'spacing': 80, 'alpha': 15, 'offset': pygame.time.get_ticks() * 0.005},
-        {'spacing': 40, 'alpha': 25, 'offset': pygame.time.get_ticks() * 0.01},
-        {'spacing': 20, 'alpha': 35, 'offset': pygame.time.get_ticks() * 0.015},
-    ]
+# Grid depth layers: (spacing, alpha, scroll speed in px per ms)
+GRID_LAYERS = (
+    (80, 15, 0.005),
+    (40, 25, 0.01),
+    (20, 35, 0.015),
+)
 
-    for layer in layers:
-        spacing = layer['spacing']
-        alpha = layer['alpha']
-        offset = layer['offset'] % spacing
-
-        grid_color = (*current_scheme.dim, alpha)
-
-        # Vertical lines with parallax
-        for x in range(0, WIDTH + spacing, spacing):
-            adjusted_x = int((x - offset) % WIDTH)
-            surf = pygame.Surface((1, HEIGHT), pygame.SRCALPHA)
-            surf.fill(grid_color)
-            screen.blit(surf, (adjusted_x, 0))
-
-        # Horizontal lines with parallax
-        for y in range(0, HEIGHT + spacing, spacing):
-            adjusted_y = int((y - offset) % HEIGHT)
-            surf = pygame.Surface((WIDTH, 1), pygame.SRCALPHA)
-            surf.fill(grid_color)
-            screen.blit(surf, (0, adjusted_y))
-
-
-# Create starfield for background depth
-class Star:
-    def __init__(self, layer=1):
-        self.x = random.randint(0, WIDTH)
-        self.y = random.randint(0, HEIGHT)
-        self.layer = layer  # 1=far, 2=mid, 3=near
-        
-        # Size and brightness based on layer
-        if layer == 1:  # Far stars (smallest, dimmest)
-            self.size = 1
-            self.brightness = random.uniform(0.2, 0.5)
-            self.twinkle_speed = random.uniform(0.0005, 0.001)
-        elif layer == 2:  # Mid stars
-            self.size = random.randint(1, 2)
-            self.brightness = random.uniform(0.4, 0.8)
-            self.twinkle_speed = random.uniform(0.001, 0.002)
-        else:  # Near stars (largest, brightest)
-            self.size = random.randint(2, 3)
-            self.brightness = random.uniform(0.7, 1.0)
-            self.twinkle_speed = random.uniform(0.002, 0.004)
-        
-        self.twinkle_offset = random.uniform(0, math.pi * 2)
-        
-        # Color variation for depth
-        self.color_tint = random.choice([
-            (1.0, 1.0, 1.0),      # White
-            (1.0, 0.9, 0.8),      # Warm white
-            (0.8, 0.9, 1.0),      # Cool white/blue
-            (1.0, 1.0, 0.9),      # Slightly yellow
-        ])
 
-    def draw(self, screen):
-        # Enhanced twinkling effect
-        twinkle = (math.sin(pygame.time.get_ticks() * self.twinkle_speed + self.twinkle_offset) + 1) / 2
-        current_brightness = self.brightness * (0.4 + twinkle * 0.6)
-
-        # Apply color tint
-        base_color = current_scheme.dim if self.layer == 1 else current_scheme.primary
-        color = tuple(int(c * current_brightness * tint) 
-                     for c, tint in zip(base_color, self.color_tint))
-        bright_color = tuple(min(255, int(c * current_brightness * 1.5 * tint)) 
-                            for c, tint in zip(current_scheme.primary, self.color_tint))
-
-        if self.size == 1:
-            # Tiny distant stars
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), 1)
-        elif self.size == 2:
-            # Medium stars with subtle glow
-            draw_glow_circle(screen, (self.x, self.y), 1, color, intensity=0.4)
-        else:  # size == 3, larger stars with pronounced glow and cross pattern
-            # Main glow
-            draw_glow_circle(screen, (self.x, self.y), 2, bright_color, intensity=0.8)
-            
-            # Bright core
-            pygame.draw.circle(screen, bright_color, (int(self.x), int(self.y)), 1)
-            
-            # 16-bit style star flare (cross pattern)
-            flare_length = 3 if twinkle > 0.7 else 2
-            pygame.draw.line(screen, color, 
-                           (self.x - flare_length, self.y), 
-                           (self.x + flare_length, self.y), 1)
-            pygame.draw.line(screen, color, 
-                           (self.x, self.y - flare_length), 
-                           (self.x, self.y + flare_length), 1)
+# Starfield depth layers, far to near: (count, sizes, brightness range,
+# twinkle speed range, parallax drift in px per ms)
+STAR_LAYERS = (
+    (800, (1, 1), (0.2, 0.5), (0.0005, 0.001), 0.002),  # Far: tiny, dim
+    (160, (1, 2), (0.4, 0.8), (0.001, 0.002), 0.004),   # Mid
+    (60, (2, 3), (0.7, 1.0), (0.002, 0.004), 0.008),    # Near: largest, brightest
+)
+
+
+class Starfield:
+    """Background stars stored as NumPy arrays, one slice per depth layer.
+
+    draw_layer() twinkles and drifts a whole layer in one vectorized pass.
+    Size 1 stars are written straight into the target through surfarray;
+    glowing stars are stamped from pre-baked sprites with a single blits
+    call. Colors come from the scheme's star tables, so a stamp is keyed by
+    (size, tint, brightness level, flare).
+    """
+    def __init__(self):
+        self.layers = []  # (start, end, drift) per layer
+        self.x = np.zeros(0, np.intp)
+        self.y = np.zeros(0, np.intp)
+        self.size = np.zeros(0, np.intp)
+        self.brightness = np.zeros(0, np.float32)
+        self.twinkle_speed = np.zeros(0, np.float32)
+        self.twinkle_offset = np.zeros(0, np.float32)
+        self.tint = np.zeros(0, np.intp)  # Index into STAR_TINTS
+        self.mapped_key = None
+        self.mapped = None
+
+    def __len__(self):
+        return len(self.x)
+
+    def populate(self, layers=STAR_LAYERS):
+        """Scatter a fresh sky from the fx stream"""
+        rng = fx_np_random
+        columns = {name: [] for name in ('x', 'y', 'size', 'brightness', 'twinkle_speed',
+                                         'twinkle_offset', 'tint')}
+        self.layers = []
+        start = 0
+        for count, sizes, brightness, twinkle_speed, drift in layers:
+            columns['x'].append(rng.integers(0, WIDTH, count))
+            columns['y'].append(rng.integers(0, HEIGHT, count))
+            columns['size'].append(rng.integers(sizes[0], sizes[1] + 1, count))
+            columns['brightness'].append(rng.uniform(*brightness, count))
+            columns['twinkle_speed'].append(rng.uniform(*twinkle_speed, count))
+            columns['twinkle_offset'].append(rng.uniform(0, math.pi * 2, count))
+            columns['tint'].append(rng.integers(0, len(STAR_TINTS), count))
+            self.layers.append((start, start + count, drift))
+            start += count
+        for name, parts in columns.items():
+            setattr(self, name, np.concatenate(parts).astype(getattr(self, name).dtype))
+
+    def draw_layer(self, surf, layer, now):
+        """Draw depth layer (0 = far) as it looks at now ms"""
+        start, end, drift = self.layers[layer]
+        if start == end:
+            return
+
+        # Parallax: each layer scrolls with the grid, nearer layers faster
+        shift = int(now * drift)
+        x = (self.x[start:end] - shift) % WIDTH
+        y = (self.y[start:end] - shift) % HEIGHT
+
+        # Twinkle every star at once, quantized to the scheme's star table levels
+        twinkle = (np.sin(now * self.twinkle_speed[start:end] + self.twinkle_offset[start:end]) + 1) / 2
+        brightness = self.brightness[start:end] * (0.4 + twinkle * 0.6)
+        level = (brightness * STAR_SHADE_LEVELS + 0.5).astype(np.intp)
+        tint = self.tint[start:end]
+        size = self.size[start:end]
+
+        # Tiny stars: the 2x2 block of a radius 1 circle, written as pixels
+        tiny = size == 1
+        if tiny.any():
+            colors = self.mapped_colors(surf)[int(layer == 0), tint[tiny], level[tiny]]
+            tx, ty = x[tiny], y[tiny]
+            left, top = tx - 1, ty - 1  # -1 wraps to the far edge
+            pixels = pygame.surfarray.pixels2d(surf)
+            pixels[left, top] = colors
+            pixels[tx, top] = colors
+            pixels[left, ty] = colors
+            pixels[tx, ty] = colors
+            del pixels  # Unlock surf before blitting to it
+
+        # Glowing stars: stamps for the whole layer in one lookup and one blits call
+        glowing = ~tiny
+        if glowing.any():
+            size = size[glowing]
+            flare = (twinkle[glowing] > 0.7) & (size == 3)  # Only near stars have a flare
+            keys = list(zip(size.tolist(), tint[glowing].tolist(), level[glowing].tolist(),
+                            flare.tolist()))
+            half = size + 7  # Outer halo radius: glow radius (size - 1) + 8
+            surf.blits(zip(star_stamps.get_many(keys, render_star_stamp),
+                           zip((x[glowing] - half).tolist(), (y[glowing] - half).tolist())),
+                       doreturn=False)
+
+    def mapped_colors(self, surf):
+        """The scheme's star_color_array as pixel values in surf's format"""
+        key = (current_scheme, surf.get_bitsize(), surf.get_masks())
+        if self.mapped_key != key:
+            self.mapped_key = key
+            self.mapped = pygame.surfarray.map_array(surf, current_scheme.star_color_array)
+        return self.mapped
+
+
+def render_star_stamp(size, tint, level, flare):
+    """A glowing mid (size 2) or near (size 3) star centred in its sprite"""
+    color = current_scheme.star_colors[0][tint][level]
+    half = size + 7
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    if size == 2:
+        # Medium stars with subtle glow
+        draw_glow_circle(surf, (half, half), 1, color, intensity=0.4)
+    else:  # size == 3, larger stars with pronounced glow and cross pattern
+        bright_color = current_scheme.star_glints[tint][level]
+        draw_glow_circle(surf, (half, half), 2, bright_color, intensity=0.8)
+        pygame.draw.circle(surf, bright_color, (half, half), 1)
+
+        # 16-bit style star flare (cross pattern)
+        flare_length = 3 if flare else 2
+        pygame.draw.line(surf, color, (half - flare_length, half), (half + flare_length, half), 1)
+        pygame.draw.line(surf, color, (half, half - flare_length), (half, half + flare_length), 1)
+    return prepare_sprite(surf)
+
+
+star_stamps = SpriteCache('star', max_entries=1024)  # Room for every (size, tint, level, flare) stamp, as get_many needs
 
 
 class Nebula:
     """Background nebula cloud for depth"""
+    __slots__ = ('x', 'y', 'size', 'color_type', 'alpha', 'drift_speed_x', 'drift_speed_y',
+                 'pulse_speed', 'pulse_offset')
     def __init__(self):
-        self.x = random.randint(-100, WIDTH + 100)
-        self.y = random.randint(-100, HEIGHT + 100)
-        self.size = random.randint(80, 200)
-        self.color_type = random.choice(['accent', 'secondary', 'primary'])
-        self.alpha = random.randint(5, 15)
-        self.drift_speed_x = random.uniform(-0.1, 0.1)
-        self.drift_speed_y = random.uniform(-0.1, 0.1)
-        self.pulse_speed = random.uniform(0.0005, 0.001)
-        self.pulse_offset = random.uniform(0, math.pi * 2)
+        self.x = fx_random.randint(-100, WIDTH + 100)
+        self.y = fx_random.randint(-100, HEIGHT + 100)
+        self.size = fx_random.randint(80, 200)
+        self.color_type = fx_random.choice(['accent', 'secondary', 'primary'])
+        self.alpha = fx_random.randint(5, 15)
+        self.drift_speed_x = fx_random.uniform(-0.1, 0.1)
+        self.drift_speed_y = fx_random.uniform(-0.1, 0.1)
+        self.pulse_speed = fx_random.uniform(0.0005, 0.001)
+        self.pulse_offset = fx_random.uniform(0, math.pi * 2)
     
-    def update(self):
-        # Slow drift
-        self.x += self.drift_speed_x
-        self.y += self.drift_speed_y
+    def update(self, steps=1):
+        # Slow drift (steps = 60 Hz frames elapsed)
+        self.x += self.drift_speed_x * steps
+        self.y += self.drift_speed_y * steps
         
         # Wrap around
         if self.x < -200:
@@ -2001,28 +3293,130 @@ class Nebula:
         else:
             color = current_scheme.primary
         
-        # Draw multiple layers for soft cloud effect
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        for i in range(3, 0, -1):
-            layer_size = int(self.size * (i / 3))
-            layer_alpha = int(current_alpha * (i / 3))
-            layer_color = (*color, layer_alpha)
-            pygame.draw.circle(surf, layer_color, (self.size, self.size), layer_size)
-        
+        # Soft cloud sprite is baked once; pulsing only changes the surface alpha
+        surf = nebula_sprites.get((self.size, color, self.alpha), render_nebula_sprite,
+                                  self.size, color, self.alpha)
+        surf.set_alpha(int(255 * current_alpha / self.alpha))
         screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
 
 
-# Generate optimized starfield with reduced count for performance
-stars = []
-# Layer 1: Far stars (40 tiny distant stars) - reduced from 100
-stars.extend([Star(layer=1) for _ in range(40)])
-# Layer 2: Mid stars (25 medium stars) - reduced from 60
-stars.extend([Star(layer=2) for _ in range(25)])
-# Layer 3: Near stars (15 large bright stars) - reduced from 30
-stars.extend([Star(layer=3) for _ in range(15)])
+def render_nebula_sprite(size, color, alpha):
+    """Draw multiple layers for soft cloud effect"""
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    for i in range(3, 0, -1):
+        layer_size = int(size * (i / 3))
+        layer_alpha = int(alpha * (i / 3))
+        pygame.draw.circle(surf, (*color, layer_alpha), (size, size), layer_size)
+    return prepare_sprite(surf)
+
+
+nebula_sprites = SpriteCache('nebula', max_entries=16)
+
+
+def create_starfield():
+    """Scatter the star layers and generate nebulae for atmospheric depth"""
+    starfield.populate()
+    nebulae[:] = [Nebula() for _ in range(3)]
+
+
+starfield = Starfield()
+nebulae = []  # Filled in place by create_starfield(), from init()
+
+# ============================================================================
+# BACKGROUND COMPOSITOR - Cached nebulae, starfield and grid
+# ============================================================================
+BACKGROUND_FAR_HZ = 15   # Nebulae, far and mid stars and grid (slow drift, re-composited rarely)
+BACKGROUND_NEAR_HZ = 30  # Twinkling near stars
+
+
+class BackgroundCompositor:
+    """Composites the whole background into one cached surface.
+
+    The far layers (nebulae, far stars, scrolling grid, mid stars) are
+    re-composited at far_hz into far_surface. The twinkling near stars go
+    on a copy of it at near_hz. Every frame in between costs a single opaque
+    blit. Grid lines come from one pre-baked tileable texture per layer,
+    scrolled by blit offset. Everything re-bakes when the scheme changes.
+    """
+    def __init__(self, far_hz=BACKGROUND_FAR_HZ, near_hz=BACKGROUND_NEAR_HZ):
+        self.far_interval = 1000 / far_hz
+        self.near_interval = 1000 / near_hz
+        self.far_surface = None
+        self.surface = None
+        self.grid_tiles = []
+        self.scheme = None
+        self.far_time = None
+        self.near_time = None
+
+    def invalidate(self):
+        self.far_time = self.near_time = None
+
+    def _new_surface(self):
+        surf = pygame.Surface((WIDTH, HEIGHT))
+        return surf.convert() if pygame.display.get_surface() is not None else surf
+
+    def _bake_grid_tiles(self):
+        """One texture per grid layer, a spacing larger than the screen so any offset fits"""
+        self.grid_tiles = []
+        for spacing, alpha, speed in GRID_LAYERS:
+            tile = pygame.Surface((WIDTH + spacing, HEIGHT + spacing), pygame.SRCALPHA)
+            grid_color = (*current_scheme.dim, alpha)
+            for x in range(0, WIDTH + spacing, spacing):
+                tile.fill(grid_color, (x, 0, 1, HEIGHT + spacing))
+            for y in range(0, HEIGHT + spacing, spacing):
+                tile.fill(grid_color, (0, y, WIDTH + spacing, 1))
+            self.grid_tiles.append((prepare_sprite(tile), spacing, speed))
+
+    def _composite_far(self, now):
+        surf = self.far_surface
+        surf.fill(current_scheme.bg)
+
+        # Nebulae drift at 60 steps per second whatever the refresh rate
+        steps = 0 if self.far_time is None else (now - self.far_time) * 60 / 1000
+        for nebula in nebulae:
+            nebula.update(steps)
+            nebula.draw(surf)
+
+        # Far stars first
+        starfield.draw_layer(surf, 0, now)
+
+        # Terminal grid between star layers, scrolled by offset for parallax
+        for tile, spacing, speed in self.grid_tiles:
+            offset = int(now * speed) % spacing
+            surf.blit(tile, (-offset, -offset))
+
+        # Mid stars twinkle slowly enough to refresh with the far layers
+        starfield.draw_layer(surf, 1, now)
+        self.far_time = now
+
+    def _composite_near(self, now):
+        surf = self.surface
+        surf.blit(self.far_surface, (0, 0))
+
+        # Near stars (drawn last, appear closest)
+        starfield.draw_layer(surf, 2, now)
+        self.near_time = now
+
+    def draw(self, screen):
+        now = pygame.time.get_ticks()
+        if self.surface is None:
+            self.far_surface = self._new_surface()
+            self.surface = self._new_surface()
+        if self.scheme is not current_scheme:
+            self.scheme = current_scheme
+            self._bake_grid_tiles()
+            self.invalidate()
+
+        if self.far_time is None or now - self.far_time >= self.far_interval:
+            self._composite_far(now)
+            self.near_time = None
+        if self.near_time is None or now - self.near_time >= self.near_interval:
+            self._composite_near(now)
+        screen.blit(self.surface, (0, 0))
+
+
+background = BackgroundCompositor()
 
-# Generate nebulae for atmospheric depth - reduced from 6 to 3
-nebulae = [Nebula() for _ in range(3)]
 
 
 def draw_scanlines(screen):
@@ -2065,10 +3459,25 @@ def cycle_color_scheme():
     global current_scheme_index, current_scheme
     current_scheme_index = (current_scheme_index + 1) % len(SCHEMES)
     current_scheme = SCHEMES[current_scheme_index]
+    flush_sprite_caches()
+
+
+panel_sprites = SpriteCache('panel', max_entries=32)
 
 
 def draw_terminal_panel(screen, x, y, width, height, border_color, fill_alpha=40):
-    """Draw simplified 16-bit style panel - OPTIMIZED for performance"""
+    """Draw simplified 16-bit style panel - baked once per size, colors and scheme"""
+    key = (width, height, border_color, fill_alpha, current_scheme.name)
+    screen.blit(panel_sprites.get(key, render_terminal_panel, width, height, border_color, fill_alpha), (x, y))
+
+
+def render_canvas(width, height):
+    """Blank SRCALPHA surface for drawing that is redone in place"""
+    return prepare_sprite(pygame.Surface((width, height), pygame.SRCALPHA))
+
+
+def render_terminal_panel(width, height, border_color, fill_alpha):
+    """Bake a panel: translucent fill, shine/shadow bands, glowing border and corner accents"""
     panel_surf = pygame.Surface((width, height), pygame.SRCALPHA)
 
     # Simplified: single fill instead of gradients (major performance gain)
@@ -2076,11 +3485,11 @@ def draw_terminal_panel(screen, x, y, width, height, border_color, fill_alpha=40
     pygame.draw.rect(panel_surf, fill_color, (3, 3, width - 6, height - 6))
     
     # Add simple top shine
-    top_shine = (*tuple(min(255, int(c * 1.3)) for c in current_scheme.bg), fill_alpha + 30)
+    top_shine = (*current_scheme.shades['bg', 1.3], fill_alpha + 30)
     pygame.draw.rect(panel_surf, top_shine, (3, 3, width - 6, height // 4))
     
     # Add simple bottom shadow
-    bottom_shadow = (*tuple(int(c * 0.7) for c in current_scheme.bg), fill_alpha)
+    bottom_shadow = (*current_scheme.shades['bg', 0.7], fill_alpha)
     pygame.draw.rect(panel_surf, bottom_shadow, (3, 3 * height // 4, width - 6, height // 4))
 
     # Simplified shadows - single layer only
@@ -2089,7 +3498,7 @@ def draw_terminal_panel(screen, x, y, width, height, border_color, fill_alpha=40
     pygame.draw.line(panel_surf, shadow, (3, 3), (3, height - 3))
 
     # Simplified highlights - single layer only
-    highlight_color = tuple(min(255, int(c * 1.4)) for c in border_color)
+    highlight_color = shade(border_color, 1.4)
     highlight = (*highlight_color, 150)
     pygame.draw.line(panel_surf, highlight, (3, height - 3), (width - 3, height - 3))
     pygame.draw.line(panel_surf, highlight, (width - 3, 3), (width - 3, height - 3))
@@ -2104,12 +3513,12 @@ def draw_terminal_panel(screen, x, y, width, height, border_color, fill_alpha=40
     # Main border with double line for depth
     pygame.draw.rect(panel_surf, border_color, (0, 0, width, height), 3)
     
-    inner_border_color = tuple(int(c * 0.7) for c in border_color)
+    inner_border_color = shade(border_color, 0.7)
     pygame.draw.rect(panel_surf, (*inner_border_color, 180), (3, 3, width - 6, height - 6), 1)
 
     # Simplified corner accents - just lines, no glow circles
     corner_size = 12
-    accent_bright = tuple(min(255, int(c * 1.5)) for c in border_color)
+    accent_bright = shade(border_color, 1.5)
 
     # Top-left corner
     pygame.draw.line(panel_surf, accent_bright, (0, corner_size), (0, 0), 3)
@@ -2127,18 +3536,48 @@ def draw_terminal_panel(screen, x, y, width, height, border_color, fill_alpha=40
     pygame.draw.line(panel_surf, accent_bright, (width - corner_size, height - 1), (width - 1, height - 1), 3)
     pygame.draw.line(panel_surf, accent_bright, (width - 1, height - corner_size), (width - 1, height - 1), 3)
 
-    screen.blit(panel_surf, (x, y))
+    return prepare_sprite(panel_surf)
+
+
+text_sprites = SpriteCache('text', max_entries=256)
+
+
+def render_text_sprite(font, text, color, shadow_offset):
+    """Rasterize text once, with its drop shadow composited underneath"""
+    text_surf = font.render(text, True, color)
+    if not shadow_offset:
+        return prepare_sprite(text_surf)
+    surf = pygame.Surface((text_surf.get_width() + shadow_offset, text_surf.get_height() + shadow_offset),
+                          pygame.SRCALPHA)
+    surf.blit(font.render(text, True, (0, 0, 0)), (shadow_offset, shadow_offset))
+    surf.blit(text_surf, (0, 0))
+    return prepare_sprite(surf)
+
+
+def text_sprite(font, text, color, shadow_offset=0):
+    """Cached rendered text - only strings that change ever get re-rasterized"""
+    return text_sprites.get((font, text, color, shadow_offset), render_text_sprite,
+                            font, text, color, shadow_offset)
+
+
+@functools.lru_cache(maxsize=512)
+def text_width(font, text):
+    """Pixel width of text in font, without rasterizing it"""
+    return font.size(text)[0]
+
+
+def blit_text_centered(screen, font, text, color, center, shadow_offset=0):
+    """Blit cached text centered on a point (the shadow hangs off the bottom-right)"""
+    sprite = text_sprite(font, text, color, shadow_offset)
+    screen.blit(sprite, (center[0] - (sprite.get_width() - shadow_offset) // 2,
+                         center[1] - (sprite.get_height() - shadow_offset) // 2))
 
 
 def draw_text_with_shadow(screen, text, font, x, y, color, shadow_offset=2):
     """Draw text with a subtle shadow for better readability"""
-    # Shadow
-    shadow_surf = font.render(text, True, (0, 0, 0))
-    screen.blit(shadow_surf, (x + shadow_offset, y + shadow_offset))
-    # Main text
-    text_surf = font.render(text, True, color)
-    screen.blit(text_surf, (x, y))
-    return text_surf.get_width()
+    sprite = text_sprite(font, text, color, shadow_offset)
+    screen.blit(sprite, (x, y))
+    return sprite.get_width() - shadow_offset
 
 
 def interpolate_color(color1, color2, t):
@@ -2148,46 +3587,30 @@ def interpolate_color(color1, color2, t):
 
 def create_explosion(x, y, particles, color_type='accent'):
     """Create particle explosion effect - OPTIMIZED (reduced from 30 to 15 particles)"""
-    for _ in range(15):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 8)
-        vx = math.cos(angle) * speed
-        vy = math.sin(angle) * speed
-        particles.append(Particle(x, y, vx, vy, color_type, lifetime=30))
+    if particles is None:  # Cosmetic effects disabled
+        return
+    particles.emit_burst(x, y, 15, 2, 8, color_type, lifetime=30)
 
 
-# Game setup
-ship = Ship(WIDTH//2, HEIGHT//2)
 
-asteroids = spawn_asteroids(4)
-bullets = []
-ufo_bullets = []
-particles = []
-powerups = []
-ufo = None
 
-score = 0
-lives = 3
-wave = 1
-game_over = False
+# Modern terminal fonts with better hierarchy - created by init_fonts()
+font = small_font = large_font = tiny_font = None
 
-# Hi-score system
-hiscores = load_hiscores()
-new_hiscore_rank = 0  # Track if current game made top 5 (1-5, or 0 if not)
 
-# Modern terminal fonts with better hierarchy
-font = pygame.font.Font(None, 42)
-small_font = pygame.font.Font(None, 28)
-large_font = pygame.font.Font(None, 96)
-tiny_font = pygame.font.Font(None, 20)
+def init_fonts():
+    global font, small_font, large_font, tiny_font
+    pygame.font.init()
+    font = pygame.font.Font(None, 42)
+    small_font = pygame.font.Font(None, 28)
+    large_font = pygame.font.Font(None, 96)
+    tiny_font = pygame.font.Font(None, 20)
 
 # Shooting cooldown
-shoot_cooldown = 0
 SHOOT_DELAY = 10
 RAPID_FIRE_DELAY = 5
 
 # UFO spawn timer
-ufo_spawn_timer = 0
 UFO_SPAWN_DELAY = 600  # Every 10 seconds
 
 # ============================================================================
@@ -2195,165 +3618,231 @@ UFO_SPAWN_DELAY = 600  # Every 10 seconds
 # ============================================================================
 
 # Boss system
-boss = None
 boss_wave_interval = 5  # Boss every 5 waves
 
-# Ammo system
-current_ammo_type = 'normal'
-ammo_counts = {
-    'piercing': 30,
-    'explosive': 20,
-    'spread': 50
-}
-
 # Environmental events
-current_event = None
 event_chance = 0.15  # 15% chance per wave
-last_event_wave = 0
 
 # Ally NPC system  
-allies = []
 ally_spawn_chance = 0.20  # 20% chance when taking damage
-last_ally_wave = 0
 
-# Difficulty scaling
-difficulty_multiplier = 1.0
-asteroid_speed_multiplier = 1.0
-ufo_accuracy_multiplier = 1.0
+# ============================================================================
+# GAME WORLD - Headless simulation core
+# ============================================================================
 
-# Game loop
-running = True
-while running:
-    clock.tick(60)
-    
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        
-        if event.type == pygame.KEYDOWN:
-            # Cycle color schemes
-            if event.key == pygame.K_c and not game_over:
-                cycle_color_scheme()
+class InputState:
+    """Player controls for one simulation tick (decoupled from the keyboard)"""
+    def __init__(self, left=False, right=False, thrust=False, reverse=False,
+                 fire=False, hyperspace=False):
+        self.left = left
+        self.right = right
+        self.thrust = thrust          # UP arrow
+        self.reverse = reverse        # DOWN arrow
+        self.fire = fire              # L-CTRL
+        self.hyperspace = hyperspace  # L-SHIFT
+
+    @classmethod
+    def from_keys(cls, keys):
+        """Build input state from pygame.key.get_pressed()"""
+        return cls(left=keys[pygame.K_LEFT], right=keys[pygame.K_RIGHT],
+                   thrust=keys[pygame.K_UP], reverse=keys[pygame.K_DOWN],
+                   fire=keys[pygame.K_LCTRL], hyperspace=keys[pygame.K_LSHIFT])
+
+
+class GameWorld:
+    """All gameplay state plus a pure step(inputs) -> events simulation tick.
+
+    The world never touches the display or the mixer. Anything the front end
+    should react to (sounds, game over) comes back from step() as a list of
+    event names, so thousands of games can be simulated headless at full speed.
+    """
+    def __init__(self, seed=None, particles=True):
+        # Seeding is optional: without it the world continues the current streams
+        if seed is not None:
+            seed_random(seed)
+        # Particles are pure cosmetics drawn from fx_random, so switching them
+        # off speeds up headless runs without changing any outcome
+        self.particles_enabled = particles
+        self.particles = ParticleSystem()  # Preallocated once, cleared on reset
+        # Collision broadphase grid, rebuilt every tick
+        self.asteroid_grid = SpatialHash()
+        self.asteroids = AsteroidField()  # Arrays reused across games, cleared on reset
+        # Bullets are recycled from fixed pools instead of allocated per shot;
+        # SpecialBullet covers normal and special player ammo alike
+        self.player_bullets = BulletPool(SpecialBullet, PLAYER_BULLET_CAPACITY, 'player')
+        self.ally_bullets = BulletPool(Bullet, ALLY_BULLET_CAPACITY, 'ally')
+        self.enemy_bullets = BulletPool(UFOBullet, ENEMY_BULLET_CAPACITY, 'enemy')
+        self.bullet_pools = (self.player_bullets, self.ally_bullets, self.enemy_bullets)
+        self.timer = NULL_TIMER  # PhaseTimer while the perf overlay is visible
+        self.reset()
+
+    def bullet_counts(self):
+        """(live, pooled) bullets summed over every pool, for the perf overlay"""
+        live = sum(len(pool) for pool in self.bullet_pools)
+        return live, sum(pool.capacity for pool in self.bullet_pools) - live
+
+    @property
+    def effects(self):
+        """ParticleSystem that cosmetic effects emit into (None when disabled)"""
+        return self.particles if self.particles_enabled else None
+
+    def reset(self):
+        """Start a fresh game"""
+        self.ship = Ship(WIDTH//2, HEIGHT//2)
+        self.asteroids.clear()
+        spawn_asteroids(self.asteroids, 4)
+        for pool in self.bullet_pools:
+            pool.clear()
+        self.particles.clear()
+        self.powerups = []
+        self.ufo = None
+        self.boss = None
+        self.current_event = None
+        self.allies = []
+
+        self.score = 0
+        self.lives = 3
+        self.wave = 1
+        self.game_over = False
+        self.tick = 0
 
-            # Toggle fullscreen
-            if event.key == pygame.K_F11:
-                fullscreen = not fullscreen
-                if fullscreen:
-                    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
-                else:
-                    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-
-            # Restart game
-            if event.key == pygame.K_SPACE and game_over:
-                ship = Ship(WIDTH//2, HEIGHT//2)
-                asteroids = spawn_asteroids(4)
-                bullets = []
-                ufo_bullets = []
-                particles = []
-                powerups = []
-                ufo = None
-                score = 0
-                lives = 3
-                wave = 1
-                game_over = False
-                new_hiscore_rank = 0  # Reset hi-score rank for new game
-    
-    if not game_over:
-        keys = pygame.key.get_pressed()
+        self.shoot_cooldown = 0
+        self.ufo_spawn_timer = 0
+
+        # Ammo system
+        self.current_ammo_type = 'normal'
+        self.ammo_counts = {
+            'piercing': 30,
+            'explosive': 20,
+            'spread': 50
+        }
+
+        self.last_event_wave = 0
+        self.last_ally_wave = 0
+
+        # Difficulty scaling
+        self.difficulty_multiplier = 1.0
+        self.asteroid_speed_multiplier = 1.0
+        self.ufo_accuracy_multiplier = 1.0
+
+    def step(self, inputs):
+        """Advance the simulation by one tick and return the events it produced.
+
+        Events: 'laser', 'ufo_laser', 'explosion', 'achievement', 'level_up',
+        'powerup', 'big_laser' and 'game_over'.
+        """
+        events = []
+        if self.game_over:
+            return events
+        self.tick += 1
+
+        ship = self.ship
+        particles = self.effects
+        timer = self.timer
 
         # Handle ship input
-        ship.handle_input(keys, particles)
+        ship.handle_input(inputs, particles)
 
         # Shooting (LCTRL) - Check for EMP event
         can_shoot = True
-        if current_event:
-            can_shoot = current_event.can_shoot()
-        
+        if self.current_event:
+            can_shoot = self.current_event.can_shoot()
+
         delay = RAPID_FIRE_DELAY if ship.rapid_fire else SHOOT_DELAY
 
-        if keys[pygame.K_LCTRL] and shoot_cooldown <= 0 and can_shoot:
-            # Use normal bullet or special ammo
-            if current_ammo_type != 'normal' and ammo_counts[current_ammo_type] > 0:
-                # Shoot special bullet
-                base_bullet = ship.shoot()
-                if current_ammo_type == 'spread':
-                    # Spread shot: 3 bullets in a spread pattern
-                    for angle_offset in [-15, 0, 15]:
-                        rad = math.radians(ship.angle + angle_offset)
-                        vx = math.cos(rad) * 10
-                        vy = math.sin(rad) * 10
-                        bullets.append(SpecialBullet(ship.x, ship.y, vx, vy, 'spread'))
-                else:
-                    bullets.append(SpecialBullet(base_bullet.x, base_bullet.y, 
-                                                 base_bullet.vx, base_bullet.vy, current_ammo_type))
-                ammo_counts[current_ammo_type] -= 1
-                
-                # Switch back to normal when out
-                if ammo_counts[current_ammo_type] <= 0:
-                    current_ammo_type = 'normal'
-            else:
-                bullets.append(ship.shoot())
-            
-            shoot_cooldown = delay
+        if inputs.fire and self.shoot_cooldown <= 0 and can_shoot:
+            self.fire(events)
+            self.shoot_cooldown = delay
 
-        if shoot_cooldown > 0:
-            shoot_cooldown -= 1
+        if self.shoot_cooldown > 0:
+            self.shoot_cooldown -= 1
 
         # Update ship
         ship.update()
-        
+        timer.lap('ship')
+
         # Update particles
-        for particle in particles[:]:
-            particle.update()
-            if particle.is_expired():
-                particles.remove(particle)
-        
+        self.particles.update()
+        timer.lap('particles')
+
         # Update bullets
-        for bullet in bullets[:]:
-            bullet.update()
-            if bullet.is_expired():
-                bullets.remove(bullet)
-        
-        for bullet in ufo_bullets[:]:
-            bullet.update()
-            if bullet.is_expired():
-                ufo_bullets.remove(bullet)
-        
-        # Update asteroids
-        for asteroid in asteroids:
-            asteroid.update()
-        
+        for pool in self.bullet_pools:
+            pool.update()
+        timer.lap('bullets')
+
+        # Update asteroids - one vectorized pass over the whole field
+        self.asteroids.update()
+        timer.lap('asteroids')
+
+        self.update_enemies(events)
+        timer.lap('ai')
+        self.check_collisions(events)
+
+        # New wave when all asteroids cleared (and no boss)
+        if len(self.asteroids) == 0 and not self.boss and not self.game_over:
+            self.next_wave(events)
+        timer.lap('collisions')
+
+        return events
+
+    def fire(self, events):
+        """Fire the current weapon from the player ship"""
+        ship = self.ship
+        # Use normal bullet or special ammo
+        bullets = self.player_bullets
+        if self.current_ammo_type != 'normal' and self.ammo_counts[self.current_ammo_type] > 0:
+            # Shoot special bullet
+            if self.current_ammo_type == 'spread':
+                # Spread shot: 3 bullets in a spread pattern
+                for angle_offset in [-15, 0, 15]:
+                    rad = math.radians(ship.angle + angle_offset)
+                    vx = math.cos(rad) * 10
+                    vy = math.sin(rad) * 10
+                    bullets.spawn(ship.x, ship.y, vx, vy, 'spread')
+            else:
+                ship.shoot(bullets, self.current_ammo_type)
+            self.ammo_counts[self.current_ammo_type] -= 1
+
+            # Switch back to normal when out
+            if self.ammo_counts[self.current_ammo_type] <= 0:
+                self.current_ammo_type = 'normal'
+        else:
+            ship.shoot(bullets)
+        events.append('laser')  # Cycle through different laser sounds
+
+    def update_enemies(self, events):
+        """UFO, power-ups, boss, allies and environmental events"""
+        ship = self.ship
+
         # Update UFO
-        if ufo:
-            new_bullet = ufo.update([ship])
-            if new_bullet:
-                ufo_bullets.append(new_bullet)
-            
+        if self.ufo:
+            if self.ufo.update([ship], self.enemy_bullets):
+                events.append('ufo_laser')  # Distinctive UFO laser sound
+
             # Remove UFO if off screen
-            if ufo.x < -50 or ufo.x > WIDTH + 50:
-                ufo = None
-        
+            if self.ufo.x < -50 or self.ufo.x > WIDTH + 50:
+                self.ufo = None
+
         # Spawn UFO periodically
-        ufo_spawn_timer += 1
-        if ufo_spawn_timer >= UFO_SPAWN_DELAY and not ufo:
-            ufo = UFO()
-            ufo_spawn_timer = 0
-        
+        self.ufo_spawn_timer += 1
+        if self.ufo_spawn_timer >= UFO_SPAWN_DELAY and not self.ufo:
+            self.ufo = UFO()
+            self.ufo_spawn_timer = 0
+
         # Update power-ups
-        for powerup in powerups[:]:
+        for powerup in self.powerups[:]:
             powerup.update()
             if powerup.is_expired():
-                powerups.remove(powerup)
-        
+                self.powerups.remove(powerup)
+
         # Update boss
+        boss = self.boss
         if boss:
             boss.update()
-            
+
             # Boss shooting
-            new_bullets = boss.shoot()
-            ufo_bullets.extend(new_bullets)
-            
+            boss.shoot(self.enemy_bullets)
+
             # Boss special attacks
             special = boss.special_attack()
             if special == 'laser_sweep':
@@ -2362,9 +3851,9 @@ while running:
                     rad = math.radians(angle)
                     vx = math.cos(rad) * 6
                     vy = math.sin(rad) * 6
-                    ufo_bullets.append(UFOBullet(boss.x, boss.y, vx, vy))
-                play_explosion_sound()
-            
+                    self.enemy_bullets.spawn(boss.x, boss.y, vx, vy)
+                events.append('explosion')
+
             # Boss spawn minions
             if boss.spawn_minions():
                 for i in range(3):
@@ -2372,524 +3861,1025 @@ while running:
                     rad = math.radians(angle)
                     x = boss.x + math.cos(rad) * 100
                     y = boss.y + math.sin(rad) * 100
-                    asteroids.append(Asteroid(x, y, 'medium'))
-        
+                    self.asteroids.spawn(x, y, 'medium')
+
         # Update ally ships
-        for ally in allies[:]:
-            ally.update(asteroids, ship)
-            ally_bullet = ally.shoot()
-            if ally_bullet:
-                bullets.append(ally_bullet)
+        for ally in self.allies[:]:
+            ally.update(self.asteroids, ship)
+            ally.shoot(self.ally_bullets)
             if ally.is_expired():
-                allies.remove(ally)
-        
+                self.allies.remove(ally)
+
         # Update environmental event
-        if current_event:
-            current_event.update(ship, asteroids)
-            if not current_event.active:
-                current_event = None
-        
+        if self.current_event:
+            self.current_event.update(ship, self.asteroids)
+            if not self.current_event.active:
+                self.current_event = None
+
+    def check_collisions(self, events):
+        """Resolve every collision for this tick"""
+        asteroids = self.asteroids
+        particles = self.effects
+
+        # Broadphase: bucket asteroids into the grid once, then every bullet
+        # only narrow-phase tests the few asteroids sharing its cells
+        grid = self.asteroid_grid
+        grid.clear()
+        n = len(asteroids)
+        grid.insert_many(asteroids, asteroids.x[:n], asteroids.y[:n], asteroids.radius[:n])
+        destroyed = set()  # Asteroids split this tick (still in the grid)
+
         # Check bullet-asteroid collisions
-        for bullet in bullets[:]:
-            hit = False
-            for asteroid in asteroids[:]:
-                if asteroid.check_collision_bullet(bullet):
-                    if bullet in bullets:
-                        bullets.remove(bullet)
-
-                    score += asteroid.points
-                    
-                    # Particle explosion
-                    create_explosion(asteroid.x, asteroid.y, particles)
-                    play_explosion_sound()  # Random explosion variety
-                    
-                    # Split asteroid
-                    new_asteroids = asteroid.split()
-                    asteroids.remove(asteroid)
-                    asteroids.extend(new_asteroids)
-                    
-                    # Chance to spawn power-up from destroyed asteroid
-                    if random.random() < 0.1:  # 10% chance
-                        power_type = random.choice(['rapid_fire', 'shield', 'bomb'])
-                        powerups.append(PowerUp(asteroid.x, asteroid.y, power_type))
-                    
-                    hit = True
-                    break
-            
-            # Check bullet-UFO collision
-            if not hit and ufo:
-                if ufo.check_collision_bullet(bullet):
-                    if bullet in bullets:
-                        bullets.remove(bullet)
-
-                    score += 500  # Big points for UFO
-
-                    create_explosion(ufo.x, ufo.y, particles, 'bright')
-                    play_explosion_sound()  # Big explosion
-                    play_achievement_sound()  # Bonus achievement sound for high value target!
-                    ufo = None
-            
-            # Check bullet-Boss collision
-            if not hit and boss:
-                if boss.check_collision_bullet(bullet):
-                    if bullet in bullets:
-                        bullets.remove(bullet)
-                    
-                    # Boss takes damage
-                    damage = getattr(bullet, 'damage', 1)
-                    if boss.take_damage(damage):
-                        # Boss defeated!
-                        score += 5000 + (wave // 5) * 2000  # Huge points
-                        create_explosion(boss.x, boss.y, particles, 'bright')
-                        for i in range(10):  # Multiple explosions
-                            offset_x = random.randint(-30, 30)
-                            offset_y = random.randint(-30, 30)
-                            create_explosion(boss.x + offset_x, boss.y + offset_y, particles, 'accent')
-                        play_explosion_sound()
-                        play_achievement_sound()
-                        boss = None
-                        # Grant extra life for boss kill
-                        lives += 1
-                    else:
-                        # Boss hit but not dead
-                        create_explosion(bullet.x, bullet.y, particles)
-        
+        for pool in (self.player_bullets, self.ally_bullets):
+            active = pool.active
+            # Walk backwards: a release swaps the last live bullet into this slot
+            for index in range(pool.count - 1, -1, -1):
+                bullet = active[index]
+                hit = False
+                for asteroid in grid.query(bullet.x, bullet.y, bullet.radius):
+                    if asteroid in destroyed:
+                        continue
+                    if asteroid.check_collision_bullet(bullet):
+                        pool.release(bullet)
+
+                        self.score += asteroid.points
+
+                        # Particle explosion
+                        create_explosion(asteroid.x, asteroid.y, particles)
+                        events.append('explosion')  # Random explosion variety
+
+                        # Split asteroid - fragments are hittable by later bullets this tick
+                        new_asteroids = asteroid.split()
+                        destroyed.add(asteroid)
+                        for fragment in new_asteroids:
+                            grid.insert(fragment, fragment.x, fragment.y, fragment.radius)
+
+                        # Chance to spawn power-up from destroyed asteroid
+                        if sim_random.random() < 0.1:  # 10% chance
+                            power_type = sim_random.choice(['rapid_fire', 'shield', 'bomb'])
+                            self.powerups.append(PowerUp(asteroid.x, asteroid.y, power_type))
+
+                        hit = True
+                        break
+
+                # Check bullet-UFO collision
+                if not hit and self.ufo:
+                    if self.ufo.check_collision_bullet(bullet):
+                        pool.release(bullet)
+
+                        self.score += 500  # Big points for UFO
+
+                        create_explosion(self.ufo.x, self.ufo.y, particles, 'bright')
+                        events.append('explosion')  # Big explosion
+                        events.append('achievement')  # Bonus achievement sound for high value target!
+                        self.ufo = None
+
+                # Check bullet-Boss collision
+                boss = self.boss
+                if not hit and boss:
+                    if boss.check_collision_bullet(bullet):
+                        pool.release(bullet)
+
+                        # Boss takes damage
+                        damage = getattr(bullet, 'damage', 1)
+                        if boss.take_damage(damage):
+                            # Boss defeated!
+                            self.score += 5000 + (self.wave // 5) * 2000  # Huge points
+                            create_explosion(boss.x, boss.y, particles, 'bright')
+                            for i in range(10):  # Multiple explosions
+                                offset_x = fx_random.randint(-30, 30)
+                                offset_y = fx_random.randint(-30, 30)
+                                create_explosion(boss.x + offset_x, boss.y + offset_y, particles, 'accent')
+                            events.append('explosion')
+                            events.append('achievement')
+                            self.boss = None
+                            # Grant extra life for boss kill
+                            self.lives += 1
+                        else:
+                            # Boss hit but not dead
+                            create_explosion(bullet.x, bullet.y, particles)
+
+        # Drop split asteroids in one compaction instead of a removal per hit
+        asteroids.remove_many(destroyed)
+
+        ship = self.ship
+
         # Check ship-asteroid collisions
         if not ship.invulnerable and not ship.shield:
-            for asteroid in asteroids[:]:
+            for asteroid in grid.query(ship.x, ship.y, ship.radius):
+                if asteroid in destroyed:
+                    continue
                 if asteroid.check_collision_ship(ship):
-                    lives -= 1
-
                     # Explosion
                     create_explosion(ship.x, ship.y, particles, 'accent')
-                    play_explosion_sound()  # Ship destruction
+                    events.append('explosion')  # Ship destruction
 
                     # Remove asteroid
                     asteroids.remove(asteroid)
 
-                    # Reset ship
-                    ship = Ship(WIDTH//2, HEIGHT//2)
-                    ship.invulnerable = True
-                    ship.invulnerable_timer = 120  # 2 seconds
-                    
-                    # Chance to spawn ally backup!
-                    if wave > 2 and wave - last_ally_wave >= 2:  # Cooldown
-                        if random.random() < ally_spawn_chance:
-                            ally_type = random.choice(['fighter', 'bomber', 'defender'])
-                            allies.append(AllyShip(random.randint(100, WIDTH-100), 50, ally_type))
-                            last_ally_wave = wave
-                            play_achievement_sound()  # Ally arrival sound
-
-                    if lives <= 0:
-                        game_over = True
-                        # Update hi-scores when game ends
-                        hiscores, new_hiscore_rank = update_hiscores(score)
-
+                    self.lose_life(events, ally_backup=True)
+                    ship = self.ship  # The respawned ship is invulnerable
                     break
-        
-        # Check UFO bullet-ship collisions
-        if not ship.invulnerable and not ship.shield:
-            for bullet in ufo_bullets[:]:
-                distance = math.sqrt((ship.x - bullet.x)**2 + (ship.y - bullet.y)**2)
-                if distance < ship.radius + bullet.radius:
-                    if bullet in ufo_bullets:
-                        ufo_bullets.remove(bullet)
 
-                    lives -= 1
+        # Check UFO bullet-ship collisions - a single query point, so a straight
+        # squared-distance scan is cheaper than bucketing every bullet
+        if not ship.invulnerable and not ship.shield:
+            for bullet in self.enemy_bullets:
+                if circles_overlap(ship.x, ship.y, ship.radius, bullet.x, bullet.y, bullet.radius):
+                    self.enemy_bullets.release(bullet)
 
                     create_explosion(ship.x, ship.y, particles, 'accent')
-                    play_explosion_sound()  # Ship hit by UFO
-
-                    ship = Ship(WIDTH//2, HEIGHT//2)
-                    ship.invulnerable = True
-                    ship.invulnerable_timer = 120
-                    
-                    # Chance to spawn ally backup!
-                    if wave > 2 and wave - last_ally_wave >= 2:
-                        if random.random() < ally_spawn_chance:
-                            ally_type = random.choice(['fighter', 'bomber', 'defender'])
-                            allies.append(AllyShip(random.randint(100, WIDTH-100), 50, ally_type))
-                            last_ally_wave = wave
-                            play_achievement_sound()
-
-                    if lives <= 0:
-                        game_over = True
-                        # Update hi-scores when game ends
-                        hiscores, new_hiscore_rank = update_hiscores(score)
+                    events.append('explosion')  # Ship hit by UFO
 
+                    self.lose_life(events, ally_backup=True)
+                    ship = self.ship  # The respawned ship is invulnerable
                     break
-        
-        # Check ship-UFO collision
-        if ufo and not ship.invulnerable and not ship.shield:
-            if ufo.check_collision_ship(ship):
-                lives -= 1
 
+        # Check ship-UFO collision
+        if self.ufo and not ship.invulnerable and not ship.shield:
+            if self.ufo.check_collision_ship(ship):
                 create_explosion(ship.x, ship.y, particles, 'accent')
-                create_explosion(ufo.x, ufo.y, particles, 'bright')
-                play_explosion_sound()  # Double explosion - mutual destruction!
-                play_explosion_sound()  # Play twice for dramatic effect
+                create_explosion(self.ufo.x, self.ufo.y, particles, 'bright')
+                events.append('explosion')  # Double explosion - mutual destruction!
+                events.append('explosion')  # Play twice for dramatic effect
 
-                ufo = None
+                self.ufo = None
 
-                ship = Ship(WIDTH//2, HEIGHT//2)
-                ship.invulnerable = True
-                ship.invulnerable_timer = 120
+                self.lose_life(events, ally_backup=False)
+                ship = self.ship
 
-                if lives <= 0:
-                    game_over = True
-                    # Update hi-scores when game ends
-                    hiscores, new_hiscore_rank = update_hiscores(score)
-        
-        # Check power-up collisions
-        for powerup in powerups[:]:
+        # Check power-up collisions (a handful at most - narrow phase only)
+        for powerup in self.powerups[:]:
             if powerup.check_collision_ship(ship):
-                powerups.remove(powerup)
-
-                if powerup.power_type == 'rapid_fire':
-                    powerup_sound.play()
-                    ship.rapid_fire = True
-                    ship.rapid_fire_timer = 300  # 5 seconds
-                elif powerup.power_type == 'shield':
-                    powerup_sound.play()
-                    ship.shield = True
-                    ship.shield_timer = 300
-                elif powerup.power_type in ['piercing', 'explosive', 'spread']:
-                    # Ammo pickup
-                    powerup_sound.play()
-                    current_ammo_type = powerup.power_type
-                    if powerup.power_type == 'piercing':
-                        ammo_counts['piercing'] = min(ammo_counts['piercing'] + 30, 60)
-                    elif powerup.power_type == 'explosive':
-                        ammo_counts['explosive'] = min(ammo_counts['explosive'] + 20, 40)
-                    elif powerup.power_type == 'spread':
-                        ammo_counts['spread'] = min(ammo_counts['spread'] + 50, 100)
-                elif powerup.power_type == 'bomb':  # bomb - screen clear!
-                    big_laser_sound.play()  # Epic bomb sound
-                    # Destroy all asteroids and create massive particle effects
-                    for asteroid in asteroids[:]:
-                        create_explosion(asteroid.x, asteroid.y, particles)
-                        score += asteroid.points
-                    asteroids.clear()
-                    # Destroy UFO if present
-                    if ufo:
-                        create_explosion(ufo.x, ufo.y, particles)
-                        score += 200
-                        ufo = None
-                    # Damage boss heavily if present
-                    if boss:
-                        if boss.take_damage(50):  # Massive damage
-                            score += 5000 + (wave // 5) * 2000
-                            create_explosion(boss.x, boss.y, particles, 'bright')
-                            boss = None
-                            lives += 1
-                        else:
-                            create_explosion(boss.x, boss.y, particles)
-
+                self.powerups.remove(powerup)
+                self.collect_powerup(powerup, events)
                 break
-        
-        # New wave when all asteroids cleared (and no boss)
-        if len(asteroids) == 0 and not boss:
-            wave += 1
-            play_level_up_sound()  # Celebrate wave completion!
-            
-            # Progressive difficulty increase
-            difficulty_multiplier = 1.0 + (wave - 1) * 0.1  # 10% per wave
-            asteroid_speed_multiplier = 1.0 + (wave - 1) * 0.05  # 5% per wave
-            ufo_accuracy_multiplier = 1.0 + (wave - 1) * 0.08  # 8% per wave
-            
-            # Boss encounter every 5 waves
-            if wave % boss_wave_interval == 0:
-                boss = Boss(wave)
-                play_achievement_sound()  # Boss arrival sound!
-            else:
-                asteroids = spawn_asteroids(4, 'large', wave)
-                
-                # Chance for environmental event (not during boss waves)
-                if wave > 3 and wave - last_event_wave >= 3:  # Cooldown between events
-                    if random.random() < event_chance:
-                        event_types = ['asteroid_storm', 'gravity_well', 'emp_pulse', 'solar_flare', 'meteor_shower']
-                        current_event = EnvironmentalEvent(random.choice(event_types))
-                        last_event_wave = wave
-                
-                # Random ammo drop
-                if wave % 3 == 0:  # Every 3 waves
-                    ammo_type = random.choice(['piercing', 'explosive', 'spread'])
-                    powerups.append(PowerUp(WIDTH // 2, HEIGHT // 2, ammo_type))
-    
-    # Drawing
-    screen.fill(current_scheme.bg)
-
-    # Update and draw nebulae (deepest background layer)
-    for nebula in nebulae:
-        nebula.update()
-        nebula.draw(screen)
-
-    # Draw starfield in layers for parallax depth
-    # Layer 1: Far stars first
-    for star in stars:
-        if star.layer == 1:
-            star.draw(screen)
-    
-    # Draw terminal grid effects between star layers
-    draw_grid_background(screen)
-    
-    # Layer 2: Mid stars
-    for star in stars:
-        if star.layer == 2:
-            star.draw(screen)
-    
-    # Layer 3: Near stars (drawn last, appear closest)
-    for star in stars:
-        if star.layer == 3:
-            star.draw(screen)
-
-    if not game_over:
-        # Draw particles first (background layer)
-        for particle in particles:
-            particle.draw(screen)
-        
-        # Draw asteroids
-        for asteroid in asteroids:
-            asteroid.draw(screen)
-        
-        # Draw UFO
-        if ufo:
-            ufo.draw(screen)
-        
-        # Draw boss
-        if boss:
-            boss.draw(screen)
-        
-        # Draw bullets
-        for bullet in bullets:
-            bullet.draw(screen)
-        
-        for bullet in ufo_bullets:
-            bullet.draw(screen)
-        
-        # Draw power-ups
-        for powerup in powerups:
-            powerup.draw(screen)
-        
-        # Draw ally ships
-        for ally in allies:
-            ally.draw(screen)
-
-        # Draw ship
-        ship.draw(screen)
-        
-        # Draw environmental event overlay
-        if current_event:
-            current_event.draw(screen)
-        
-        # CRT effects removed - was causing visual artifacts in center of screen
-        # draw_scanlines(screen)
-        # draw_vignette(screen)
-
-        # Draw modern HUD with panels
-        # Top-left info panel
-        panel_width = 280
-        panel_height = 110
-        draw_terminal_panel(screen, 10, 10, panel_width, panel_height, current_scheme.primary, fill_alpha=80)
-
-        # Score
-        draw_text_with_shadow(screen, 'SCORE', tiny_font, 25, 20, current_scheme.dim)
-        draw_text_with_shadow(screen, f'{score:,}', font, 25, 40, current_scheme.primary)
-
-        # Lives
-        draw_text_with_shadow(screen, 'LIVES', tiny_font, 25, 75, current_scheme.dim)
-        for i in range(lives):
-            # Draw small ship icons
-            ship_x = 25 + i * 30
-            ship_y = 100
-            # Draw mini triangle
-            nose_x = ship_x + 8
-            nose_y = ship_y - 5
-            left_x = ship_x
-            left_y = ship_y + 5
-            right_x = ship_x + 16
-            right_y = ship_y + 5
-            pygame.draw.polygon(screen, current_scheme.primary,
-                              [(nose_x, nose_y), (left_x, left_y), (right_x, right_y)], 2)
-
-        # Top-center wave panel
-        wave_panel_width = 240
-        draw_terminal_panel(screen, WIDTH//2 - wave_panel_width//2, 10, wave_panel_width, 110,
-                          current_scheme.accent, fill_alpha=80)
-
-        # Wave counter
-        draw_text_with_shadow(screen, 'WAVE', tiny_font, WIDTH//2 - 30, 20, current_scheme.dim)
-        draw_text_with_shadow(screen, f'{wave}', large_font, WIDTH//2 - 30, 35, current_scheme.accent)
-
-        # Scheme name
-        scheme_width = small_font.render(current_scheme.name, True, current_scheme.dim).get_width()
-        draw_text_with_shadow(screen, current_scheme.name, tiny_font,
-                            WIDTH//2 - scheme_width//2 - 10, 90, current_scheme.dim)
-        
-        # Ammo/Weapon indicator (top-right corner) 
-        ammo_panel_width = 200
-        ammo_panel_height = 90
-        draw_terminal_panel(screen, WIDTH - ammo_panel_width - 10, 10,
-                          ammo_panel_width, ammo_panel_height,
-                          current_scheme.secondary, fill_alpha=80)
-        
-        draw_text_with_shadow(screen, 'WEAPON', tiny_font, WIDTH - 190, 20, current_scheme.dim)
-        if current_ammo_type == 'normal':
-            draw_text_with_shadow(screen, 'STANDARD', small_font, WIDTH - 190, 40, current_scheme.primary)
-            draw_text_with_shadow(screen, '∞', font, WIDTH - 190, 60, current_scheme.accent)
+
+    def lose_life(self, events, ally_backup):
+        """Respawn the ship after a hit, maybe call in an ally, end the game at zero lives"""
+        self.lives -= 1
+
+        # Reset ship
+        self.ship = Ship(WIDTH//2, HEIGHT//2)
+        self.ship.invulnerable = True
+        self.ship.invulnerable_timer = 120  # 2 seconds
+
+        # Chance to spawn ally backup!
+        if ally_backup and self.wave > 2 and self.wave - self.last_ally_wave >= 2:  # Cooldown
+            if sim_random.random() < ally_spawn_chance:
+                ally_type = sim_random.choice(['fighter', 'bomber', 'defender'])
+                self.allies.append(AllyShip(sim_random.randint(100, WIDTH-100), 50, ally_type))
+                self.last_ally_wave = self.wave
+                events.append('achievement')  # Ally arrival sound
+
+        if self.lives <= 0:
+            self.game_over = True
+            events.append('game_over')
+
+    def collect_powerup(self, powerup, events):
+        """Apply a collected power-up to the ship/world"""
+        ship = self.ship
+        particles = self.effects
+
+        if powerup.power_type == 'rapid_fire':
+            events.append('powerup')
+            ship.rapid_fire = True
+            ship.rapid_fire_timer = 300  # 5 seconds
+        elif powerup.power_type == 'shield':
+            events.append('powerup')
+            ship.shield = True
+            ship.shield_timer = 300
+        elif powerup.power_type in ['piercing', 'explosive', 'spread']:
+            # Ammo pickup
+            events.append('powerup')
+            self.current_ammo_type = powerup.power_type
+            if powerup.power_type == 'piercing':
+                self.ammo_counts['piercing'] = min(self.ammo_counts['piercing'] + 30, 60)
+            elif powerup.power_type == 'explosive':
+                self.ammo_counts['explosive'] = min(self.ammo_counts['explosive'] + 20, 40)
+            elif powerup.power_type == 'spread':
+                self.ammo_counts['spread'] = min(self.ammo_counts['spread'] + 50, 100)
+        elif powerup.power_type == 'bomb':  # bomb - screen clear!
+            events.append('big_laser')  # Epic bomb sound
+            # Destroy all asteroids and create massive particle effects
+            field = self.asteroids
+            if particles is not None:
+                for x, y in zip(field.x[:len(field)].tolist(), field.y[:len(field)].tolist()):
+                    create_explosion(x, y, particles)
+            self.score += field.total_points()
+            field.clear()
+            # Destroy UFO if present
+            if self.ufo:
+                create_explosion(self.ufo.x, self.ufo.y, particles)
+                self.score += 200
+                self.ufo = None
+            # Damage boss heavily if present
+            boss = self.boss
+            if boss:
+                if boss.take_damage(50):  # Massive damage
+                    self.score += 5000 + (self.wave // 5) * 2000
+                    create_explosion(boss.x, boss.y, particles, 'bright')
+                    self.boss = None
+                    self.lives += 1
+                else:
+                    create_explosion(boss.x, boss.y, particles)
+
+    def next_wave(self, events):
+        """Advance to the next wave: difficulty, boss, events and ammo drops"""
+        self.wave += 1
+        wave = self.wave
+        events.append('level_up')  # Celebrate wave completion!
+
+        # Progressive difficulty increase
+        self.difficulty_multiplier = 1.0 + (wave - 1) * 0.1  # 10% per wave
+        self.asteroid_speed_multiplier = 1.0 + (wave - 1) * 0.05  # 5% per wave
+        self.ufo_accuracy_multiplier = 1.0 + (wave - 1) * 0.08  # 8% per wave
+
+        # Boss encounter every 5 waves
+        if wave % boss_wave_interval == 0:
+            self.boss = Boss(wave)
+            events.append('achievement')  # Boss arrival sound!
         else:
-            ammo_names = {'piercing': 'PIERCING', 'explosive': 'EXPLOSIVE', 'spread': 'SPREAD'}
-            ammo_colors = {'piercing': (100, 150, 255), 'explosive': (255, 150, 50), 'spread': (100, 255, 100)}
-            draw_text_with_shadow(screen, ammo_names[current_ammo_type], small_font, 
-                                WIDTH - 190, 40, ammo_colors[current_ammo_type])
-            draw_text_with_shadow(screen, f'{ammo_counts[current_ammo_type]}', font,
-                                WIDTH - 190, 60, ammo_colors[current_ammo_type])
-
-        # Power-up indicators (below ammo panel)
-        if ship.rapid_fire or ship.shield:
-            powerup_panel_width = 200
-            powerup_panel_height = 60 if (ship.rapid_fire and ship.shield) else 40
-            draw_terminal_panel(screen, WIDTH - powerup_panel_width - 10, 110,
-                              powerup_panel_width, powerup_panel_height,
-                              current_scheme.bright, fill_alpha=100)
-
-            y_offset = 118
-            if ship.rapid_fire:
-                draw_text_with_shadow(screen, '⚡ RAPID FIRE', small_font,
-                                    WIDTH - powerup_panel_width + 5, y_offset, current_scheme.accent)
-                y_offset += 30
-
-            if ship.shield:
-                draw_text_with_shadow(screen, '🛡 SHIELD', small_font,
-                                    WIDTH - powerup_panel_width + 5, y_offset, current_scheme.bright)
-
-        # Bottom status bar - show ally count and difficulty
-        status_panel_height = 60
-        draw_terminal_panel(screen, 10, HEIGHT - status_panel_height - 50,
-                          WIDTH - 20, status_panel_height, current_scheme.dim, fill_alpha=60)
-        
-        # Ally count
-        if len(allies) > 0:
-            ally_text = f'ALLIES: {len(allies)}'
-            draw_text_with_shadow(screen, ally_text, tiny_font, 25, HEIGHT - 85, (100, 255, 100))
-        
-        # Difficulty multiplier
-        diff_text = f'DIFFICULTY: x{difficulty_multiplier:.1f}'
-        diff_color = current_scheme.accent if difficulty_multiplier < 2.0 else (255, 100, 100)
-        draw_text_with_shadow(screen, diff_text, tiny_font, 150, HEIGHT - 85, diff_color)
-        
-        # Boss warning
-        if wave % boss_wave_interval == boss_wave_interval - 1:
-            warning_text = '⚠ BOSS INCOMING NEXT WAVE ⚠'
-            draw_text_with_shadow(screen, warning_text, small_font,
-                                WIDTH//2 - 150, HEIGHT - 80, (255, 50, 50))
-        
-        # Bottom controls bar
-        controls_panel_height = 40
-        draw_terminal_panel(screen, 10, HEIGHT - controls_panel_height - 10,
-                          WIDTH - 20, controls_panel_height, current_scheme.dim, fill_alpha=60)
-
-        controls_text = '↑: Thrust  ↓: Reverse  ←→: Rotate  |  L-CTRL: Shoot  |  L-SHIFT: Warp  |  C: Color  |  F11: Fullscreen'
-        controls_width = tiny_font.render(controls_text, True, current_scheme.dim).get_width()
-        draw_text_with_shadow(screen, controls_text, tiny_font,
-                            WIDTH//2 - controls_width//2, HEIGHT - 35, current_scheme.dim, shadow_offset=1)
+            spawn_asteroids(self.asteroids, 4, 'large', wave)
+
+            # Chance for environmental event (not during boss waves)
+            if wave > 3 and wave - self.last_event_wave >= 3:  # Cooldown between events
+                if sim_random.random() < event_chance:
+                    event_types = ['asteroid_storm', 'gravity_well', 'emp_pulse', 'solar_flare', 'meteor_shower']
+                    self.current_event = EnvironmentalEvent(sim_random.choice(event_types))
+                    self.last_event_wave = wave
+
+            # Random ammo drop
+            if wave % 3 == 0:  # Every 3 waves
+                ammo_type = sim_random.choice(['piercing', 'explosive', 'spread'])
+                self.powerups.append(PowerUp(WIDTH // 2, HEIGHT // 2, ammo_type))
+
+
+# ============================================================================
+# END GAME WORLD
+# ============================================================================
+
+def play_event_sounds(events):
+    """Queue the sound for each event reported by GameWorld.step (started by sound_manager.flush)"""
+    for event in events:
+        category = SOUND_EVENTS.get(event)
+        if category:
+            sound_manager.request(category)
+
+
+def draw_background(screen):
+    """Nebulae, parallax starfield and terminal grid (composited, see BackgroundCompositor)"""
+    background.draw(screen)
+
+
+def draw_world(screen, world, alpha=1.0):
+    """Draw every entity in the game world, interpolated alpha of the way into the next tick.
+
+    Entities queue their sprites on render_queue (the layers set the paint
+    order), which is submitted before the bars and event overlay go on top.
+    """
+    # Draw particles first (background layer)
+    world.particles.draw(render_queue)
+    
+    # Draw asteroids
+    world.asteroids.draw(render_queue, alpha)
+    
+    # Draw UFO
+    if world.ufo:
+        world.ufo.draw(render_queue, alpha)
+    
+    # Draw boss
+    if world.boss:
+        world.boss.draw(render_queue, alpha)
+    
+    # Draw bullets
+    for pool in world.bullet_pools:
+        for bullet in pool:
+            bullet.draw(render_queue, alpha)
+    
+    # Draw power-ups
+    for powerup in world.powerups:
+        powerup.draw(render_queue)
+    
+    # Draw ally ships
+    for ally in world.allies:
+        ally.draw(render_queue)
+
+    # Draw ship
+    world.ship.draw(render_queue, alpha)
+
+    render_queue.submit(screen)
+
+    # Status bars over their ships
+    if world.boss:
+        world.boss.draw_health_bar(screen, alpha)
+    for ally in world.allies:
+        ally.draw_lifetime_bar(screen)
+    
+    # Draw environmental event overlay
+    if world.current_event:
+        world.current_event.draw(screen)
+    
+    # CRT effects removed - was causing visual artifacts in center of screen
+    # draw_scanlines(screen)
+    # draw_vignette(screen)
+
+
+def draw_hud(screen, world):
+    """Draw modern HUD with panels"""
+    ship = world.ship
+
+    # Top-left info panel
+    panel_width = 280
+    panel_height = 110
+    draw_terminal_panel(screen, 10, 10, panel_width, panel_height, current_scheme.primary, fill_alpha=80)
+
+    # Score
+    draw_text_with_shadow(screen, 'SCORE', tiny_font, 25, 20, current_scheme.dim)
+    draw_text_with_shadow(screen, f'{world.score:,}', font, 25, 40, current_scheme.primary)
+
+    # Lives
+    draw_text_with_shadow(screen, 'LIVES', tiny_font, 25, 75, current_scheme.dim)
+    for i in range(world.lives):
+        # Draw small ship icons
+        ship_x = 25 + i * 30
+        ship_y = 100
+        # Draw mini triangle
+        nose_x = ship_x + 8
+        nose_y = ship_y - 5
+        left_x = ship_x
+        left_y = ship_y + 5
+        right_x = ship_x + 16
+        right_y = ship_y + 5
+        pygame.draw.polygon(screen, current_scheme.primary,
+                          [(nose_x, nose_y), (left_x, left_y), (right_x, right_y)], 2)
+
+    # Top-center wave panel
+    wave_panel_width = 240
+    draw_terminal_panel(screen, WIDTH//2 - wave_panel_width//2, 10, wave_panel_width, 110,
+                      current_scheme.accent, fill_alpha=80)
+
+    # Wave counter
+    draw_text_with_shadow(screen, 'WAVE', tiny_font, WIDTH//2 - 30, 20, current_scheme.dim)
+    draw_text_with_shadow(screen, f'{world.wave}', large_font, WIDTH//2 - 30, 35, current_scheme.accent)
+
+    # Scheme name
+    scheme_width = text_width(small_font, current_scheme.name)
+    draw_text_with_shadow(screen, current_scheme.name, tiny_font,
+                        WIDTH//2 - scheme_width//2 - 10, 90, current_scheme.dim)
     
+    # Ammo/Weapon indicator (top-right corner) 
+    ammo_panel_width = 200
+    ammo_panel_height = 90
+    draw_terminal_panel(screen, WIDTH - ammo_panel_width - 10, 10,
+                      ammo_panel_width, ammo_panel_height,
+                      current_scheme.secondary, fill_alpha=80)
+    
+    draw_text_with_shadow(screen, 'WEAPON', tiny_font, WIDTH - 190, 20, current_scheme.dim)
+    if world.current_ammo_type == 'normal':
+        draw_text_with_shadow(screen, 'STANDARD', small_font, WIDTH - 190, 40, current_scheme.primary)
+        draw_text_with_shadow(screen, '∞', font, WIDTH - 190, 60, current_scheme.accent)
     else:
-        # Game over screen with modern terminal panel
-        # CRT effects removed - was causing visual artifacts
-        # draw_scanlines(screen)
-        # draw_vignette(screen)
-
-        # Center panel - larger to fit hi-scores
-        panel_width = 650
-        panel_height = 600
-        panel_x = WIDTH//2 - panel_width//2
-        panel_y = HEIGHT//2 - panel_height//2
-
-        draw_terminal_panel(screen, panel_x, panel_y, panel_width, panel_height,
-                          current_scheme.accent, fill_alpha=120)
-
-        # Game Over title with flashing effect
-        flash = int(pygame.time.get_ticks() / 500) % 2
-        title_color = current_scheme.accent if flash else current_scheme.bright
-        game_over_text = large_font.render('GAME OVER', True, title_color)
-        go_width = game_over_text.get_width()
-        draw_text_with_shadow(screen, 'GAME OVER', large_font,
-                            WIDTH//2 - go_width//2, panel_y + 40, title_color, shadow_offset=3)
-
-        # Stats section
-        draw_text_with_shadow(screen, 'FINAL STATISTICS', small_font,
-                            WIDTH//2 - 110, panel_y + 140, current_scheme.dim)
-
-        # Score
-        draw_text_with_shadow(screen, 'SCORE', tiny_font,
-                            WIDTH//2 - 200, panel_y + 180, current_scheme.dim)
-        score_color = current_scheme.accent if new_hiscore_rank > 0 else current_scheme.primary
-        draw_text_with_shadow(screen, f'{score:,}', font,
-                            WIDTH//2 - 200, panel_y + 200, score_color)
-        
-        # Show "NEW HI-SCORE!" if applicable
-        if new_hiscore_rank > 0:
-            rank_text = f'#{new_hiscore_rank} HI-SCORE!'
-            rank_surf = tiny_font.render(rank_text, True, current_scheme.accent)
-            rank_width = rank_surf.get_width()
-            draw_text_with_shadow(screen, rank_text, tiny_font,
-                                WIDTH//2 - 200 + 80, panel_y + 240, current_scheme.accent)
-
-        # Wave
-        draw_text_with_shadow(screen, 'WAVE', tiny_font,
-                            WIDTH//2 + 80, panel_y + 180, current_scheme.dim)
-        draw_text_with_shadow(screen, f'{wave}', font,
-                            WIDTH//2 + 80, panel_y + 200, current_scheme.primary)
-
-        # Hi-Scores section
-        hiscore_y_start = panel_y + 300
-        draw_text_with_shadow(screen, '═══ HI-SCORES ═══', small_font,
-                            WIDTH//2 - 100, hiscore_y_start, current_scheme.bright)
-        
-        # Display top 5 scores
-        for i, hiscore in enumerate(hiscores):
-            rank_y = hiscore_y_start + 40 + (i * 35)
-            
-            # Highlight if this is the new score
-            if hiscore == score and i + 1 == new_hiscore_rank:
-                # Flashing highlight for new entry
-                highlight_color = current_scheme.accent if flash else current_scheme.bright
-                # Draw highlight background
-                highlight_rect = pygame.Rect(panel_x + 50, rank_y - 5, panel_width - 100, 30)
-                pygame.draw.rect(screen, (*highlight_color, 40), highlight_rect)
-                pygame.draw.rect(screen, highlight_color, highlight_rect, 1)
-                text_color = highlight_color
-            else:
-                text_color = current_scheme.primary
-            
-            # Rank number
-            rank_text = f'{i + 1}.'
-            draw_text_with_shadow(screen, rank_text, small_font,
-                                WIDTH//2 - 220, rank_y, current_scheme.dim)
+        ammo_names = {'piercing': 'PIERCING', 'explosive': 'EXPLOSIVE', 'spread': 'SPREAD'}
+        ammo_colors = {'piercing': (100, 150, 255), 'explosive': (255, 150, 50), 'spread': (100, 255, 100)}
+        draw_text_with_shadow(screen, ammo_names[world.current_ammo_type], small_font, 
+                            WIDTH - 190, 40, ammo_colors[world.current_ammo_type])
+        draw_text_with_shadow(screen, f'{world.ammo_counts[world.current_ammo_type]}', font,
+                            WIDTH - 190, 60, ammo_colors[world.current_ammo_type])
+
+    # Power-up indicators (below ammo panel)
+    if ship.rapid_fire or ship.shield:
+        powerup_panel_width = 200
+        powerup_panel_height = 60 if (ship.rapid_fire and ship.shield) else 40
+        draw_terminal_panel(screen, WIDTH - powerup_panel_width - 10, 110,
+                          powerup_panel_width, powerup_panel_height,
+                          current_scheme.bright, fill_alpha=100)
+
+        y_offset = 118
+        if ship.rapid_fire:
+            draw_text_with_shadow(screen, '⚡ RAPID FIRE', small_font,
+                                WIDTH - powerup_panel_width + 5, y_offset, current_scheme.accent)
+            y_offset += 30
+
+        if ship.shield:
+            draw_text_with_shadow(screen, '🛡 SHIELD', small_font,
+                                WIDTH - powerup_panel_width + 5, y_offset, current_scheme.bright)
+
+    # Bottom status bar - show ally count and difficulty
+    status_panel_height = 60
+    draw_terminal_panel(screen, 10, HEIGHT - status_panel_height - 50,
+                      WIDTH - 20, status_panel_height, current_scheme.dim, fill_alpha=60)
+    
+    # Ally count
+    if len(world.allies) > 0:
+        ally_text = f'ALLIES: {len(world.allies)}'
+        draw_text_with_shadow(screen, ally_text, tiny_font, 25, HEIGHT - 85, (100, 255, 100))
+    
+    # Difficulty multiplier
+    diff_text = f'DIFFICULTY: x{world.difficulty_multiplier:.1f}'
+    diff_color = current_scheme.accent if world.difficulty_multiplier < 2.0 else (255, 100, 100)
+    draw_text_with_shadow(screen, diff_text, tiny_font, 150, HEIGHT - 85, diff_color)
+    
+    # Boss warning
+    if world.wave % boss_wave_interval == boss_wave_interval - 1:
+        warning_text = '⚠ BOSS INCOMING NEXT WAVE ⚠'
+        draw_text_with_shadow(screen, warning_text, small_font,
+                            WIDTH//2 - 150, HEIGHT - 80, (255, 50, 50))
+    
+    # Bottom controls bar
+    controls_panel_height = 40
+    draw_terminal_panel(screen, 10, HEIGHT - controls_panel_height - 10,
+                      WIDTH - 20, controls_panel_height, current_scheme.dim, fill_alpha=60)
+
+    controls_text = '↑: Thrust  ↓: Reverse  ←→: Rotate  |  L-CTRL: Shoot  |  L-SHIFT: Warp  |  C: Color  |  F3: Perf  |  F11: Fullscreen'
+    controls_width = text_width(tiny_font, controls_text)
+    draw_text_with_shadow(screen, controls_text, tiny_font,
+                        WIDTH//2 - controls_width//2, HEIGHT - 35, current_scheme.dim, shadow_offset=1)
+
+
+def draw_frame(screen, world, alpha, hiscores, new_hiscore_rank):
+    """Everything drawn over the background: world and HUD in play, the panel after game over"""
+    timer = world.timer
+    if not world.game_over:
+        draw_world(screen, world, alpha)
+        timer.lap('entities')
+        draw_hud(screen, world)
+    else:
+        draw_game_over(screen, world, hiscores, new_hiscore_rank)
+    timer.lap('hud')
+
+    if perf_overlay.visible:
+        perf_overlay.draw(screen, world)
+        timer.lap('overlay')
+
+
+def draw_game_over(screen, world, hiscores, new_hiscore_rank):
+    """Game over screen with modern terminal panel"""
+    score = world.score
+
+    # CRT effects removed - was causing visual artifacts
+    # draw_scanlines(screen)
+    # draw_vignette(screen)
+
+    # Center panel - larger to fit hi-scores
+    panel_width = 650
+    panel_height = 600
+    panel_x = WIDTH//2 - panel_width//2
+    panel_y = HEIGHT//2 - panel_height//2
+
+    draw_terminal_panel(screen, panel_x, panel_y, panel_width, panel_height,
+                      current_scheme.accent, fill_alpha=120)
+
+    # Game Over title with flashing effect
+    flash = int(pygame.time.get_ticks() / 500) % 2
+    title_color = current_scheme.accent if flash else current_scheme.bright
+    go_width = text_width(large_font, 'GAME OVER')
+    draw_text_with_shadow(screen, 'GAME OVER', large_font,
+                        WIDTH//2 - go_width//2, panel_y + 40, title_color, shadow_offset=3)
+
+    # Stats section
+    draw_text_with_shadow(screen, 'FINAL STATISTICS', small_font,
+                        WIDTH//2 - 110, panel_y + 140, current_scheme.dim)
+
+    # Score
+    draw_text_with_shadow(screen, 'SCORE', tiny_font,
+                        WIDTH//2 - 200, panel_y + 180, current_scheme.dim)
+    score_color = current_scheme.accent if new_hiscore_rank > 0 else current_scheme.primary
+    draw_text_with_shadow(screen, f'{score:,}', font,
+                        WIDTH//2 - 200, panel_y + 200, score_color)
+    
+    # Show "NEW HI-SCORE!" if applicable
+    if new_hiscore_rank > 0:
+        rank_text = f'#{new_hiscore_rank} HI-SCORE!'
+        draw_text_with_shadow(screen, rank_text, tiny_font,
+                            WIDTH//2 - 200 + 80, panel_y + 240, current_scheme.accent)
+
+    # Wave
+    draw_text_with_shadow(screen, 'WAVE', tiny_font,
+                        WIDTH//2 + 80, panel_y + 180, current_scheme.dim)
+    draw_text_with_shadow(screen, f'{world.wave}', font,
+                        WIDTH//2 + 80, panel_y + 200, current_scheme.primary)
+
+    # Hi-Scores section
+    hiscore_y_start = panel_y + 300
+    draw_text_with_shadow(screen, '═══ HI-SCORES ═══', small_font,
+                        WIDTH//2 - 100, hiscore_y_start, current_scheme.bright)
+    
+    # Display top 5 scores
+    for i, hiscore in enumerate(hiscores):
+        rank_y = hiscore_y_start + 40 + (i * 35)
+        
+        # Highlight if this is the new score
+        if hiscore == score and i + 1 == new_hiscore_rank:
+            # Flashing highlight for new entry
+            highlight_color = current_scheme.accent if flash else current_scheme.bright
+            # Draw highlight background
+            highlight_rect = pygame.Rect(panel_x + 50, rank_y - 5, panel_width - 100, 30)
+            pygame.draw.rect(screen, (*highlight_color, 40), highlight_rect)
+            pygame.draw.rect(screen, highlight_color, highlight_rect, 1)
+            text_color = highlight_color
+        else:
+            text_color = current_scheme.primary
+        
+        # Rank number
+        rank_text = f'{i + 1}.'
+        draw_text_with_shadow(screen, rank_text, small_font,
+                            WIDTH//2 - 220, rank_y, current_scheme.dim)
+        
+        # Score value
+        score_text = f'{hiscore:,}'
+        draw_text_with_shadow(screen, score_text, small_font,
+                            WIDTH//2 - 180, rank_y, text_color)
+    
+    # If fewer than 5 scores, show empty slots
+    for i in range(len(hiscores), 5):
+        rank_y = hiscore_y_start + 40 + (i * 35)
+        rank_text = f'{i + 1}.'
+        draw_text_with_shadow(screen, rank_text, small_font,
+                            WIDTH//2 - 220, rank_y, current_scheme.dim)
+        draw_text_with_shadow(screen, '---', small_font,
+                            WIDTH//2 - 180, rank_y, current_scheme.dim)
+
+    # Restart instruction - font.render ignores a color's alpha, so cache it by RGB alone
+    restart_text = text_sprite(small_font, '► PRESS SPACE TO RESTART ◄', current_scheme.bright)
+    restart_width = restart_text.get_width()
+    screen.blit(restart_text, (WIDTH//2 - restart_width//2, panel_y + 540))
+
+
+# ============================================================================
+# PERFORMANCE OVERLAY - F3 shows frame timings, entity counts and allocations
+# ============================================================================
+PERF_PHASES = ('input', 'ship', 'particles', 'bullets', 'asteroids', 'ai', 'collisions',
+               'audio', 'background', 'entities', 'hud', 'overlay', 'flip')
+PERF_GRAPH_FRAMES = 120   # Frames shown in the rolling frame-time graph
+PERF_GRAPH_MAX_MS = 50.0  # Graph ceiling; the guide lines mark 60 and 30 fps
+PERF_REFRESH_MS = 200     # Text and graph are re-rendered this often, blitted in between
+
+
+class NullTimer:
+    """Stands in for PhaseTimer while the overlay is hidden - every call is a no-op"""
+    __slots__ = ()
+
+    def begin(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+class PhaseTimer:
+    """Charges the wall time since the previous mark to a named phase on each lap()"""
+    def __init__(self):
+        self.totals = dict.fromkeys(PERF_PHASES, 0.0)
+        self.mark = time.perf_counter()
+
+    def begin(self):
+        self.mark = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.totals[phase] += now - self.mark
+        self.mark = now
+
+    def reset(self):
+        for phase in self.totals:
+            self.totals[phase] = 0.0
+        self.mark = time.perf_counter()
+
+
+class PerfOverlay:
+    """Rolling frame-time graph, per-phase timings, entity counts and sprite bakes per frame.
+
+    Bakes are SpriteCache misses: every render_* sprite, text and panel is
+    built through one, and per-frame drawing (event overlays and this panel
+    included) allocates surfaces nowhere else, so bakes stand in for the
+    surfaces allocated per frame. Hidden, the game runs on NULL_TIMER, so
+    the only cost left is a few no-op lap() calls per frame. Shown, phases
+    are averaged per frame over each PERF_REFRESH_MS window and the panel
+    is re-rendered once per window.
+    """
+    def __init__(self):
+        self.visible = False
+        self.timer = PhaseTimer()
+        self.rect = pygame.Rect(10, 130, 300, 322)
+        self.frame_times = deque(maxlen=PERF_GRAPH_FRAMES)
+        self.frames = 0
+        self.bakes = 0
+        self.max_bakes = 0
+        self.bake_mark = 0  # Total cache misses at the end of the last frame
+        self.panel = None
+        self.refresh_time = 0
+
+    def toggle(self, world):
+        self.visible = not self.visible
+        if self.visible:
+            self.bake_mark = sprite_bakes()
+            self.timer.reset()
+            self.frame_times.clear()
+            self.frames = self.bakes = self.max_bakes = 0
+            self.panel = None
+            world.timer = self.timer
+        else:
+            world.timer = NULL_TIMER
+
+    def end_frame(self, frame_time):
+        """Record one presented frame (frame_time in seconds, as measured by clock.tick)"""
+        if not self.visible:
+            return
+        self.frame_times.append(frame_time * 1000)
+        self.frames += 1
+        bakes = sprite_bakes()
+        frame_bakes = bakes - self.bake_mark
+        self.bake_mark = bakes
+        self.bakes += frame_bakes
+        self.max_bakes = max(self.max_bakes, frame_bakes)
+
+    def draw(self, screen, world):
+        now = pygame.time.get_ticks()
+        if self.panel is None or now - self.refresh_time >= PERF_REFRESH_MS:
+            self.panel = self._render(world)
+            self.refresh_time = now
+            self.timer.reset()
+            self.frames = self.bakes = self.max_bakes = 0
+        screen.blit(self.panel, self.rect)
+
+    def _render(self, world):
+        width, height = self.rect.size
+        panel = panel_sprites.get(('perf_overlay', width, height), render_canvas, width, height)
+        panel.fill((0, 0, 0, 0))
+        draw_terminal_panel(panel, 0, 0, width, height, current_scheme.accent, fill_alpha=160)
+        frames = max(1, self.frames)
+
+        def line(text, x, y, color=current_scheme.primary):
+            panel.blit(text_sprite(tiny_font, text, color), (x, y))
+
+        # Frame time: last window average and the worst frame in the graph
+        times = self.frame_times
+        average = sum(times) / len(times) if times else 0.0
+        worst = max(times, default=0.0)
+        fps = 1000 / average if average else 0
+        line(f'FRAME {average:5.1f} ms  MAX {worst:5.1f}  {fps:4.0f} FPS', 10, 6, current_scheme.bright)
+
+        graph = pygame.Rect(10, 26, width - 20, 60)
+        scale = graph.height / PERF_GRAPH_MAX_MS
+        for budget in (1000 / 60, 1000 / 30):
+            guide_y = graph.bottom - int(budget * scale)
+            panel.fill((*current_scheme.dim, 120), (graph.left, guide_y, graph.width, 1))
+        if len(times) > 1:
+            step = graph.width / (PERF_GRAPH_FRAMES - 1)
+            points = [(graph.left + i * step, graph.bottom - min(ms, PERF_GRAPH_MAX_MS) * scale)
+                      for i, ms in enumerate(times)]
+            pygame.draw.lines(panel, current_scheme.accent, False, points, 1)
+
+        # Per-phase milliseconds per frame, in two columns
+        rows = (len(PERF_PHASES) + 1) // 2
+        for i, phase in enumerate(PERF_PHASES):
+            ms = self.timer.totals[phase] * 1000 / frames
+            line(f'{phase:<10}{ms:6.2f}', 10 + (i // rows) * 145, 94 + (i % rows) * 16)
+
+        # Live entity counts
+        counts_y = 94 + rows * 16 + 6
+        live, pooled = world.bullet_counts()
+        line(f'PARTICLES {len(world.particles):<6} ASTEROIDS {len(world.asteroids)}', 10, counts_y)
+        line(f'BULLETS {live - len(world.enemy_bullets):<4} UFO_BULLETS {len(world.enemy_bullets):<4}'
+             f' FREE {pooled}', 10, counts_y + 16)
+        line(f'ALLIES {len(world.allies):<3} BAKES/FRAME {self.bakes / frames:5.1f}'
+             f' MAX {self.max_bakes}', 10, counts_y + 32)
+        line(f'DRAW COMMANDS {render_queue.commands}', 10, counts_y + 48)
+        played, coalesced, dropped = sound_manager.totals()
+        line(f'SOUNDS PLAYED {played}  COALESCED {coalesced}  DROPPED {dropped}', 10, counts_y + 64)
+        return panel
+
+
+perf_overlay = PerfOverlay()
+
+
+# ============================================================================
+# DIRTY-RECT RENDERING - Present only what changed (low-power displays)
+# ============================================================================
+DIRTY_AREA_THRESHOLD = 0.5  # Fraction of the screen past which one full flip is cheaper
+DIRTY_CELL_SIZE = 100       # Particles are tracked per occupied cell, not one rect each
+SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+ASTEROID_DIRTY_HALF = (ASTEROID_RADII * 1.2).astype(np.int64) + 4  # Matches render_asteroid_frame
+
+# Every panel draw_hud / draw_game_over paints (plus a little for text shadows)
+HUD_RECTS = [pygame.Rect(rect).inflate(4, 4) for rect in (
+    (10, 10, 280, 110),
+    (WIDTH // 2 - 120, 10, 240, 110),
+    (WIDTH - 210, 10, 200, 90),
+    (WIDTH - 210, 110, 200, 60),
+    (10, HEIGHT - 110, WIDTH - 20, 60),
+    (10, HEIGHT - 50, WIDTH - 20, 40),
+)]
+GAME_OVER_RECTS = [pygame.Rect(WIDTH // 2 - 325, HEIGHT // 2 - 300, 650, 600).inflate(4, 4)]
+
+
+def centered_rect(x, y, extent):
+    return pygame.Rect(int(x) - extent, int(y) - extent, extent * 2, extent * 2)
+
+
+def world_dirty_rects(world, alpha=1.0):
+    """Screen rects covering everything draw_world paints at this alpha"""
+    rects = []
+
+    # Particles: one rect per occupied cell keeps the count bounded
+    particles = world.particles
+    n = particles.count
+    if n:
+        cells = np.stack(((particles.x[:n] // DIRTY_CELL_SIZE).astype(np.int64),
+                          (particles.y[:n] // DIRTY_CELL_SIZE).astype(np.int64)), axis=1)
+        for cx, cy in np.unique(cells, axis=0).tolist():
+            rects.append(pygame.Rect(cx * DIRTY_CELL_SIZE - 8, cy * DIRTY_CELL_SIZE - 8,
+                                     DIRTY_CELL_SIZE + 16, DIRTY_CELL_SIZE + 16))
+
+    field = world.asteroids
+    if len(field):
+        xs, ys = field.render_positions(alpha)
+        halves = ASTEROID_DIRTY_HALF[field.size_class[:field.count]]
+        rects.extend(pygame.Rect(x - half, y - half, half * 2, half * 2) for x, y, half in zip(
+            xs.astype(np.int64).tolist(), ys.astype(np.int64).tolist(), halves.tolist()))
+
+    # Bullets: the head plus a trail reaching one velocity step back
+    for pool in world.bullet_pools:
+        for bullet in pool:
+            x, y = interpolate_position(bullet, alpha)
+            extent = bullet.radius * 3 + 12
+            rect = centered_rect(x, y, extent)
+            rects.append(rect.union(centered_rect(x - bullet.vx, y - bullet.vy, extent)))
+
+    if world.ufo:
+        rects.append(centered_rect(*interpolate_position(world.ufo, alpha), 40))
+    if world.boss:
+        # Glow, health bar and phase label all sit within radius + 60
+        rects.append(centered_rect(*interpolate_position(world.boss, alpha), world.boss.radius + 60))
+    for powerup in world.powerups:
+        rects.append(centered_rect(powerup.x, powerup.y, powerup.radius + 20))
+    for ally in world.allies:
+        rects.append(centered_rect(ally.x, ally.y, ally.radius + 20))
+    rects.append(centered_rect(*interpolate_position(world.ship, alpha), 60))
+
+    return [rect for rect in (r.clip(SCREEN_RECT) for r in rects) if rect]
+
+
+def hud_signature(world):
+    """Everything the HUD shows - equal signatures mean identical HUD pixels"""
+    ship = world.ship
+    return (world.score, world.lives, world.wave, world.current_ammo_type,
+            world.ammo_counts.get(world.current_ammo_type), bool(ship.rapid_fire),
+            bool(ship.shield), len(world.allies), f'{world.difficulty_multiplier:.1f}')
+
+
+class DirtyRectRenderer:
+    """Redraws and presents only the parts of the screen that changed.
+
+    The background is composited on full frames only and then held still.
+    Each partial frame restores last frame's entity rects from it, draws
+    the frame as usual and passes the old and new rects to
+    pygame.display.update. Overlay panels are restored every frame so
+    their translucent fills never stack, but only presented when their
+    contents change. Falls back to a full redraw and flip when the dirty
+    area passes the threshold, on scheme or display changes and while an
+    environmental event paints the whole screen.
+    """
+    def __init__(self, threshold=DIRTY_AREA_THRESHOLD):
+        self.threshold_area = threshold * WIDTH * HEIGHT
+        self.prev_rects = []
+        self.overlay_rects = []
+        self.overlay_key = None
+        self.scheme = None
+        self.perf_visible = False
+        self.full_pending = True
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        """Force the next frame to be a full redraw (e.g. after set_mode)"""
+        self.full_pending = True
+
+    def draw(self, screen, world, alpha, hiscores, new_hiscore_rank):
+        if world.game_over:
+            rects = []
+            overlay_rects = GAME_OVER_RECTS
+            flash = int(pygame.time.get_ticks() / 500) % 2
+            overlay_key = ('game_over', world.score, new_hiscore_rank, flash)
+        else:
+            rects = world_dirty_rects(world, alpha)
+            overlay_rects = HUD_RECTS
+            overlay_key = hud_signature(world)
+
+        restore = self.prev_rects + overlay_rects
+        present = self.prev_rects + rects
+        if overlay_key != self.overlay_key:
+            if overlay_rects is not self.overlay_rects:
+                restore += self.overlay_rects
+                present += self.overlay_rects
+            present += overlay_rects
+        if perf_overlay.visible:
+            restore.append(perf_overlay.rect)
+            present.append(perf_overlay.rect)
+        fills_screen = world.current_event is not None and not world.game_over
+
+        full = (self.full_pending or fills_screen or self.scheme is not current_scheme
+                or self.perf_visible != perf_overlay.visible
+                or sum(rect.width * rect.height for rect in present) > self.threshold_area)
+        if full:
+            draw_background(screen)
+        else:
+            restored = background.surface
+            screen.blits([(restored, rect, rect) for rect in restore], doreturn=False)
+        world.timer.lap('background')
+
+        draw_frame(screen, world, alpha, hiscores, new_hiscore_rank)
+
+        if full:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(present)
+            self.partial_frames += 1
+        world.timer.lap('flip')
+
+        self.prev_rects = rects
+        self.overlay_rects = overlay_rects
+        self.overlay_key = overlay_key
+        self.scheme = current_scheme
+        self.perf_visible = perf_overlay.visible
+        # Event overlays cover the whole screen, so the frame after one ends is full too
+        self.full_pending = fills_screen
+
+
+# ============================================================================
+# INITIALIZATION - Nothing touches pygame until init() runs
+# ============================================================================
+_initialized = False
+
+
+def init():
+    """Open the window and create the clock, fonts, audio and starfield (idempotent).
+
+    main() calls this; tools that only step GameWorld never need to. The
+    starfield draws from fx_random, so seed first for a reproducible sky.
+    """
+    global _initialized, screen, clock
+    if _initialized:
+        return
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Asteroids Deluxe")
+    clock = pygame.time.Clock()
+    init_fonts()
+    init_audio()
+    create_starfield()
+    _initialized = True
+
+
+def run_headless(ticks, seed=None, autopilot=True, particles=True):
+    """Step GameWorld with no drawing or frame cap and report ticks per second.
+
+    Restarts the game whenever it ends so long runs cover many games. With a
+    seed the whole run is bit-reproducible.
+    """
+    world = GameWorld(seed, particles=particles)
+    # Autopilot: spin and fire constantly - cheap but keeps every system busy
+    inputs = InputState(right=True, fire=True) if autopilot else InputState()
+    games = 1
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        world.step(inputs)
+        if world.game_over:
+            world.reset()
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Simulated {ticks:,} ticks ({games} games) in {elapsed:.2f}s"
+          f" - {ticks / elapsed:,.0f} ticks/sec - final score {world.score:,} (wave {world.wave})")
+    return world
+
+
+def main(particles=True, max_fps=MAX_RENDER_FPS, dirty_rects=False, max_frames=None):
+    """Interactive game loop: input -> fixed-rate GameWorld.step -> sounds -> interpolated draw
+
+    The simulation always advances in SIM_DT ticks from an accumulator, so a
+    slow frame no longer slows the game down and fast displays render extra
+    interpolated frames without extra simulation cost. With dirty_rects,
+    frames go through DirtyRectRenderer instead of a full flip. max_frames
+    quits after that many frames (startup and smoke measurements).
+    """
+    global screen, fullscreen
+
+    init()
+    frames = 0
+    world = GameWorld(particles=particles)
+    accumulator = 0.0
+    renderer = DirtyRectRenderer() if dirty_rects else None
+
+    # Hi-score system
+    hiscores = load_hiscores()
+    new_hiscore_rank = 0  # Track if current game made top 5 (1-5, or 0 if not)
+
+    # Game loop
+    running = True
+    while running:
+        frame_time = clock.tick(max_fps) / 1000.0
+        accumulator += min(frame_time, MAX_FRAME_TIME)
+        world.timer.begin()
+        
+        # Event handling
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
             
-            # Score value
-            score_text = f'{hiscore:,}'
-            draw_text_with_shadow(screen, score_text, small_font,
-                                WIDTH//2 - 180, rank_y, text_color)
-        
-        # If fewer than 5 scores, show empty slots
-        for i in range(len(hiscores), 5):
-            rank_y = hiscore_y_start + 40 + (i * 35)
-            rank_text = f'{i + 1}.'
-            draw_text_with_shadow(screen, rank_text, small_font,
-                                WIDTH//2 - 220, rank_y, current_scheme.dim)
-            draw_text_with_shadow(screen, '---', small_font,
-                                WIDTH//2 - 180, rank_y, current_scheme.dim)
-
-        # Restart instruction with pulsing effect
-        pulse_alpha = int(127 + 127 * math.sin(pygame.time.get_ticks() * 0.003))
-        restart_color = (*current_scheme.bright, pulse_alpha)
-        restart_surf = pygame.Surface((400, 40), pygame.SRCALPHA)
-        restart_text = small_font.render('► PRESS SPACE TO RESTART ◄', True, restart_color)
-        restart_width = restart_text.get_width()
-        screen.blit(restart_text, (WIDTH//2 - restart_width//2, panel_y + 540))
-    
-    pygame.display.flip()
-
-pygame.quit()
\ No newline at end of file
+            if event.type == pygame.KEYDOWN:
+                # Cycle color schemes
+                if event.key == pygame.K_c and not world.game_over:
+                    cycle_color_scheme()
+
+                # Toggle performance overlay
+                if event.key == pygame.K_F3:
+                    perf_overlay.toggle(world)
+
+                # Toggle fullscreen
+                if event.key == pygame.K_F11:
+                    fullscreen = not fullscreen
+                    if fullscreen:
+                        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
+                    else:
+                        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+                    if renderer:
+                        renderer.invalidate()
+
+                # Restart game
+                if event.key == pygame.K_SPACE and world.game_over:
+                    world.reset()
+                    new_hiscore_rank = 0  # Reset hi-score rank for new game
+        
+        # Fixed timestep: run as many whole ticks as real time has accumulated
+        inputs = InputState.from_keys(pygame.key.get_pressed())
+        timer = world.timer
+        timer.lap('input')
+        while accumulator >= SIM_DT:
+            accumulator -= SIM_DT
+            if world.game_over:
+                continue
+            events = world.step(inputs)
+            play_event_sounds(events)
+
+            if 'game_over' in events:
+                # Update hi-scores when game ends
+                hiscores, new_hiscore_rank = update_hiscores(world.score)
+            timer.lap('audio')
+        sound_manager.flush()
+        timer.lap('audio')
+
+        # Drawing
+        alpha = accumulator / SIM_DT
+        if renderer:
+            renderer.draw(screen, world, alpha, hiscores, new_hiscore_rank)
+        else:
+            draw_background(screen)
+            timer.lap('background')
+            draw_frame(screen, world, alpha, hiscores, new_hiscore_rank)
+            pygame.display.flip()
+            timer.lap('flip')
+        perf_overlay.end_frame(frame_time)
+
+        frames += 1
+        if max_frames is not None and frames >= max_frames:
+            running = False
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Asteroids Deluxe')
+    parser.add_argument('--headless', type=int, metavar='TICKS',
+                        help='run the simulation only (no drawing, no frame cap) for TICKS ticks')
+    parser.add_argument('--seed', type=int,
+                        help='seed the gameplay and cosmetic random streams for reproducible runs')
+    parser.add_argument('--no-particles', action='store_true',
+                        help='disable cosmetic particles (never changes gameplay outcomes)')
+    parser.add_argument('--max-fps', type=int, default=MAX_RENDER_FPS,
+                        help=f'render frame cap, 0 = uncapped (simulation always runs at {SIM_HZ} Hz)')
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help='present only changed screen regions (low-power displays; '
+                             'background parallax pauses between full redraws)')
+    parser.add_argument('--frames', type=int,
+                        help='quit after this many rendered frames')
+    parser.add_argument('--no-palette', action='store_true',
+                        help='bake asteroid and boss hull frames as 32-bit sprites, rebaked on every '
+                             'color scheme change, instead of 8-bit palette sprites')
+    args = parser.parse_args()
+    indexed_sprites = not args.no_palette
+
+    if args.seed is not None:
+        seed_random(args.seed)
+
+    if args.headless:
+        run_headless(args.headless, particles=not args.no_particles)
+    else:
+        main(particles=not args.no_particles, max_fps=args.max_fps, dirty_rects=args.dirty_rects,
+             max_frames=args.frames)
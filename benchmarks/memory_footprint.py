@@ -0,0 +1,89 @@
+"""Memory footprint of the game entities, measured with tracemalloc.
+
+Reports bytes per entity for every entity class and the total heap of a
+10k-asteroid / 50k-particle world. Run from the repository root:
+
+    python benchmarks/memory_footprint.py
+"""
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asteroids_deluxe as game  # noqa: E402
+
+SAMPLES = 2000
+WORLD_ASTEROIDS = 10_000
+WORLD_PARTICLES = 50_000
+
+
+def measure(build):
+    """Bytes still allocated after build() returns (the result is kept alive)"""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def per_entity():
+    field = game.AsteroidField()
+    game.spawn_asteroids(field, SAMPLES, 'large')
+    builders = {
+        'Ship': lambda: [game.Ship(0, 0) for _ in range(SAMPLES)],
+        'Bullet': lambda: [game.Bullet(0, 0, 1, 1) for _ in range(SAMPLES)],
+        'SpecialBullet': lambda: [game.SpecialBullet(0, 0, 1, 1, 'piercing') for _ in range(SAMPLES)],
+        'UFOBullet': lambda: [game.UFOBullet(0, 0, 1, 1) for _ in range(SAMPLES)],
+        'UFO': lambda: [game.UFO() for _ in range(SAMPLES)],
+        'PowerUp': lambda: [game.PowerUp(0, 0, 'shield') for _ in range(SAMPLES)],
+        'Boss': lambda: [game.Boss(5) for _ in range(SAMPLES)],
+        'AllyShip': lambda: [game.AllyShip(0, 0) for _ in range(SAMPLES)],
+        'Nebula': lambda: [game.Nebula() for _ in range(SAMPLES)],
+    }
+    results = {}
+    for name, build in builders.items():
+        # The list itself costs 8 bytes per slot; report the objects alone
+        results[name] = measure(build) / SAMPLES - 8
+
+    n = len(field)
+    results['Asteroid (view)'] = measure(lambda: [field.view(i) for i in range(n)]) / n - 8
+    results['AsteroidField slot'] = sum(array.itemsize for array in field._arrays())
+    particles = game.ParticleSystem(capacity=1)
+    results['ParticleSystem slot'] = sum(getattr(particles, name).itemsize for name in
+                                         ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime', 'size', 'color'))
+    starfield = game.Starfield()
+    results['Starfield star'] = sum(getattr(starfield, name).itemsize for name in
+                                    ('x', 'y', 'size', 'brightness', 'twinkle_speed', 'twinkle_offset', 'tint'))
+    return results
+
+
+def build_world():
+    world = game.GameWorld(seed=1)
+    world.asteroids.clear()
+    game.spawn_asteroids(world.asteroids, WORLD_ASTEROIDS, 'large')
+    views = list(world.asteroids)  # Drawing materialises one view per asteroid
+    world.particles = game.ParticleSystem(capacity=WORLD_PARTICLES)
+    world.particles.emit_burst(game.WIDTH / 2, game.HEIGHT / 2, WORLD_PARTICLES, 1, 5)
+    return world, views
+
+
+def main():
+    game.asteroid_models()  # Shared bank, allocated once per process
+    print(f'{"entity":<22}{"bytes":>10}')
+    for name, size in per_entity().items():
+        print(f'{name:<22}{size:>10.1f}')
+
+    world_bytes = measure(build_world)
+    print()
+    print(f'World with {WORLD_ASTEROIDS:,} asteroids and {WORLD_PARTICLES:,} particles: '
+          f'{world_bytes / 1024:,.1f} KiB total heap')
+
+
+if __name__ == '__main__':
+    main()
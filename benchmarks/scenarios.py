@@ -0,0 +1,247 @@
+"""Scripted stress scenarios, timed in headless and offscreen-render modes.
+
+Each scenario builds a specific world state and then runs it under the
+run_headless autopilot (spin and fire). Every scenario is timed twice:
+
+    headless  GameWorld.step only, one sample per tick
+    render    one step plus a full draw into an offscreen surface per frame
+
+For each run it reports mean, p95 and p99 frame time and ticks per second,
+and writes everything to JSON so runs on the same machine can be compared
+across commits. Run from the repository root:
+
+    python benchmarks/scenarios.py
+    python benchmarks/scenarios.py --frames 300 --only boss_phase3 bomb_clear_200
+    python benchmarks/scenarios.py --baseline benchmarks/results/old.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+import asteroids_deluxe as game  # noqa: E402
+
+SEED = 1979
+FRAMES = 600        # Measured ticks/frames per scenario and mode
+WARMUP_FRAMES = 5   # Render-only: draws before timing so sprite caches are baked
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+
+# ============================================================================
+# SCENARIOS - setup(world) returns a per-tick hook (or None)
+# ============================================================================
+
+def wave_1(world):
+    return None
+
+
+def wave_10(world):
+    """Wave 10 asteroid field: spawn_asteroids caps the wave multiplier at 3x"""
+    world.wave = 10
+    world.difficulty_multiplier = 1.0 + 9 * 0.1
+    world.asteroid_speed_multiplier = 1.0 + 9 * 0.05
+    world.ufo_accuracy_multiplier = 1.0 + 9 * 0.08
+    world.asteroids.clear()
+    game.spawn_asteroids(world.asteroids, 4, 'large', world.wave)
+    return None
+
+
+def boss_phase3(world):
+    """Boss in phase 3 (spiral fire) with the laser_sweep due on the first tick"""
+    world.asteroids.clear()
+    boss = world.boss = game.Boss(10)
+    # Phase follows health percent; a deep pool keeps it alive for the whole run
+    boss.max_health = 100_000
+    boss.health = 30_000
+    boss.special_attack_timer = boss.special_cooldown
+    return None
+
+
+def bomb_clear_200(world):
+    """200 asteroids on screen, then a bomb power-up on the first measured tick"""
+    world.asteroids.clear()
+    game.spawn_asteroids(world.asteroids, 200, 'large')
+
+    def hook(world, tick):
+        if tick == 0:
+            world.collect_powerup(game.PowerUp(world.ship.x, world.ship.y, 'bomb'), [])
+    return hook
+
+
+def storm_gravity_well(world):
+    """Asteroid storm as the active event, plus a gravity well updated alongside it.
+
+    GameWorld only runs one event at a time, so the well is stepped by the hook.
+    """
+    storm = world.current_event = game.EnvironmentalEvent('asteroid_storm')
+    well = game.EnvironmentalEvent('gravity_well')
+    storm.timer = well.timer = storm.warning_time  # Skip the warning phase
+    storm.duration = well.duration = 10 ** 9
+    world.extra_events = [well]
+
+    def hook(world, tick):
+        well.update(world.ship, world.asteroids)
+    return hook
+
+
+def particle_cascade(world):
+    """About 10k live particles: explosions chained across the screen every few ticks"""
+    rng = random.Random(SEED)
+    per_tick = 10_000 // 30  # create_explosion particles live 30 ticks
+
+    def emit(count):
+        for _ in range(count // 50):
+            world.particles.emit_burst(rng.uniform(0, game.WIDTH), rng.uniform(0, game.HEIGHT),
+                                       50, 2, 8, rng.choice(game.PARTICLE_COLOR_TYPES), lifetime=30)
+
+    emit(10_000)
+
+    def hook(world, tick):
+        emit(per_tick)
+    return hook
+
+
+SCENARIOS = {
+    'wave_1': wave_1,
+    'wave_10_3x': wave_10,
+    'boss_phase3': boss_phase3,
+    'bomb_clear_200': bomb_clear_200,
+    'storm_gravity_well': storm_gravity_well,
+    'particle_cascade_10k': particle_cascade,
+}
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def build(name):
+    world = game.GameWorld(SEED)
+    world.extra_events = []
+    game.create_starfield()
+    return world, SCENARIOS[name](world)
+
+
+def run(name, mode, frames):
+    """Time frames ticks of one scenario; returns a dict of summary stats"""
+    world, hook = build(name)
+    inputs = game.InputState(right=True, fire=True)
+    target = pygame.Surface((game.WIDTH, game.HEIGHT)) if mode == 'render' else None
+
+    def draw():
+        game.draw_background(target)
+        game.draw_frame(target, world, 1.0, [], 0)
+        for event in world.extra_events:
+            event.draw(target)
+
+    if target is not None:
+        for _ in range(WARMUP_FRAMES):
+            draw()
+
+    samples = np.empty(frames)
+    counter = time.perf_counter
+    start = counter()
+    for tick in range(frames):
+        frame_start = counter()
+        if hook:
+            hook(world, tick)
+        world.step(inputs)
+        world.lives = max(world.lives, 3)  # Never reach game over mid-run
+        if target is not None:
+            draw()
+        samples[tick] = counter() - frame_start
+    elapsed = counter() - start
+
+    samples *= 1000
+    return {
+        'frames': frames,
+        'mean_ms': round(float(samples.mean()), 4),
+        'p95_ms': round(float(np.percentile(samples, 95)), 4),
+        'p99_ms': round(float(np.percentile(samples, 99)), 4),
+        'max_ms': round(float(samples.max()), 4),
+        'ticks_per_sec': round(frames / elapsed, 1),
+        'asteroids': len(world.asteroids),
+        'particles': len(world.particles),
+        'bullets': world.bullet_counts()[0],
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print the change in mean and p99 against an earlier results file"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    print(f'\nvs {baseline_path}')
+    for name, modes in results.items():
+        for mode, stats in modes.items():
+            old = baseline.get(name, {}).get(mode)
+            if not old:
+                continue
+            mean = (stats['mean_ms'] / old['mean_ms'] - 1) * 100
+            p99 = (stats['p99_ms'] / old['p99_ms'] - 1) * 100
+            print(f'{name:<22}{mode:<10}mean {mean:+6.1f}%   p99 {p99:+6.1f}%')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Asteroids Deluxe stress scenarios')
+    parser.add_argument('--frames', type=int, default=FRAMES, help='measured frames per scenario and mode')
+    parser.add_argument('--only', nargs='+', choices=sorted(SCENARIOS), help='run a subset of scenarios')
+    parser.add_argument('--modes', nargs='+', choices=('headless', 'render'), default=['headless', 'render'])
+    parser.add_argument('--output', help='JSON path (default: benchmarks/results/<commit>-<time>.json)')
+    parser.add_argument('--baseline', help='earlier results JSON to print deltas against')
+    args = parser.parse_args()
+    game.init()
+
+    results = {}
+    print(f'{"scenario":<22}{"mode":<10}{"mean ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"ticks/s":>10}')
+    for name in args.only or SCENARIOS:
+        results[name] = {}
+        for mode in args.modes:
+            stats = results[name][mode] = run(name, mode, args.frames)
+            print(f'{name:<22}{mode:<10}{stats["mean_ms"]:>9.2f}{stats["p95_ms"]:>9.2f}'
+                  f'{stats["p99_ms"]:>9.2f}{stats["ticks_per_sec"]:>10,.0f}')
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {'platform': platform.platform(), 'processor': platform.processor(),
+                    'python': platform.python_version(), 'pygame': pygame.version.ver,
+                    'numpy': np.__version__},
+        'frames': args.frames,
+        'seed': SEED,
+        'results': results,
+    }
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f'{commit or "nogit"}-{time.strftime("%Y%m%d-%H%M%S")}.json')
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'\nResults written to {output}')
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
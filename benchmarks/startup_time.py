@@ -0,0 +1,76 @@
+"""Startup time: how long `import asteroids_deluxe` takes, and how long until the first frame.
+
+Every sample runs in a fresh interpreter so module caches, the sprite atlas
+and pygame itself start cold. It reports the median of the samples and exits
+non-zero when either one is over budget, so it can gate CI. Run from the
+repository root:
+
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --runs 10 --import-budget 400 --frame-budget 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = 500       # Import must stay side-effect free: no window, mixer or fonts
+FIRST_FRAME_BUDGET_MS = 1500  # Import + init() + first world step, draw and flip
+RUNS = 5
+
+# Runs in the child: times are taken in-process, so interpreter startup is excluded
+PROBE = '''
+import json, time
+start = time.perf_counter()
+import asteroids_deluxe
+imported = time.perf_counter()
+asteroids_deluxe.main(max_frames=1)
+first_frame = time.perf_counter()
+print('STARTUP ' + json.dumps({'import_ms': (imported - start) * 1000,
+                               'first_frame_ms': (first_frame - start) * 1000}))
+'''
+
+
+def sample():
+    env = dict(os.environ)
+    env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    result = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    for line in result.stdout.splitlines():
+        if line.startswith('STARTUP '):
+            return json.loads(line[len('STARTUP '):])
+    raise RuntimeError(f'probe printed no timings:\n{result.stdout}\n{result.stderr}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Asteroids Deluxe startup time')
+    parser.add_argument('--runs', type=int, default=RUNS, help='fresh interpreters to sample')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET_MS, help='milliseconds')
+    parser.add_argument('--frame-budget', type=float, default=FIRST_FRAME_BUDGET_MS, help='milliseconds')
+    parser.add_argument('--output', help='also write the samples and medians to this JSON file')
+    args = parser.parse_args()
+
+    samples = [sample() for _ in range(args.runs)]
+    import_ms = statistics.median(s['import_ms'] for s in samples)
+    first_frame_ms = statistics.median(s['first_frame_ms'] for s in samples)
+
+    over = []
+    for label, value, budget in (('import', import_ms, args.import_budget),
+                                 ('first frame', first_frame_ms, args.frame_budget)):
+        status = 'ok' if value <= budget else 'OVER BUDGET'
+        print(f'{label:<12}{value:8.1f} ms   budget {budget:7.0f} ms   {status}')
+        if value > budget:
+            over.append(label)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'runs': samples, 'import_ms': import_ms, 'first_frame_ms': first_frame_ms}, f, indent=2)
+    sys.exit(1 if over else 0)
+
+
+if __name__ == '__main__':
+    main()